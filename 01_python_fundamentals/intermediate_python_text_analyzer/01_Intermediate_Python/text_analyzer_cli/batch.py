@@ -0,0 +1,120 @@
+import glob
+import hashlib
+import json
+import os
+import sys
+from collections import Counter
+
+from streaming_analyzer import analyze_files_stats
+
+CACHE_DIR = ".text_analyzer_cache"
+
+
+def expand_inputs(inputs, pattern="*.txt"):
+    """
+    Files, directories (searched recursively for `pattern`) and glob patterns
+    -> sorted list of unique file paths.
+    """
+    files = []
+    for item in inputs:
+        if os.path.isdir(item):
+            files.extend(glob.glob(os.path.join(item, "**", pattern), recursive=True))
+        elif os.path.isfile(item):
+            files.append(item)
+        else:
+            matches = glob.glob(item, recursive=True)
+            if not matches:
+                print(f"Error: No files match '{item}'.", file=sys.stderr)
+            files.extend(m for m in matches if os.path.isfile(m))
+    return sorted(set(files))
+
+
+def file_hash(path, block_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class ResultCache:
+    """
+    One JSON file per document content hash, holding its metrics and word counts.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _path(self, digest):
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get(self, digest):
+        try:
+            with open(self._path(digest), encoding="utf-8") as f:
+                entry = json.load(f)
+            return entry["metrics"], Counter(entry["words"])
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+
+    def put(self, digest, metrics, words):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = self._path(digest) + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"metrics": metrics, "words": words}, f, ensure_ascii=False)
+        os.replace(tmp, self._path(digest))
+
+
+def run_batch(files, workers=None, cache=None):
+    """
+    Analyzes `files`, skipping documents whose content hash is already cached.
+    Returns (one record per file, corpus-wide word Counter).
+    """
+    cache = cache or ResultCache()
+    digests = {path: file_hash(path) for path in files}
+    cached = {path: cache.get(d) for path, d in digests.items()}
+    # identical documents are analyzed once
+    misses = {}
+    for path, hit in cached.items():
+        if hit is None:
+            misses.setdefault(digests[path], path)
+
+    fresh = analyze_files_stats(list(misses.values()), workers)
+    computed = {}
+    for path, stats in fresh.items():
+        metrics = stats.result()
+        cache.put(digests[path], metrics, stats.words)
+        # round-trip through JSON so fresh and cached records look identical (tuples -> lists)
+        computed[digests[path]] = (json.loads(json.dumps(metrics)), stats.words)
+    for path, hit in cached.items():
+        if hit is None:
+            cached[path] = computed[digests[path]]
+
+    records = []
+    corpus = Counter()
+    for path in files:
+        metrics, words = cached[path]
+        records.append({"file": path, "sha256": digests[path], "cached": digests[path] not in misses, **metrics})
+        corpus.update(words)
+    return records, corpus
+
+
+def write_records(records, output_path):
+    """
+    JSON Lines by default; Parquet (needs pandas + pyarrow) for a .parquet path.
+    """
+    if output_path.endswith(".parquet"):
+        import pandas as pd
+        frame = pd.DataFrame(records)
+        frame["Most Common Words"] = frame["Most Common Words"].map(json.dumps)
+        frame.to_parquet(output_path, index=False)
+        return
+    with open(output_path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def write_corpus_table(corpus, output_path):
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("word,count\n")
+        for word, count in corpus.most_common():
+            f.write(f"{word},{count}\n")
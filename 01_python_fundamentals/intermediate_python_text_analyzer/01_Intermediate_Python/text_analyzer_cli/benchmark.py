@@ -0,0 +1,81 @@
+"""
+Memory and throughput of TextAnalyzer vs the mmap scanner (fast_scan.scan_file).
+
+    python benchmark.py                     # generates a 1 GB sample file
+    python benchmark.py --size-mb 100       # smaller sample
+    python benchmark.py --file corpus.txt   # use an existing file
+
+Each method runs in a fresh process and reports its peak RSS.
+"""
+import argparse
+import multiprocessing as mp
+import os
+import random
+import time
+
+try:
+    import resource
+except ImportError:  # Windows: peak memory is not reported
+    resource = None
+
+
+def make_sample(path, size_mb, seed=42):
+    rng = random.Random(seed)
+    vocab = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(1, 10)))
+             for _ in range(50_000)]
+    seps = [" "] * 6 + [", ", ". ", "! ", "? ", "\n"]
+    target = size_mb * 1024 ** 2
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < target:
+            piece = "".join(rng.choice(vocab) + rng.choice(seps) for _ in range(10_000))
+            f.write(piece)
+            written += len(piece)
+
+
+def _run(method, path, queue):
+    if method == "TextAnalyzer":
+        from analyzer import TextAnalyzer
+        from utils import load_text_file
+        run = lambda: TextAnalyzer(load_text_file(path))
+    else:
+        from fast_scan import scan_file
+        run = lambda: scan_file(path)
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is KB on Linux
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 if resource else float("nan")
+    queue.put((elapsed, peak_mb, result))
+
+
+def measure(method, path):
+    queue = mp.Queue()
+    proc = mp.Process(target=_run, args=(method, path, queue))
+    proc.start()
+    outcome = queue.get()
+    proc.join()
+    return outcome
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Text analyzer benchmark")
+    parser.add_argument("--file", help="existing text file to analyze")
+    parser.add_argument("--size-mb", type=int, default=1024, help="size of the generated sample")
+    args = parser.parse_args()
+
+    path = args.file or f"bench_sample_{args.size_mb}mb.txt"
+    if not args.file and not os.path.exists(path):
+        print(f"Generating {args.size_mb} MB sample at {path} ...")
+        make_sample(path, args.size_mb)
+    size_mb = os.path.getsize(path) / 1024 ** 2
+
+    results = {}
+    for method in ("fast_scan", "TextAnalyzer"):
+        elapsed, peak_mb, results[method] = measure(method, path)
+        print(f"{method:>12}: {elapsed:7.2f} s  {size_mb / elapsed:7.1f} MB/s  peak RSS {peak_mb:8.1f} MB")
+    print("Identical metrics:", results["fast_scan"] == results["TextAnalyzer"])
+
+
+if __name__ == "__main__":
+    main()
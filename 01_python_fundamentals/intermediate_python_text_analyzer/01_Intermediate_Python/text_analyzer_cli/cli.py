@@ -1,17 +1,70 @@
 import argparse
+import os
 from analyzer import TextAnalyzer
+from batch import ResultCache, expand_inputs, run_batch, write_corpus_table, write_records
+from fast_scan import scan_file
+from streaming_analyzer import analyze_files
 from utils import load_text_file
 
+def print_result(result):
+    for(key, value) in result.items():
+        print(f"{key}:{value}")
+
 def main():
     parser = argparse.ArgumentParser(description="Text Analyzer Tool")
-    parser.add_argument("file", help="Path to the text file to analyze")
-    file = parser.parse_args()
+    parser.add_argument("file", nargs="+", help="Path to the text file(s) to analyze (directories/globs with --batch)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Scan a memory-mapped file in one pass instead of loading it whole")
+    parser.add_argument("--workers", type=int,
+                        help="Analyze files (and shards of large files) on this many processes")
+    parser.add_argument("--batch", action="store_true",
+                        help="Batch mode: expand directories/globs, skip unchanged files via the result cache")
+    parser.add_argument("--pattern", default="*.txt", help="File pattern used inside directories (--batch)")
+    parser.add_argument("--output", help="Write per-file results here: .jsonl (default) or .parquet (--batch)")
+    parser.add_argument("--corpus-table", help="Write the merged corpus word frequencies to this CSV (--batch)")
+    parser.add_argument("--cache-dir", default=".text_analyzer_cache", help="Result cache location (--batch)")
+    args = parser.parse_args()
 
-    text = load_text_file(file.file)
-    analyzer = TextAnalyzer(text)
+    if args.batch:
+        run_batch_mode(parser, args)
+        return
 
-    for(key, value) in analyzer.items():
-        print(f"{key}:{value}")
+    if not (args.stream or args.workers or len(args.file) > 1):
+        text = load_text_file(args.file[0])
+        print_result(TextAnalyzer(text))
+        return
+
+    files = []
+    for path in args.file:
+        if os.path.isfile(path):
+            files.append(path)
+        else:
+            print(f"Error: The file '{path}' was not found.")
+
+    if args.workers or len(files) > 1:
+        results = analyze_files(files, workers=args.workers)
+    else:
+        results = {path: scan_file(path) for path in files}
+    for path, result in results.items():
+        if len(results) > 1:
+            print(f"\n== {path} ==")
+        print_result(result)
+
+def run_batch_mode(parser, args):
+    files = expand_inputs(args.file, args.pattern)
+    if not files:
+        parser.error(f"no files to analyze in {', '.join(args.file)} (pattern {args.pattern})")
+    records, corpus = run_batch(files, workers=args.workers, cache=ResultCache(args.cache_dir))
+    if args.output:
+        write_records(records, args.output)
+    else:
+        for record in records:
+            print(record)
+    if args.corpus_table:
+        write_corpus_table(corpus, args.corpus_table)
+    skipped = sum(r["cached"] for r in records)
+    print(f"Analyzed {len(records) - skipped} files, {skipped} unchanged (cached).")
+    print(f"Corpus: {sum(corpus.values())} words, {len(corpus)} unique. Top 5: {corpus.most_common(5)}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
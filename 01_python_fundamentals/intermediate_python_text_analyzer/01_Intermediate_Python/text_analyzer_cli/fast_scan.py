@@ -0,0 +1,45 @@
+import mmap
+import os
+
+from streaming_analyzer import TextStats
+
+BLOCK_BYTES = 4 << 20   # bytes decoded per block; small enough to stay cache/RAM friendly
+
+
+def _block_end(mm, start, size, block_bytes):
+    """
+    End of the block starting at `start`: just after the last space/newline
+    byte in the window, so UTF-8 sequences, words and CRLFs stay whole.
+    """
+    end = start + block_bytes
+    if end >= size:
+        return size
+    cut = max(mm.rfind(b" ", start, end), mm.rfind(b"\n", start, end))
+    if cut >= start:
+        return cut + 1
+    # no whitespace in the window (one huge token): extend to the next one
+    nxt = [i for i in (mm.find(b" ", end), mm.find(b"\n", end)) if i >= 0]
+    return min(nxt) + 1 if nxt else size
+
+
+def scan_file(file_path, block_bytes=BLOCK_BYTES):
+    """
+    Single pass over a memory-mapped file. Each block is decoded once and
+    scanned for words, sentences and characters; no file-sized copies, word
+    lists or sentence lists are built. Metrics match TextAnalyzer exactly.
+    """
+    size = os.path.getsize(file_path)
+    stats = TextStats()
+    if size == 0:
+        return stats.result()
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            end = _block_end(mm, start, size, block_bytes)
+            text = mm[start:end].decode("utf-8")
+            part = TextStats.from_text(text)
+            # text-mode reads turn "\r\n" into one "\n"; count characters the same way
+            part.chars -= text.count("\r\n")
+            stats.merge(part)
+            start = end
+    return stats.result()
@@ -0,0 +1,186 @@
+import io
+import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[4] / "shared"))
+from byte_range import open_byte_range
+
+WORD_RE = re.compile(r'\b\w+\b')
+SENTENCE_END_RE = re.compile(r'[.!?]')
+# one match per non-blank sentence: starts at its first visible character
+SENTENCE_RE = re.compile(r'[^.!?\s][^.!?]*')
+
+BLOCK_SIZE = 1 << 20          # characters read per block
+SHARD_SIZE = 64 * (1 << 20)   # bytes per process-pool shard for large files
+
+
+class TextStats:
+    """
+    Mergeable partial result for a piece of text. Two consecutive pieces can be
+    combined with merge(); a sentence split across the edge is counted once.
+    """
+
+    def __init__(self):
+        self.words = Counter()
+        self.chars = 0
+        self.spaces = 0
+        # sentence bookkeeping: segments between [.!?] delimiters
+        self.has_delim = False
+        self.head = False     # first segment has non-blank text
+        self.tail = False     # last segment has non-blank text
+        self.closed = 0       # non-blank segments strictly between delimiters
+
+    @classmethod
+    def from_text(cls, text):
+        stats = cls()
+        stats.words.update(WORD_RE.findall(text.lower()))
+        stats.chars = len(text)
+        stats.spaces = text.count(" ")
+        # count sentences without materialising the list of segments
+        nonblank = sum(1 for _ in SENTENCE_RE.finditer(text))
+        first = SENTENCE_END_RE.search(text)
+        if first is None:
+            stats.head = stats.tail = nonblank > 0
+            return stats
+        last = max(text.rfind("."), text.rfind("!"), text.rfind("?"))
+        stats.has_delim = True
+        stats.head = bool(text[:first.start()].strip())
+        stats.tail = bool(text[last + 1:].strip())
+        stats.closed = nonblank - stats.head - stats.tail
+        return stats
+
+    def merge(self, other):
+        """
+        Appends `other`, which must be the text directly after this one.
+        """
+        self.words.update(other.words)
+        self.chars += other.chars
+        self.spaces += other.spaces
+        if self.has_delim and other.has_delim:
+            self.closed += other.closed + (1 if self.tail or other.head else 0)
+            self.tail = other.tail
+        elif self.has_delim:
+            self.tail = self.tail or other.head
+        elif other.has_delim:
+            self.head = self.head or other.head
+            self.closed = other.closed
+            self.tail = other.tail
+        else:
+            self.head = self.tail = self.head or other.head
+        self.has_delim = self.has_delim or other.has_delim
+        return self
+
+    @property
+    def sentences(self):
+        if not self.has_delim:
+            return int(self.head)
+        return self.closed + int(self.head) + int(self.tail)
+
+    def result(self):
+        total_words = sum(self.words.values())
+        total_sentences = self.sentences
+        return {
+            "Total Words": total_words,
+            "Unique Words": len(self.words),
+            "Total Sentences": total_sentences,
+            "Average Sentence Length": total_words / total_sentences if total_sentences > 0 else 0,
+            "Most Common Words": self.words.most_common(5),
+            "Character Count": self.chars,
+            "Character Count (no spaces)": self.chars - self.spaces,
+        }
+
+
+def _last_space(text):
+    return max(text.rfind(" "), text.rfind("\n"), text.rfind("\t"))
+
+
+def analyze_stream(f, block_size=BLOCK_SIZE):
+    """
+    Reads a text stream in blocks. Blocks are cut just after whitespace so no
+    word (or lower-casing context) straddles two blocks.
+    """
+    stats = TextStats()
+    carry = ""
+    while True:
+        block = f.read(block_size)
+        if not block:
+            break
+        text = carry + block
+        cut = _last_space(text)
+        if cut < 0:
+            carry = text
+            continue
+        stats.merge(TextStats.from_text(text[:cut + 1]))
+        carry = text[cut + 1:]
+    if carry:
+        stats.merge(TextStats.from_text(carry))
+    return stats
+
+
+def _analyze_range(path, start, end, block_size):
+    with io.TextIOWrapper(open_byte_range(path, start, end), encoding="utf-8") as f:
+        return analyze_stream(f, block_size)
+
+
+def _shard_bounds(path, shard_size):
+    """
+    Byte ranges of about `shard_size`, each ending just after a space or newline
+    byte (safe in UTF-8, and never between the two bytes of a CRLF).
+    """
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        while bounds[-1] + shard_size < size:
+            f.seek(bounds[-1] + shard_size)
+            while True:
+                chunk = f.read(4096)
+                if not chunk:
+                    pos = size
+                    break
+                hits = [i for i in (chunk.find(b" "), chunk.find(b"\n")) if i >= 0]
+                if hits:
+                    pos = f.tell() - len(chunk) + min(hits) + 1
+                    break
+            if pos >= size:
+                break
+            bounds.append(pos)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def analyze_file(file_path, block_size=BLOCK_SIZE):
+    """
+    Streaming equivalent of TextAnalyzer(load_text_file(file_path)).
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        return analyze_stream(f, block_size).result()
+
+
+def analyze_files(file_paths, workers=None, shard_size=SHARD_SIZE, block_size=BLOCK_SIZE):
+    """
+    Analyzes many (and/or large) files on a process pool. Large files are split
+    into shards whose partial results are merged in order.
+    Returns {path: metrics}.
+    """
+    stats = analyze_files_stats(file_paths, workers, shard_size, block_size)
+    return {path: s.result() for path, s in stats.items()}
+
+
+def analyze_files_stats(file_paths, workers=None, shard_size=SHARD_SIZE, block_size=BLOCK_SIZE):
+    """
+    Like analyze_files() but returns the TextStats (with full word counts).
+    """
+    if not file_paths:
+        return {}
+    jobs = [(path, start, end) for path in file_paths for start, end in _shard_bounds(path, shard_size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_analyze_range, path, start, end, block_size) for path, start, end in jobs]
+        merged = {}
+        for (path, _, _), future in zip(jobs, futures):
+            part = future.result()
+            merged[path] = merged[path].merge(part) if path in merged else part
+    return {path: merged.get(path, TextStats()) for path in file_paths}
@@ -0,0 +1,67 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from batch import ResultCache, expand_inputs, run_batch
+
+CLI = Path(__file__).resolve().parent / "cli.py"
+
+
+def run_cli(*args, cwd):
+    # a subprocess: cli.py and utils.py share their module names with another project's
+    return subprocess.run([sys.executable, str(CLI), *map(str, args)], cwd=cwd, capture_output=True, text=True)
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    docs = tmp_path / "docs"
+    (docs / "nested").mkdir(parents=True)
+    (docs / "a.txt").write_text("Red fish. Blue fish!", encoding="utf-8")
+    (docs / "nested" / "b.txt").write_text("One fish, two fish.", encoding="utf-8")
+    (docs / "copy.txt").write_text("Red fish. Blue fish!", encoding="utf-8")   # same content as a.txt
+    (docs / "notes.md").write_text("Not matched by *.txt", encoding="utf-8")
+    return docs
+
+
+def test_expand_inputs(corpus):
+    files = expand_inputs([str(corpus), str(corpus / "a.txt"), str(corpus / "*.md")])
+    assert files == sorted(str(corpus / name) for name in ("a.txt", "copy.txt", "nested/b.txt", "notes.md"))
+
+
+def test_run_batch_caches_by_content(corpus, tmp_path):
+    files = expand_inputs([str(corpus)])
+    cache = ResultCache(tmp_path / "cache")
+    records, corpus_words = run_batch(files, workers=1, cache=cache)
+    assert [r["cached"] for r in records] == [False, False, False]
+    assert records[0]["Total Words"] == 4 and records[0]["Total Sentences"] == 2
+    assert records[0]["sha256"] == records[1]["sha256"]   # a.txt and copy.txt analyzed once
+    assert corpus_words["fish"] == 6
+
+    again, corpus_again = run_batch(files, workers=1, cache=cache)
+    assert [r["cached"] for r in again] == [True, True, True]
+    assert again == [dict(r, cached=True) for r in records]
+    assert corpus_again == corpus_words
+
+
+def test_batch_cli_writes_records_and_corpus_table(corpus, tmp_path):
+    out = run_cli("--batch", corpus, "--output", "results.jsonl", "--corpus-table", "corpus.csv",
+                  "--cache-dir", "cache", "--workers", "2", cwd=tmp_path)
+    assert out.returncode == 0, out.stderr
+    assert "Analyzed 3 files, 0 unchanged (cached)." in out.stdout
+    records = [json.loads(line) for line in (tmp_path / "results.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [Path(r["file"]).name for r in records] == ["a.txt", "copy.txt", "b.txt"]
+    assert (tmp_path / "corpus.csv").read_text(encoding="utf-8").splitlines()[:2] == ["word,count", "fish,6"]
+
+    out = run_cli("--batch", corpus, "--cache-dir", "cache", cwd=tmp_path)
+    assert "Analyzed 0 files, 3 unchanged (cached)." in out.stdout
+
+
+def test_batch_cli_fails_when_nothing_matches(tmp_path):
+    out = run_cli("--batch", tmp_path / "missing", "*.nothing", cwd=tmp_path)
+    assert out.returncode == 2
+    assert "No files match" in out.stderr
+    assert "no files to analyze" in out.stderr
+    assert out.stdout == ""
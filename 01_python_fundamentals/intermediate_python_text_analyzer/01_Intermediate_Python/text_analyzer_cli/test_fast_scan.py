@@ -0,0 +1,43 @@
+import pytest
+
+from analyzer import TextAnalyzer
+from fast_scan import scan_file
+from streaming_analyzer import analyze_file, analyze_files
+
+DOCUMENT = (
+    "Alpha beta. Gamma\r\ndelta!\r\n\r\nΟΔΟΣ ΣΟΦΟΣ? Line separated words... "
+    "naïve café " + "z" * 40 + " end\n"
+) * 25
+
+
+@pytest.fixture
+def document(tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_bytes(DOCUMENT.encode("utf-8"))
+    return path
+
+
+def expected(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return TextAnalyzer(f.read())
+
+
+@pytest.mark.parametrize("block_bytes", [1, 3, 17, 256, 4 << 20])
+def test_mmap_scan_matches_streaming(document, block_bytes):
+    result = scan_file(document, block_bytes=block_bytes)
+    assert result == analyze_file(document) == expected(document)
+
+
+@pytest.mark.parametrize("shard_size", [1, 7, 100, 1000, 64 << 20])
+def test_sharded_scan_matches_mmap_scan(document, tmp_path, shard_size):
+    other = tmp_path / "other.txt"
+    other.write_bytes("Second file. Short!".encode("utf-8"))
+    results = analyze_files([str(document), str(other)], workers=2, shard_size=shard_size)
+    assert results[str(document)] == scan_file(document)
+    assert results[str(other)] == scan_file(other) == expected(other)
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert scan_file(path) == analyze_files([str(path)])[str(path)] == TextAnalyzer("")
@@ -0,0 +1,63 @@
+import io
+
+import pytest
+
+from analyzer import TextAnalyzer
+from streaming_analyzer import TextStats, analyze_file, analyze_files, analyze_stream
+
+TEXTS = {
+    "plain": "The cat sat. The dog ran! Did it? Yes.\nNo end here",
+    "crlf": "First line. Second\r\nline here!\r\n\r\nThird ... line?\r\n trailing words",
+    "unicode-separators": "Line one\u2028line two. Para\u2029graph\x85next\x0bvt\x0cff. done\u2028",
+    "greek-final-sigma": "ΟΔΟΣ ΟΔΟΣ. Σοφός ΣΟΦΟΣ! ΑΣ",
+    "delimiters-only": "...!?  . ",
+    "no-delimiters": "just some words without an end",
+    "blank": "   \n\t ",
+    "long-token": "x" * 50 + " end." + "y" * 30,
+}
+
+
+def load_text_file(path):
+    # utils.load_text_file; not imported, another project's utils.py shares its name
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture(params=list(TEXTS), ids=list(TEXTS))
+def text_file(request, tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_bytes(TEXTS[request.param].encode("utf-8"))
+    return path
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 7, 64, 1 << 20])
+def test_stream_matches_text_analyzer(text_file, block_size):
+    expected = TextAnalyzer(load_text_file(text_file))
+    assert analyze_file(text_file, block_size=block_size) == expected
+
+
+def test_every_split_point_merges_to_the_same_result():
+    text = TEXTS["plain"] + " " + TEXTS["unicode-separators"]
+    expected = TextAnalyzer(text)
+    for cut in range(len(text) + 1):
+        merged = TextStats.from_text(text[:cut]).merge(TextStats.from_text(text[cut:]))
+        # splitting inside a word changes the words, never the sentences or characters
+        assert merged.sentences == expected["Total Sentences"], cut
+        assert merged.chars == expected["Character Count"]
+
+
+@pytest.mark.parametrize("shard_size", [1, 5, 16, 1 << 20])
+def test_sharded_files_match_text_analyzer(tmp_path, shard_size):
+    paths = []
+    for name, text in TEXTS.items():
+        path = tmp_path / f"{name}.txt"
+        path.write_bytes((text * 3).encode("utf-8"))
+        paths.append(str(path))
+    results = analyze_files(paths, workers=2, shard_size=shard_size, block_size=4)
+    for path in paths:
+        assert results[path] == TextAnalyzer(load_text_file(path)), path
+
+
+def test_analyze_stream_reads_any_text_stream():
+    text = TEXTS["crlf"].replace("\r\n", "\n")
+    assert analyze_stream(io.StringIO(text), block_size=5).result() == TextAnalyzer(text)
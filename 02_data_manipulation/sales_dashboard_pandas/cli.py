@@ -1,5 +1,9 @@
 import argparse
+import os
 from utils import load_data
+from engine import build_dashboard
+from state import SETTLE_SECONDS, DashboardState
+from streaming import stream_dashboard
 from dashboard import (
     total_sales,
     sales_by_product,
@@ -12,19 +16,66 @@ from dashboard import (
 def main():
     parser = argparse.ArgumentParser(description="Sales Dashboard CLI")
     parser.add_argument("file_path", help="path to the sales data CSV file")
-    file_path = parser.parse_args().file_path
+    parser.add_argument("--cache", action="store_true",
+                        help="reuse a columnar copy of the CSV across runs")
+    parser.add_argument("--compact", action="store_true",
+                        help="downcast numbers and store repeated strings as categories to save memory")
+    parser.add_argument("--state", help="persist aggregates here and only fold in rows added since the last run")
+    parser.add_argument("--offset", type=int, help="with --state: start reading the file at this byte offset")
+    parser.add_argument("--rebuild", action="store_true", help="with --state: discard the stored state first")
+    parser.add_argument("--verify", action="store_true", help="with --state: compare the state with a full recompute")
+    parser.add_argument("--chunksize", type=int,
+                        help="stream the file in chunks of this many rows (for files larger than RAM)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="with --chunksize: spread the file over this many processes")
+    args = parser.parse_args()
 
-    df = load_data(file_path)
+    if args.state:
+        run_incremental(args)
+        return
+    if args.chunksize:
+        if not os.path.isfile(args.file_path):
+            print(f"Error: The file {args.file_path} was not found.")
+            return
+        print_dashboard(stream_dashboard(args.file_path, args.chunksize, args.workers))
+        return
+
+    df = load_data(args.file_path, use_cache=args.cache, compact_dtypes=args.compact)
     if df is not None:
-        print("Total Sales:", total_sales(df))
-        print("Sales by Product:\n", sales_by_product(df))
-        print("Sales by Region:\n", sales_by_region(df))
-        print("Sales by Category:\n", sales_by_category(df))
-        print("Monthly Sales:\n", monthly_sales(df))
-        print("Top Selling Products:\n", top_selling_products(df))
-        print("Dashboard generated successfully.")
+        results = build_dashboard(df)
+        print_dashboard(results)
     else:
         print("Failed to load data. Please check the file path and try again.")
 
+def run_incremental(args):
+    if not os.path.isfile(args.file_path):
+        print(f"Error: The file {args.file_path} was not found.")
+        return
+    if args.rebuild and os.path.exists(args.state):
+        os.remove(args.state)
+    state = DashboardState.load(args.state)
+    new_rows = state.ingest(args.file_path, args.offset)
+    state.save(args.state)
+    print(f"Folded in {new_rows} new rows ({state.rows} rows in state).")
+    for source, pending in state.pending.items():
+        print(f"Pending: the last line of {source} ({pending} bytes) has no newline yet; "
+              f"it is folded in once the file has not changed for {SETTLE_SECONDS:g} s.")
+    print_dashboard(state.to_result())
+    if args.verify:
+        mismatched = state.verify()
+        if mismatched:
+            print("Verification FAILED for:", ", ".join(mismatched))
+        else:
+            print("Verification passed: state matches a full recompute.")
+
+def print_dashboard(results):
+    print("Total Sales:", total_sales(results))
+    print("Sales by Product:\n", sales_by_product(results))
+    print("Sales by Region:\n", sales_by_region(results))
+    print("Sales by Category:\n", sales_by_category(results))
+    print("Monthly Sales:\n", monthly_sales(results))
+    print("Top Selling Products:\n", top_selling_products(results))
+    print("Dashboard generated successfully.")
+
 if __name__ == "__main__":
     main()  
\ No newline at end of file
@@ -1,19 +1,34 @@
 import pandas as pd
 
+from engine import DashboardResult, build_dashboard, top_from_totals
+
+# Each function accepts either the raw DataFrame or a DashboardResult from
+# build_dashboard(); with a DataFrame only that one aggregation is computed.
+
+def _view(data, name):
+    if isinstance(data, DashboardResult):
+        return data[name]
+    return build_dashboard(data, [name])[name]
+
 def total_sales(df):
-    return df["Sales"].sum()
+    return _view(df, "total")
 
 def sales_by_product(df):
-    return df.groupby("Product.Name")["Sales"].sum().reset_index()
+    return _view(df, "product")
 
 def sales_by_region(df):
-    return df.groupby("Region")["Sales"].sum().reset_index()
+    return _view(df, "region")
 
 def sales_by_category(df):
-    return df.groupby("Sub.Category")["Sales"].sum().reset_index()
+    return _view(df, "category")
 
 def monthly_sales(df):
-    return df.groupby(df["Order.Date"].dt.to_period("M"))["Sales"].sum().reset_index()
+    return _view(df, "month")
 
 def top_selling_products(df, top_n = 5):
-    return df.groupby("Product.Name")["Sales"].sum().sort_values(ascending=False).head(top_n).reset_index()
\ No newline at end of file
+    if isinstance(df, DashboardResult):
+        if "top" in df and df.top_n == top_n:
+            return df["top"]
+        products = df["product"]
+        return top_from_totals(products["Product.Name"], products["Sales"].to_numpy(), top_n, "Product.Name")
+    return build_dashboard(df, ["top"], top_n=top_n)["top"]
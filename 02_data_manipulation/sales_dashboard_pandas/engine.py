@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+
+# aggregation name -> key column it groups by
+GROUP_KEYS = {
+    "product": "Product.Name",
+    "region": "Region",
+    "category": "Sub.Category",
+    "month": "Order.Date",
+}
+ALL_AGGREGATIONS = ("total", "product", "region", "category", "month", "top")
+
+
+class DashboardResult:
+    """
+    Aggregates computed by build_dashboard(), keyed by aggregation name.
+    """
+
+    def __init__(self, results, top_n):
+        self.results = results
+        self.top_n = top_n
+
+    def __getitem__(self, name):
+        return self.results[name]
+
+    def __contains__(self, name):
+        return name in self.results
+
+
+def _factorize(df, name):
+    """
+    Integer codes (-1 for missing keys) and sorted unique labels for one key.
+    """
+    col = df[GROUP_KEYS[name]]
+    if name == "month":
+        # month number since epoch; NaT becomes -1 like a missing key
+        months = col.to_numpy(dtype="datetime64[ns]").astype("datetime64[M]")
+        valid = ~np.isnat(months)
+        uniques, codes = np.unique(months[valid].astype(np.int64), return_inverse=True)
+        full = np.full(len(col), -1, dtype=np.intp)
+        full[valid] = codes
+        labels = pd.PeriodIndex(uniques.astype("datetime64[M]"), freq="M")
+        return full, labels
+    codes, uniques = pd.factorize(col, sort=True)
+    return codes, uniques
+
+
+def _grouped_sums(codes, n_groups, sales):
+    valid = codes >= 0
+    return np.bincount(codes[valid], weights=sales[valid], minlength=n_groups)
+
+
+def top_from_totals(labels, sums, top_n, key):
+    top_n = min(top_n, len(sums))
+    if top_n == 0:
+        return pd.DataFrame({key: labels[:0], "Sales": sums[:0]})
+    candidates = np.argpartition(-sums, top_n - 1)[:top_n]
+    # highest sales first, ties broken by key order
+    order = candidates[np.lexsort((candidates, -sums[candidates]))]
+    return pd.DataFrame({key: np.asarray(labels)[order], "Sales": sums[order]})
+
+
+def build_dashboard(df, aggregations=ALL_AGGREGATIONS, top_n=5):
+    """
+    Computes the requested dashboard aggregations in one shared pass:
+    each key column is factorized once and summed with np.bincount,
+    and the top-N products reuse the per-product totals.
+    """
+    aggregations = set(aggregations)
+    sales_col = df["Sales"]
+    sales = sales_col.fillna(0).to_numpy(dtype=float)
+    # integer Sales give integer sums, always as int64: a column compacted to
+    # a small type (e.g. int16) would wrap around when its sums are cast back
+    cast = np.int64 if pd.api.types.is_integer_dtype(sales_col.dtype) else None
+    results = {}
+
+    if "total" in aggregations:
+        results["total"] = sales_col.sum() if cast is None else np.int64(sales_col.sum())
+
+    needed = {name for name in GROUP_KEYS if name in aggregations}
+    if "top" in aggregations:
+        needed.add("product")
+    for name in needed:
+        codes, labels = _factorize(df, name)
+        sums = _grouped_sums(codes, len(labels), sales)
+        if cast is not None:
+            sums = sums.astype(cast)
+        key = GROUP_KEYS[name]
+        if name in aggregations:
+            results[name] = pd.DataFrame({key: labels, "Sales": sums})
+        if name == "product" and "top" in aggregations:
+            results["top"] = top_from_totals(labels, sums, top_n, key)
+
+    return DashboardResult(results, top_n)
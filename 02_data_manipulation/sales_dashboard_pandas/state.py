@@ -0,0 +1,205 @@
+"""
+Persisted, append-only aggregate state for the sales dashboard.
+
+The state keeps the per-product/region/sub-category/month Sales sums plus,
+for every ingested file, the byte offset already consumed. Re-running on a
+grown file (or on a new file) only parses the bytes after that offset.
+
+A last line without a trailing newline may still be being written, so it is
+only folded in once the file has not been modified for SETTLE_SECONDS;
+until then it is reported as pending.
+"""
+import io
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from engine import GROUP_KEYS, DashboardResult, build_dashboard, top_from_totals
+from utils import DATE_COLUMNS
+
+STATE_VERSION = 2   # 2: sums stored as [label, value] pairs, so labels keep their JSON type
+SETTLE_SECONDS = 2.0
+GROUPS = tuple(GROUP_KEYS)
+
+
+def _label_key(name, label):
+    if name == "month":
+        return str(label)
+    return label.item() if isinstance(label, np.generic) else label
+
+
+def _sort_key(label):
+    # numbers before strings, so a mix of both (e.g. numeric product codes) still sorts
+    return (isinstance(label, str), label)
+
+
+class DashboardState:
+    def __init__(self):
+        self.total = 0     # int while every folded Sales column was integer, like build_dashboard()
+        self.rows = 0
+        self.sums = {name: {} for name in GROUPS}
+        self.sources = {}  # abs path -> {"offset": bytes consumed, "header": [...]}
+        self.pending = {}  # abs path -> bytes of an unterminated last line left for later (this run only)
+
+    @classmethod
+    def load(cls, path):
+        state = cls()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != STATE_VERSION:
+                raise ValueError(f"Unsupported state version in {path}; rebuild it with --rebuild.")
+            state.total = data["total"]
+            state.rows = data["rows"]
+            state.sums = {name: {label: value for label, value in pairs} for name, pairs in data["sums"].items()}
+            state.sources = data["sources"]
+        return state
+
+    def save(self, path):
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            sums = {name: [[label, value] for label, value in labels.items()] for name, labels in self.sums.items()}
+            json.dump({"version": STATE_VERSION, "total": self.total, "rows": self.rows,
+                       "sums": sums, "sources": self.sources}, f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    def fold(self, df):
+        """
+        Adds the partial sums of `df` (new rows only) into the state.
+        """
+        partial = build_dashboard(df, ("total",) + GROUPS)
+        number = int if pd.api.types.is_integer_dtype(df["Sales"].dtype) else float
+        self.total += number(partial["total"])
+        self.rows += len(df)
+        for name in GROUPS:
+            frame = partial[name]
+            target = self.sums[name]
+            for label, value in zip(frame[GROUP_KEYS[name]], frame["Sales"]):
+                key = _label_key(name, label)
+                target[key] = target.get(key, 0) + number(value)
+
+    def ingest(self, file_path, offset=None):
+        """
+        Folds in whatever `file_path` gained since the last run, or everything
+        after byte `offset` when given. Returns the number of new rows.
+        """
+        source = os.path.abspath(file_path)
+        entry = self.sources.get(source, {"offset": 0, "header": None})
+        if offset is not None:
+            entry["offset"] = offset
+            if entry["header"] is None and offset > 0:
+                entry["header"] = read_header(file_path)
+        size = os.path.getsize(file_path)
+        if size < entry["offset"]:
+            raise ValueError(f"{file_path} shrank since it was ingested; rebuild the state with --rebuild.")
+
+        if entry.get("unterminated") and size > entry["offset"]:
+            # the last run folded a final line without a newline; it must not have been extended
+            with open(file_path, "rb") as f:
+                f.seek(entry["offset"])
+                if f.read(1) not in (b"\n", b"\r"):
+                    raise ValueError(f"The last line of {file_path} changed after it was ingested; "
+                                     "rebuild the state with --rebuild.")
+        settled = time.time() - os.path.getmtime(file_path) >= SETTLE_SECONDS
+        new_rows, end = read_new_rows(file_path, entry["offset"], entry["header"], include_partial=settled)
+        self.pending.pop(source, None)
+        if end < size:
+            self.pending[source] = size - end
+        if end > entry["offset"]:
+            entry["unterminated"] = settled and end == size and not _ends_with_newline(file_path, size)
+        if entry["header"] is None and new_rows is not None:
+            entry["header"] = new_rows.columns.tolist()
+        if new_rows is not None and len(new_rows):
+            self.fold(new_rows)
+        entry["offset"] = end
+        self.sources[source] = entry
+        return 0 if new_rows is None else len(new_rows)
+
+    def to_result(self, top_n=5):
+        results = {"total": self.total}
+        for name in GROUPS:
+            key = GROUP_KEYS[name]
+            labels = sorted(self.sums[name], key=_sort_key)
+            values = [self.sums[name][label] for label in labels]
+            integral = all(isinstance(v, int) for v in values) and not isinstance(self.total, float)
+            sums = np.array(values, dtype=np.int64 if integral else float)
+            if name == "month":
+                labels = pd.PeriodIndex(labels, freq="M")
+            results[name] = pd.DataFrame({key: labels, "Sales": sums})
+            if name == "product":
+                results["top"] = top_from_totals(results[name][key], sums, top_n, key)
+        return DashboardResult(results, top_n)
+
+    def verify(self, rtol=1e-9):
+        """
+        Recomputes everything from the full current contents of every source
+        and returns the names of aggregations that disagree with the state
+        (rows skipped with --offset or still pending count as disagreement).
+        """
+        frames = []
+        for path in self.sources:
+            if not os.path.exists(path):
+                raise ValueError(f"Cannot verify: {path} no longer exists.")
+            frame = read_rows(path, 0, os.path.getsize(path), None)
+            if frame is not None:
+                frames.append(frame)
+        if not frames:
+            return [] if self.rows == 0 else ["total"]
+        full = build_dashboard(pd.concat(frames, ignore_index=True))
+        stored = self.to_result()
+        mismatched = []
+        if not np.isclose(full["total"], stored["total"], rtol=rtol):
+            mismatched.append("total")
+        for name in GROUPS:
+            a, b = full[name], stored[name]
+            if (len(a) != len(b)
+                    or not (a.iloc[:, 0].astype(str).to_numpy() == b.iloc[:, 0].astype(str).to_numpy()).all()
+                    or not np.allclose(a["Sales"], b["Sales"], rtol=rtol)):
+                mismatched.append(name)
+        return mismatched
+
+
+def read_header(file_path):
+    return pd.read_csv(file_path, nrows=0).columns.tolist()
+
+
+def read_rows(file_path, start, end, header):
+    """
+    Parses the CSV bytes in [start, end). `header` is required when start > 0.
+    """
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return _parse(data, header if start else None)
+
+
+def _parse(data, header):
+    if not data.strip():
+        return None
+    if header is None:
+        return pd.read_csv(io.BytesIO(data), parse_dates=DATE_COLUMNS)
+    return pd.read_csv(io.BytesIO(data), header=None, names=header, parse_dates=DATE_COLUMNS)
+
+
+def _ends_with_newline(file_path, size):
+    with open(file_path, "rb") as f:
+        f.seek(size - 1)
+        return f.read(1) == b"\n"
+
+
+def read_new_rows(file_path, offset, header, include_partial=False):
+    """
+    New lines after `offset`. A trailing line without a newline is left for
+    the next run (the file may still be written), unless include_partial.
+    Returns (frame or None, new offset).
+    """
+    with open(file_path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    end = len(data) if include_partial else data.rfind(b"\n") + 1
+    if end == 0:
+        return None, offset
+    return _parse(data[:end], header if offset else None), offset + end
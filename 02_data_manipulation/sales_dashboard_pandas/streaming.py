@@ -0,0 +1,115 @@
+"""
+Out-of-core sales dashboard.
+
+The CSV is read in fixed-size chunks, each chunk is reduced to partial Sales
+sums per group, and the partials are merged. Memory depends on the chunk size
+and the number of distinct keys, not on the file size. With workers > 1 the
+file is split into newline-aligned byte ranges processed on a process pool.
+"""
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from engine import GROUP_KEYS, DashboardResult, build_dashboard, top_from_totals
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / "shared"))
+from byte_range import open_byte_range
+
+USED_COLUMNS = ["Sales", *GROUP_KEYS.values()]
+GROUPS = tuple(GROUP_KEYS)
+
+
+def _byte_ranges(path, parts):
+    """
+    Splits the data rows (after the header line) into `parts` ranges that
+    start and end on line boundaries. Assumes no newlines inside quoted fields.
+    """
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        f.readline()
+        data_start = f.tell()
+        bounds = [data_start]
+        for i in range(1, parts):
+            f.seek(max(data_start + (size - data_start) * i // parts, bounds[-1]))
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def empty_partial():
+    # "dtype" is the Sales dtype seen so far, so integer sales stay integers like in build_dashboard()
+    return {"total": 0, "rows": 0, "dtype": None, **{name: pd.Series(dtype=float) for name in GROUPS}}
+
+
+def reduce_chunk(chunk):
+    """
+    Partial sums of one chunk: the total plus one Series per group.
+    """
+    result = build_dashboard(chunk, ("total",) + GROUPS)
+    partial = {"total": result["total"], "rows": len(chunk), "dtype": chunk["Sales"].dtype}
+    for name in GROUPS:
+        frame = result[name]
+        partial[name] = pd.Series(frame["Sales"].to_numpy(), index=frame[GROUP_KEYS[name]])
+    return partial
+
+
+def merge_partials(a, b):
+    if not a["rows"]:
+        return b
+    if not b["rows"]:
+        return a
+    # an integer chunk merged with a float one is float, as when the whole file is read at once
+    merged = {"total": a["total"] + b["total"], "rows": a["rows"] + b["rows"],
+              "dtype": np.result_type(a["dtype"], b["dtype"])}
+    for name in GROUPS:
+        merged[name] = a[name].add(b[name], fill_value=0)
+    return merged
+
+
+def _reduce_range(path, start, end, header, chunksize):
+    partial = empty_partial()
+    with open_byte_range(path, start, end) as f:
+        reader = pd.read_csv(f, header=None, names=header, usecols=USED_COLUMNS,
+                             parse_dates=["Order.Date"], chunksize=chunksize)
+        for chunk in reader:
+            partial = merge_partials(partial, reduce_chunk(chunk))
+    return partial
+
+
+def stream_dashboard(file_path, chunksize=100_000, workers=1, top_n=5):
+    """
+    Same aggregates as build_dashboard(load_data(file_path)) in bounded memory.
+    """
+    header = pd.read_csv(file_path, nrows=0).columns.tolist()
+    ranges = _byte_ranges(file_path, max(workers, 1) * 4 if workers > 1 else 1)
+    partial = empty_partial()
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_reduce_range, file_path, a, b, header, chunksize) for a, b in ranges]
+            for future in futures:
+                partial = merge_partials(partial, future.result())
+    else:
+        for a, b in ranges:
+            partial = merge_partials(partial, _reduce_range(file_path, a, b, header, chunksize))
+    return to_result(partial, top_n)
+
+
+def to_result(partial, top_n=5):
+    dtype = partial["dtype"]
+    cast = np.int64 if dtype is not None and pd.api.types.is_integer_dtype(dtype) else None
+    results = {"total": partial["total"] if cast is None else cast(partial["total"])}
+    for name in GROUPS:
+        key = GROUP_KEYS[name]
+        series = partial[name].sort_index()
+        if cast is not None:
+            # alignment in merge_partials upcasts to float; the sums themselves are whole numbers
+            series = series.astype(cast)
+        results[name] = pd.DataFrame({key: series.index, "Sales": series.to_numpy()})
+        if name == "product":
+            results["top"] = top_from_totals(series.index, series.to_numpy(), top_n, key)
+    return DashboardResult(results, top_n)
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import state as state_module
+from engine import build_dashboard
+from state import DashboardState
+from utils import load_data
+
+
+@pytest.fixture
+def sales_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 500
+    df = pd.DataFrame({
+        "Order.Date": pd.date_range("2014-01-01", periods=n, freq="17h").strftime("%Y-%m-%d"),
+        "Ship.Date": pd.date_range("2014-01-03", periods=n, freq="17h").strftime("%Y-%m-%d"),
+        "Product.Name": rng.choice([f"Product {i}" for i in range(40)], n),
+        "Region": rng.choice(["East", "West", "Central", "South"], n),
+        "Sub.Category": rng.choice(["Chairs", "Phones", "Binders", "Tables"], n),
+        "Sales": rng.integers(1, 1000, n),
+    })
+    path = tmp_path / "sales.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_state_folds_unterminated_last_line_once_settled(sales_csv, tmp_path, monkeypatch):
+    sales_csv.write_bytes(sales_csv.read_bytes().rstrip(b"\n"))
+    expected = build_dashboard(load_data(sales_csv))["total"]
+
+    monkeypatch.setattr(state_module, "SETTLE_SECONDS", 3600)   # file still being written
+    state = DashboardState()
+    state.ingest(sales_csv)
+    assert state.rows == 499 and state.pending
+    assert state.verify() != []
+
+    monkeypatch.setattr(state_module, "SETTLE_SECONDS", 0)
+    state.ingest(sales_csv)
+    assert state.rows == 500 and not state.pending
+    assert state.total == expected
+    assert state.verify() == []
+
+
+def test_verify_rechecks_the_whole_file(sales_csv):
+    lines = sales_csv.read_bytes().splitlines(keepends=True)
+    state = DashboardState()
+    state.ingest(sales_csv, offset=sum(len(line) for line in lines[:101]))
+    assert state.rows == 400
+    assert "total" in state.verify()
+
+
+@pytest.mark.parametrize("as_float", [False, True], ids=["int-sales", "float-sales"])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_streamed_output_matches_in_memory(sales_csv, capsys, as_float, workers):
+    from cli import print_dashboard
+    from streaming import stream_dashboard
+
+    if as_float:
+        df = pd.read_csv(sales_csv)
+        df["Sales"] = df["Sales"] / 4
+        df.to_csv(sales_csv, index=False)
+    print_dashboard(build_dashboard(load_data(sales_csv)))
+    in_memory = capsys.readouterr().out
+    print_dashboard(stream_dashboard(sales_csv, chunksize=37, workers=workers))
+    assert capsys.readouterr().out == in_memory
+
+
+def test_compact_output_matches_full_width(sales_csv, capsys):
+    from cli import print_dashboard
+
+    # per-product sums far beyond int16, the type compact() picks for these values
+    df = pd.read_csv(sales_csv)
+    df["Sales"] = df["Sales"] * 30
+    df.to_csv(sales_csv, index=False)
+    print_dashboard(build_dashboard(load_data(sales_csv)))
+    full_width = capsys.readouterr().out
+    compacted = load_data(sales_csv, compact_dtypes=True)
+    assert compacted["Sales"].dtype == np.int16
+    capsys.readouterr()   # the compaction summary line
+    print_dashboard(build_dashboard(compacted))
+    assert capsys.readouterr().out == full_width
+
+
+@pytest.mark.parametrize("labels", ["names", "numeric-products"])
+@pytest.mark.parametrize("as_float", [False, True], ids=["int-sales", "float-sales"])
+def test_reloaded_state_prints_like_in_memory(sales_csv, tmp_path, capsys, as_float, labels):
+    from cli import print_dashboard
+
+    df = pd.read_csv(sales_csv)
+    if as_float:
+        df["Sales"] = df["Sales"] / 4
+    if labels == "numeric-products":
+        # JSON object keys would turn these into strings and mix them with fresh ints
+        df["Product.Name"] = df["Product.Name"].str.split().str[-1].astype(int) * 7
+    df.to_csv(sales_csv, index=False)
+    data = sales_csv.read_bytes()
+    first_part = data[:data.index(b"\n", len(data) // 2) + 1]
+
+    growing = tmp_path / "growing.csv"
+    growing.write_bytes(first_part)
+    state_path = tmp_path / "state.json"
+    state = DashboardState()
+    state.ingest(growing)
+    state.save(state_path)
+    growing.write_bytes(data)
+    state = DashboardState.load(state_path)
+    state.ingest(growing)
+    state.save(state_path)
+
+    print_dashboard(build_dashboard(load_data(sales_csv)))
+    in_memory = capsys.readouterr().out
+    print_dashboard(DashboardState.load(state_path).to_result())
+    assert capsys.readouterr().out == in_memory
@@ -1,8 +1,31 @@
+import sys
+from pathlib import Path
+
 import pandas as pd
 
-def load_data(file_path):
+sys.path.append(str(Path(__file__).resolve().parents[2] / "shared"))
+try:
+    import columnar_cache
+except ImportError:
+    columnar_cache = None
+try:
+    import compact
+except ImportError:
+    compact = None
+
+DATE_COLUMNS = ["Order.Date", "Ship.Date"]
+
+def load_data(file_path, use_cache=False, compact_dtypes=False):
     try:
-        df = pd.read_csv(file_path, parse_dates=["Order.Date", 'Ship.Date'])
+        read_options = {"parse_dates": DATE_COLUMNS}
+        if use_cache and columnar_cache is not None:
+            # dates are stored already parsed, so cache hits skip date parsing too
+            df = columnar_cache.read_csv(file_path, **read_options)
+        else:
+            df = pd.read_csv(file_path, **read_options)
+        if compact_dtypes and compact is not None:
+            df, report = compact.compact(df)
+            print(compact.summary_line(report))
         return df
     except FileNotFoundError:
         print(f"Error: The file {file_path} was not found.")
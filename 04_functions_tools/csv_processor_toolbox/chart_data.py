@@ -0,0 +1,83 @@
+"""
+Budgeted scatter data for csv_gui_app.py.
+
+Vega-Lite charts embed their data as JSON, so the browser payload grows with
+rows x columns. prepare_scatter() keeps only the two plotted columns and picks
+a strategy by row count and a byte budget:
+
+- raw:     every row fits in the budget;
+- sample:  a uniform random sample of as many rows as fit;
+- heatmap: 2-D histogram (count per x/y cell) - used above SAMPLE_ROW_LIMIT
+           rows, where individual points would be mostly overplotted anyway.
+"""
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_BUDGET_KB = 1024
+SAMPLE_ROW_LIMIT = 200_000   # above this, aggregate instead of sampling
+MAX_BINS = 200               # per axis
+BIN_BYTES = 110              # JSON size of one heatmap cell record (approx.)
+ESTIMATE_ROWS = 200          # rows serialised to estimate bytes per row
+
+ChartData = namedtuple("ChartData", ["frame", "strategy", "rows_in", "rows_out", "payload_bytes"])
+
+
+def json_bytes(frame):
+    return len(frame.to_json(orient="records").encode("utf-8"))
+
+
+def row_bytes(frame):
+    """Average JSON bytes per record, from a small head of the frame."""
+    head = frame.head(ESTIMATE_ROWS)
+    return json_bytes(head) / max(len(head), 1)
+
+
+def sample_rows(frame, k, seed=0):
+    """k rows uniformly without replacement, kept in original order."""
+    rng = np.random.default_rng(seed)
+    positions = np.sort(rng.choice(len(frame), size=k, replace=False))
+    return frame.take(positions)
+
+
+def heatmap_bins(frame, x, y, bins):
+    """
+    Non-empty cells of a bins x bins histogram of x against y, as records with
+    cell edges and a count.
+    """
+    counts, x_edges, y_edges = np.histogram2d(frame[x].to_numpy(dtype=float), frame[y].to_numpy(dtype=float),
+                                              bins=bins)
+    xi, yi = np.nonzero(counts)
+    return pd.DataFrame({
+        "x_start": x_edges[xi], "x_end": x_edges[xi + 1],
+        "y_start": y_edges[yi], "y_end": y_edges[yi + 1],
+        "count": counts[xi, yi].astype(int),
+    })
+
+
+def prepare_scatter(df, x, y, budget_bytes=DEFAULT_BUDGET_KB * 1024, sample_row_limit=SAMPLE_ROW_LIMIT):
+    """
+    Data for an x/y scatter that stays within `budget_bytes` of JSON.
+    Rows with a missing x or y are dropped (Vega-Lite skips them anyway).
+    """
+    frame = df[[x, y]].dropna()
+    n = len(frame)
+    per_row = row_bytes(frame) if n else 0
+    fit = int(budget_bytes // per_row) if per_row else n
+
+    if n <= fit or n <= sample_row_limit:
+        k = min(n, max(fit, 1))
+        data = frame if k == n else sample_rows(frame, k)
+        size = json_bytes(data)
+        # the per-row size is only an estimate; shrink until the real payload fits
+        while size > budget_bytes and k > 1:
+            k = max(min(k - 1, int(k * budget_bytes / size)), 1)
+            data = sample_rows(frame, k)
+            size = json_bytes(data)
+        strategy = "raw" if k == n else "sample"
+    else:
+        bins = int(min(MAX_BINS, max(np.sqrt(budget_bytes / BIN_BYTES), 2)))
+        strategy, data = "heatmap", heatmap_bins(frame, x, y, bins)
+        size = json_bytes(data)
+    return ChartData(data, strategy, n, len(data), size)
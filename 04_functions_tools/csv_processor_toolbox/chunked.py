@@ -0,0 +1,281 @@
+"""
+Streaming (out-of-core) helpers for csv_processor.py.
+
+Files are read in row chunks so peak memory is bounded by the chunk size,
+not by the file size.
+"""
+import numpy as np
+import pandas as pd
+
+SAMPLE_ROWS = 1000   # rows read to estimate bytes per row
+HIST_BINS = 4096     # bins used to locate exact quantiles
+QUANTILES = (0.25, 0.5, 0.75)
+
+
+def estimate_chunksize(file_path, memory_mb, usecols=None):
+    """
+    Rows per chunk so that one parsed chunk stays within `memory_mb`.
+    """
+    sample = pd.read_csv(file_path, nrows=SAMPLE_ROWS, usecols=usecols)
+    row_bytes = sample.memory_usage(deep=True, index=False).sum() / max(len(sample), 1)
+    return max(int(memory_mb * 1024 ** 2 / max(row_bytes, 1)), 1)
+
+
+def read_header(file_path):
+    return pd.read_csv(file_path, nrows=0).columns.tolist()
+
+
+def iter_chunks(file_path, chunksize, usecols=None):
+    return pd.read_csv(file_path, chunksize=chunksize, usecols=usecols)
+
+
+class ChunkWriter:
+    """
+    Appends DataFrame chunks to one CSV file, writing the header only once.
+    """
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.rows = 0
+        self._started = False
+
+    def write(self, df):
+        if df.empty and self._started:
+            return
+        df.to_csv(self.output_path, mode="a" if self._started else "w",
+                  header=not self._started, index=False)
+        self._started = True
+        self.rows += len(df)
+
+
+class ColumnStats:
+    """
+    Mergeable count/mean/M2/min/max for one numeric column (Chan et al.).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        values = values[~np.isnan(values)]
+        n = len(values)
+        if n == 0:
+            return
+        chunk_mean = values.mean()
+        chunk_m2 = ((values - chunk_mean) ** 2).sum()
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += chunk_m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+    @property
+    def std(self):
+        return np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+
+
+def _bin_index(values, lo, hi):
+    # halved so that hi - lo cannot overflow for extreme floats
+    scaled = (values / 2 - lo / 2) / (hi / 2 - lo / 2) * HIST_BINS
+    return np.clip(scaled.astype(np.int64), 0, HIST_BINS - 1)
+
+
+def _ordered_bits(values):
+    # float64 -> uint64 with the same order, so bins can split the bit patterns evenly
+    bits = np.asarray(values, dtype=np.float64).view(np.uint64)
+    negative = bits >> np.uint64(63) == 1
+    return np.where(negative, ~bits, bits | np.uint64(1 << 63))
+
+
+def _bit_bin_index(values, lo, hi):
+    # equal-width bins over the bit patterns: every pass shrinks a window's
+    # 2**64 patterns by HIST_BINS, however the values are spread (e.g. 1e-300 .. 1e300)
+    start = _ordered_bits(lo)
+    width = (_ordered_bits(hi) - start) // np.uint64(HIST_BINS) + np.uint64(1)
+    return ((_ordered_bits(values) - start) // width).astype(np.int64)
+
+
+def _numeric_values(chunk, col):
+    values = chunk[col].to_numpy(dtype=float)
+    return values[~np.isnan(values)]
+
+
+def _quantile_ranks(count):
+    # describe()'s linear interpolation needs the values at floor(h) and ceil(h)
+    ranks = set()
+    for q in QUANTILES:
+        h = (count - 1) * q
+        ranks.update((int(np.floor(h)), int(np.ceil(h))))
+    return ranks
+
+
+def _exact_quantiles(file_path, chunksize, stats, max_kept=None):
+    """
+    Exact quantiles with bounded memory. Each wanted rank is searched for in
+    a value window, starting at the column's [min, max]; every pass over the
+    file either
+    - keeps the window's values, once at most `max_kept` (default: chunksize)
+      fall in it, and picks the rank from them, or
+    - histograms the window into HIST_BINS bins with each bin's min and max,
+      and narrows the window to the bin holding the rank. A bin whose min
+      equals its max answers the rank without storing anything, so columns
+      of flags or repeated values need no kept values at all.
+    The first pass bins by value, which usually isolates small windows at
+    once; later passes bin by bit pattern, which bounds the number of passes
+    (64 bits / 12 bits per pass) for any distribution, outliers included.
+    Uses the same linear interpolation as DataFrame.describe().
+    """
+    max_kept = max_kept or chunksize
+    cols = [c for c, s in stats.items() if s.count > 0 and s.min < s.max]
+    result = {c: [s.min] * len(QUANTILES) for c, s in stats.items() if s.count > 0}
+    # (column, lo, hi) -> {"size": values in [lo, hi], "ranks": {rank: rank within the window}}
+    windows = {(c, stats[c].min, stats[c].max): {"size": stats[c].count, "by_value": True,
+                                                  "ranks": {r: r for r in _quantile_ranks(stats[c].count)}}
+               for c in cols}
+    values_at = {c: {} for c in cols}
+
+    while windows:
+        work = {}
+        for (c, lo, hi), window in windows.items():
+            if window["size"] <= max_kept:
+                work[c, lo, hi] = []
+            else:
+                work[c, lo, hi] = (_bin_index if window["by_value"] else _bit_bin_index,
+                                   np.zeros(HIST_BINS, dtype=np.int64),
+                                   np.full(HIST_BINS, np.inf), np.full(HIST_BINS, -np.inf))
+        for chunk in iter_chunks(file_path, chunksize, usecols=sorted({c for c, _, _ in windows})):
+            columns = {c: _numeric_values(chunk, c) for c, _, _ in windows}
+            for (c, lo, hi), acc in work.items():
+                values = columns[c]
+                values = values[(values >= lo) & (values <= hi)]
+                if isinstance(acc, list):
+                    acc.append(values)
+                    continue
+                bin_index, counts, mins, maxs = acc
+                idx = bin_index(values, lo, hi)
+                counts += np.bincount(idx, minlength=HIST_BINS)
+                np.minimum.at(mins, idx, values)
+                np.maximum.at(maxs, idx, values)
+
+        narrowed = {}
+        for (c, lo, hi), acc in work.items():
+            ranks = windows[c, lo, hi]["ranks"]
+            if isinstance(acc, list):
+                kept = np.sort(np.concatenate(acc))
+                values_at[c].update({r: kept[pos] for r, pos in ranks.items()})
+                continue
+            _, counts, mins, maxs = acc
+            cum = np.cumsum(counts)
+            for r, pos in ranks.items():
+                b = int(np.searchsorted(cum, pos, side="right"))
+                before = int(cum[b - 1]) if b > 0 else 0
+                if mins[b] == maxs[b]:
+                    values_at[c][r] = mins[b]
+                else:
+                    window = narrowed.setdefault((c, mins[b], maxs[b]),
+                                                 {"size": int(counts[b]), "by_value": False, "ranks": {}})
+                    window["ranks"][r] = pos - before
+        windows = narrowed
+
+    for c in cols:
+        row = []
+        for q in QUANTILES:
+            h = (stats[c].count - 1) * q
+            lo, hi = int(np.floor(h)), int(np.ceil(h))
+            row.append(values_at[c][lo] + (values_at[c][hi] - values_at[c][lo]) * (h - lo))
+        result[c] = row
+    return result
+
+
+def summarize_chunked(file_path, chunksize):
+    """
+    Returns (info, describe) frames equivalent to df.info() / df.describe()
+    without loading the whole file.
+    """
+    rows = 0
+    non_null = None
+    dtypes = {}
+    numeric = None
+    stats = {}
+    for chunk in iter_chunks(file_path, chunksize):
+        rows += len(chunk)
+        counts = chunk.notna().sum()
+        non_null = counts if non_null is None else non_null + counts
+        for col, dtype in chunk.dtypes.items():
+            dtypes[col] = dtype if col not in dtypes else _merge_dtype(dtypes[col], dtype)
+        chunk_numeric = set(chunk.select_dtypes(include="number").columns)
+        numeric = chunk_numeric if numeric is None else numeric & chunk_numeric
+        for col in chunk_numeric:
+            stats.setdefault(col, ColumnStats()).update(chunk[col].to_numpy(dtype=float))
+
+    info = pd.DataFrame({
+        "Non-Null Count": non_null if non_null is not None else pd.Series(dtype=int),
+        "Dtype": pd.Series({c: str(t) for c, t in dtypes.items()}, dtype=object),
+    })
+    info.attrs["rows"] = rows
+
+    numeric_cols = [c for c in dtypes if c in (numeric or set())]
+    stats = {c: stats[c] for c in numeric_cols}
+    quantiles = _exact_quantiles(file_path, chunksize, stats)
+    describe = pd.DataFrame(
+        {
+            c: [s.count, s.mean if s.count else np.nan, s.std,
+                s.min if s.count else np.nan,
+                *quantiles.get(c, [np.nan] * len(QUANTILES)),
+                s.max if s.count else np.nan]
+            for c, s in stats.items()
+        },
+        index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"],
+        dtype=float,
+    )
+    return info, describe
+
+
+def _merge_dtype(a, b):
+    if a == b:
+        return a
+    if pd.api.types.is_numeric_dtype(a) and pd.api.types.is_numeric_dtype(b):
+        return np.result_type(a, b)
+    return np.dtype(object)
+
+
+def filter_chunked(file_path, column, value, chunksize, output_path=None, preview_rows=5):
+    """
+    Filters chunk by chunk; matching rows are appended to `output_path` as they
+    are found. Returns (matched row count, preview frame).
+    """
+    writer = ChunkWriter(output_path) if output_path else None
+    matched = 0
+    preview = []
+    for chunk in iter_chunks(file_path, chunksize):
+        part = chunk[chunk[column] == value]
+        matched += len(part)
+        if sum(len(p) for p in preview) < preview_rows:
+            preview.append(part.head(preview_rows))
+        if writer:
+            writer.write(part)
+    head = pd.concat(preview).head(preview_rows) if preview else pd.DataFrame()
+    return matched, head
+
+
+def select_chunked(file_path, columns, chunksize, output_path=None, preview_rows=5):
+    """
+    Reads only `columns` (usecols). Without an output path it stops after the
+    first chunk, since only the preview is needed.
+    """
+    writer = ChunkWriter(output_path) if output_path else None
+    preview = None
+    for chunk in iter_chunks(file_path, chunksize, usecols=columns):
+        chunk = chunk[columns]
+        if preview is None:
+            preview = chunk.head(preview_rows)
+        if writer is None:
+            break
+        writer.write(chunk)
+    return preview if preview is not None else pd.DataFrame(columns=columns)
@@ -1,50 +1,68 @@
-import pandas as pd
+import sys
+from pathlib import Path
+
 import streamlit as st
 import altair as alt
 
+from chart_data import DEFAULT_BUDGET_KB, prepare_scatter
+from export import ExportCache, available_formats
+from indexed_dataset import IndexedDataset, upload_signature
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / "shared"))
+import compact
+
+# chart payloads are bounded by chart_data's byte budget instead of Altair's row limit
+alt.data_transformers.disable_max_rows()
+
 st.set_page_config(page_title="📊 Enhanced CSV Processor", layout="wide")
 
 st.title("📊 Enhanced CSV Processor with Charts & Merge")
 
 # -- Upload one or more CSVs
 uploaded_files = st.file_uploader("📁 Upload CSV file(s)", type=["csv", "xlsx"], accept_multiple_files=True)
+compact_dtypes = st.checkbox("🗜️ Compact dtypes (smaller integer/float types, repeated strings as categories)")
 
 if uploaded_files:
-    dfs = []
-    for file in uploaded_files:
-        if file.name.endswith('.xlsx'):
-            df = pd.read_excel(file)
-        else:
-            df = pd.read_csv(file)
-        dfs.append(df)
+    # Parse once per set of uploads; reruns (slider moves etc.) reuse the session's dataset
+    signature = (upload_signature(uploaded_files), compact_dtypes)
+    if st.session_state.get("dataset_signature") != signature:
+        st.session_state["dataset"] = IndexedDataset.from_uploads(uploaded_files, compact_dtypes)
+        st.session_state["exports"] = ExportCache()
+        st.session_state["dataset_signature"] = signature
+    dataset = st.session_state["dataset"]
+    exports = st.session_state["exports"]
+    df = dataset.df
 
     # Merge files if more than one
-    if len(dfs) > 1:
-        st.success(f"✅ {len(dfs)} files uploaded. Automatically merged.")
-        df = pd.concat(dfs, ignore_index=True)
+    if len(uploaded_files) > 1:
+        st.success(f"✅ {len(uploaded_files)} files uploaded. Automatically merged.")
     else:
-        df = dfs[0]
         st.success("✅ 1 file uploaded.")
+    if dataset.compaction is not None:
+        st.caption(compact.summary_line(dataset.compaction))
+        with st.expander("Memory per column"):
+            st.dataframe(dataset.compaction.astype({"before": str, "after": str}))
 
     st.subheader("📌 Data Preview")
     st.dataframe(df.head())
 
     # Summary stats
     if st.checkbox("📈 Show Summary Statistics"):
-        st.write(df.describe(include='all'))
+        st.write(dataset.summary())
 
-    # Filter by column
+    # Filter by column (answered from sorted column indexes, memoized per predicate)
     st.subheader("🔍 Filter Rows")
     col_to_filter = st.selectbox("Select a column to filter", df.columns)
-    if pd.api.types.is_numeric_dtype(df[col_to_filter]):
-        min_val = float(df[col_to_filter].min())
-        max_val = float(df[col_to_filter].max())
+    if dataset.is_numeric(col_to_filter):
+        min_val, max_val = dataset.value_range(col_to_filter)
         user_range = st.slider(f"Select {col_to_filter} range", min_val, max_val, (min_val, max_val))
-        filtered_df = df[(df[col_to_filter] >= user_range[0]) & (df[col_to_filter] <= user_range[1])]
+        predicate = dataset.predicate(col_to_filter, lo=user_range[0], hi=user_range[1])
+        filtered_df = dataset.filter(col_to_filter, lo=user_range[0], hi=user_range[1])
     else:
-        unique_vals = df[col_to_filter].dropna().unique().tolist()
+        unique_vals = dataset.unique_values(col_to_filter)
         selected_val = st.selectbox(f"Select a value from '{col_to_filter}'", unique_vals)
-        filtered_df = df[df[col_to_filter] == selected_val]
+        predicate = dataset.predicate(col_to_filter, value=selected_val)
+        filtered_df = dataset.filter(col_to_filter, value=selected_val)
 
     st.write(f"🧾 Filtered Data ({len(filtered_df)} rows):")
     st.dataframe(filtered_df.head())
@@ -60,18 +78,39 @@ if uploaded_files:
     if len(num_cols) >= 2:
         x_axis = st.selectbox("X-axis", num_cols)
         y_axis = st.selectbox("Y-axis", [col for col in num_cols if col != x_axis])
-        chart = alt.Chart(filtered_df).mark_circle(size=60).encode(
-            x=x_axis, y=y_axis, tooltip=list(filtered_df.columns)
-        ).interactive()
+        budget_kb = st.number_input("Chart payload budget (KB)", min_value=64, value=DEFAULT_BUDGET_KB, step=256)
+        chart_data = dataset.memoized(("chart",) + predicate + (x_axis, y_axis, budget_kb),
+                                      lambda: prepare_scatter(filtered_df, x_axis, y_axis, budget_kb * 1024))
+        if chart_data.strategy == "heatmap":
+            chart = alt.Chart(chart_data.frame).mark_rect().encode(
+                x=alt.X("x_start:Q", bin="binned", title=x_axis), x2="x_end:Q",
+                y=alt.Y("y_start:Q", bin="binned", title=y_axis), y2="y_end:Q",
+                color=alt.Color("count:Q", title="rows"),
+                tooltip=["x_start", "x_end", "y_start", "y_end", "count"]
+            ).interactive()
+        else:
+            chart = alt.Chart(chart_data.frame).mark_circle(size=60).encode(
+                x=x_axis, y=y_axis, tooltip=[x_axis, y_axis]
+            ).interactive()
         st.altair_chart(chart, use_container_width=True)
+        st.caption(f"Strategy: {chart_data.strategy} - {chart_data.rows_out:,} of {chart_data.rows_in:,} "
+                   f"{'cells' if chart_data.strategy == 'heatmap' else 'rows'} plotted, "
+                   f"{chart_data.payload_bytes / 1024:,.0f} KB payload")
     else:
         st.info("📌 Need at least two numeric columns for visualization.")
 
-    # Download
+    # Download: written in chunks only when asked for, then reused for the same filter/columns/format
     st.subheader("💾 Download Filtered Output")
-    download_data = filtered_df[selected_cols]
-    csv = download_data.to_csv(index=False).encode('utf-8')
-    st.download_button("📥 Download CSV", data=csv, file_name="filtered_output.csv", mime='text/csv')
+    export_format = st.selectbox("Format", available_formats())
+    export_key = predicate + (tuple(selected_cols), export_format)
+    export = exports.get(export_key)
+    if export is None and st.button("⚙️ Prepare download"):
+        with st.spinner("Writing file..."):
+            export = exports.build(export_key, filtered_df[selected_cols], export_format)
+    if export is not None:
+        with open(export.path, "rb") as f:
+            st.download_button(f"📥 Download {export_format} ({export.size / 1024 ** 2:,.1f} MB)", data=f,
+                               file_name=export.file_name, mime=export.mime)
 
 else:
     st.info("👈 Upload one or more CSV/Excel files to get started!")
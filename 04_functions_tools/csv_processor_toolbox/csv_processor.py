@@ -1,9 +1,23 @@
 import argparse
 import pandas as pd
 import os
+import sys
 from pathlib import Path
 import logging
 
+import chunked
+import parallel_merge
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / "shared"))
+try:
+    import columnar_cache
+except ImportError:
+    columnar_cache = None
+try:
+    import compact
+except ImportError:
+    compact = None
+
 logging.basicConfig(
     filename="processor.log",
     level=logging.INFO,
@@ -11,18 +25,53 @@ logging.basicConfig(
 )
 
 
+# Set by --cache: serve repeated loads from the shared columnar cache
+USE_CACHE = False
+# Set by --compact: shrink dtypes of loaded frames (shared/compact.py)
+COMPACT = False
 
-
-def summarize_csv(file_path):
+def read_csv(file_path):
+    if USE_CACHE and columnar_cache is not None:
+        df = columnar_cache.read_csv(file_path)
+    else:
+        df = pd.read_csv(file_path)
+    return compact_frame(df, file_path)
+
+def compact_frame(df, label):
+    if not COMPACT or compact is None:
+        return df
+    df, report = compact.compact(df)
+    print(compact.summary_line(report) + f"  [{label}]")
+    logging.info(f"Compacted {label}:\n{compact.format_report(report)}")
+    return df
+
+def summarize_csv(file_path, chunksize=None):
     print(f"\n📄 Summary for: {file_path}")
-    df = pd.read_csv(file_path)
-    print(df.info())
+    if chunksize:
+        info, stats = chunked.summarize_chunked(file_path, chunksize)
+        print(f"{info.attrs['rows']} rows, {len(info)} columns")
+        print(info)
+    else:
+        df = read_csv(file_path)
+        print(df.info())
+        stats = df.describe()
     print("\n🔢 Basic Stats:")
-    print(df.describe())
+    print(stats)
     logging.info(f"Summarized {file_path}")
 
-def filter_csv(file_path, column, value):
-    df = pd.read_csv(file_path)
+def filter_csv(file_path, column, value, chunksize=None, output_path=None):
+    if chunksize:
+        if column not in chunked.read_header(file_path):
+            print(f"❌ Column '{column}' not found.")
+            return
+        matched, preview = chunked.filter_chunked(file_path, column, value, chunksize, output_path)
+        print(f"\n✅ Rows where {column} == {value}: {matched}")
+        print(preview)
+        if output_path:
+            print(f"\n💾 Output saved to: {output_path}")
+        logging.info(f"Filtered {file_path} on column {column} == {value} in chunks of {chunksize}")
+        return
+    df = read_csv(file_path)
     if column not in df.columns:
         print(f"❌ Column '{column}' not found.")
         return
@@ -30,18 +79,44 @@ def filter_csv(file_path, column, value):
     print(f"\n✅ Rows where {column} == {value}: {len(filtered)}")
     print(filtered.head())
     logging.info(f"Filtered {file_path} on column {column} == {value}")
+    if output_path:
+        save_output(filtered, output_path)
 
 def merge_csv(files):
-    dfs = [pd.read_csv(f) for f in files]
+    dfs = [read_csv(f) for f in files]
     merged = pd.concat(dfs, ignore_index=True)
+    # categories that differ between files come out of concat as plain strings again
+    merged = compact_frame(merged, "merged")
     print("\n✅ Merged DataFrame Preview:")
     print(merged.head())
+    logging.info(f"Merged {len(files)} files")
     return merged
-    logging.info(f"Filtered {file_path} on column {column} == {value}")
 
-def select_columns(file_path, columns):
-    df = pd.read_csv(file_path)
+def merge_csv_parallel(files, output_path=None, workers=4, use_processes=False):
+    total, preview, report = parallel_merge.merge_parallel(files, output_path, workers, use_processes)
+    print(f"\n✅ Merged {len(files)} files, {total} rows. Preview:")
+    print(preview)
+    print("\n⚡ Read throughput per file:")
+    print(report.to_string(index=False))
+    if output_path:
+        print(f"\n💾 Output saved to: {output_path}")
+    logging.info(f"Merged {len(files)} files ({total} rows) with {workers} workers")
+
+def select_columns(file_path, columns, chunksize=None, output_path=None):
     cols = columns.split(',')
+    if chunksize:
+        available = chunked.read_header(file_path)
+        if not set(cols).issubset(available):
+            print("❌ One or more columns not found.")
+            print(f"Available columns: {available}")
+            return
+        print("\n✅ Selected Columns:")
+        print(chunked.select_chunked(file_path, cols, chunksize, output_path))
+        if output_path:
+            print(f"\n💾 Output saved to: {output_path}")
+        logging.info(f"Selected columns {cols} from {file_path} in chunks of {chunksize}")
+        return
+    df = read_csv(file_path)
     if not set(cols).issubset(df.columns):
         print("❌ One or more columns not found.")
         print(f"Available columns: {df.columns.tolist()}")
@@ -49,6 +124,8 @@ def select_columns(file_path, columns):
     print("\n✅ Selected Columns:")
     print(df[cols].head())
     logging.info(f"Selected columns {cols} from {file_path}")
+    if output_path:
+        save_output(df[cols], output_path)
 
 def save_output(df, output_path):
     df.to_csv(output_path, index=False)
@@ -63,25 +140,50 @@ def main():
     parser.add_argument('--merge', nargs='+', help='Merge multiple CSV files')
     parser.add_argument('--select', nargs=2, metavar=('file', 'columns'),
                         help='Select specific columns (comma-separated)')
-    parser.add_argument('--save', type=str, help='Output file path for saving result (used with --merge)')
+    parser.add_argument('--save', type=str,
+                        help='Output file path for saving result (used with --merge, --filter, --select)')
+    parser.add_argument('--workers', type=int,
+                        help='Merge with this many parallel readers, streaming shards to --save in order')
+    parser.add_argument('--processes', action='store_true',
+                        help='Use a process pool instead of threads for --workers')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse a columnar (Feather) copy of each CSV across runs')
+    parser.add_argument('--compact', action='store_true',
+                        help='Downcast numbers and store repeated strings as categories (report in processor.log)')
+    parser.add_argument('--chunksize', type=int,
+                        help='Stream the file in chunks of this many rows instead of loading it whole')
+    parser.add_argument('--memory-mb', type=float,
+                        help='Stream the file, sizing chunks to stay within this many MB')
 
     args = parser.parse_args()
+    global USE_CACHE, COMPACT
+    USE_CACHE = args.cache
+    COMPACT = args.compact
+
+    def resolve_chunksize(file_path, usecols=None):
+        if args.chunksize:
+            return args.chunksize
+        if args.memory_mb:
+            return chunked.estimate_chunksize(file_path, args.memory_mb, usecols)
+        return None
 
     if args.summarize:
         if os.path.isfile(args.summarize):
-            summarize_csv(args.summarize)
+            summarize_csv(args.summarize, resolve_chunksize(args.summarize))
         else:
             print("❌ File not found.")
 
     elif args.filter:
         file, column, value = args.filter
         if os.path.isfile(file):
-            filter_csv(file, column, value)
+            filter_csv(file, column, value, resolve_chunksize(file), args.save)
         else:
             print("❌ File not found.")
 
     elif args.merge:
-        if all(Path(f).is_file() for f in args.merge):
+        if all(Path(f).is_file() for f in args.merge) and args.workers:
+            merge_csv_parallel(args.merge, args.save, args.workers, args.processes)
+        elif all(Path(f).is_file() for f in args.merge):
             result = merge_csv(args.merge)
             if args.save:
                 save_output(result, args.save)
@@ -91,7 +193,7 @@ def main():
     elif args.select:
         file, columns = args.select
         if os.path.isfile(file):
-            select_columns(file, columns)
+            select_columns(file, columns, resolve_chunksize(file), args.save)
         else:
             print("❌ File not found.")
     else:
@@ -0,0 +1,144 @@
+"""
+On-demand, chunked export of filtered data for csv_gui_app.py.
+
+Nothing is serialised until the user asks for a download. The file is then
+written to a temporary directory CHUNK_ROWS rows at a time (so no full-size
+CSV string is ever built), and kept for reuse: the same filter, column
+selection and format on a later rerun is served from disk. Kept files are
+evicted least recently used once they exceed the byte budget.
+
+CSV (zstd) needs `zstandard` and Parquet needs `pyarrow`; formats whose
+library is missing are simply not offered.
+"""
+import gzip
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import weakref
+from collections import OrderedDict, namedtuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+CHUNK_ROWS = 100_000
+EXPORT_CACHE_MB = 1024
+
+# label -> (file extension, MIME type)
+FORMATS = {
+    "CSV": (".csv", "text/csv"),
+    "CSV (gzip)": (".csv.gz", "application/gzip"),
+    "CSV (zstd)": (".csv.zst", "application/zstd"),
+    "Parquet": (".parquet", "application/vnd.apache.parquet"),
+}
+
+Export = namedtuple("Export", ["path", "file_name", "mime", "size"])
+
+
+def available_formats():
+    formats = ["CSV", "CSV (gzip)"]
+    if zstandard is not None:
+        formats.append("CSV (zstd)")
+    if pq is not None:
+        formats.append("Parquet")
+    return formats
+
+
+def _chunks(frame, chunk_rows):
+    for start in range(0, len(frame), chunk_rows):
+        yield frame.iloc[start:start + chunk_rows]
+
+
+def _write_csv(frame, raw, chunk_rows):
+    with io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
+        frame.head(0).to_csv(f, index=False)
+        for chunk in _chunks(frame, chunk_rows):
+            chunk.to_csv(f, header=False, index=False)
+
+
+def _arrow_type(values):
+    return pa.Table.from_pandas(values.to_frame(), preserve_index=False).schema.field(0).type
+
+
+def _parquet_schema(frame, chunk_rows):
+    """
+    Schema inferred from the first chunk's values (an empty frame would type
+    every object column as null); columns that are all missing in that chunk
+    are typed from their first non-missing values.
+    """
+    schema = pa.Table.from_pandas(frame.iloc[:chunk_rows], preserve_index=False).schema
+    for i, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            values = frame.iloc[:, i].dropna()
+            if len(values):
+                schema = schema.set(i, field.with_type(_arrow_type(values.iloc[:chunk_rows])))
+    return schema
+
+
+def write_export(frame, path, fmt, chunk_rows=CHUNK_ROWS):
+    """
+    Writes `frame` to `path` in `fmt` (a FORMATS label), one chunk at a time.
+    """
+    if fmt == "Parquet":
+        schema = _parquet_schema(frame, chunk_rows)
+        with pq.ParquetWriter(path, schema) as writer:
+            for chunk in _chunks(frame, chunk_rows):
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+        return
+    with open(path, "wb") as raw:
+        if fmt == "CSV (gzip)":
+            with gzip.GzipFile(fileobj=raw, mode="wb") as gz:
+                _write_csv(frame, gz, chunk_rows)
+        elif fmt == "CSV (zstd)":
+            with zstandard.ZstdCompressor().stream_writer(raw, closefd=False) as zst:
+                _write_csv(frame, zst, chunk_rows)
+        else:
+            _write_csv(frame, raw, chunk_rows)
+
+
+class ExportCache:
+    """
+    Export files in a private temp directory, keyed by (filter, columns, format).
+    The directory is removed when the cache is garbage collected.
+    """
+
+    def __init__(self, max_mb=EXPORT_CACHE_MB):
+        self.directory = tempfile.mkdtemp(prefix="csv_gui_exports_")
+        self.max_bytes = max_mb * 1024 ** 2
+        self.total_bytes = 0
+        self._exports = OrderedDict()
+        self._cleanup = weakref.finalize(self, shutil.rmtree, self.directory, True)
+
+    def get(self, key):
+        export = self._exports.get(key)
+        if export is not None:
+            self._exports.move_to_end(key)
+        return export
+
+    def build(self, key, frame, fmt, base_name="filtered_output", chunk_rows=CHUNK_ROWS):
+        existing = self.get(key)
+        if existing is not None:
+            return existing
+        extension, mime = FORMATS[fmt]
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()[:16]
+        path = os.path.join(self.directory, digest + extension)
+        write_export(frame, path + ".tmp", fmt, chunk_rows)
+        os.replace(path + ".tmp", path)
+
+        export = Export(path, base_name + extension, mime, os.path.getsize(path))
+        self._exports[key] = export
+        self.total_bytes += export.size
+        while self.total_bytes > self.max_bytes and len(self._exports) > 1:
+            _, evicted = self._exports.popitem(last=False)
+            self.total_bytes -= evicted.size
+            os.remove(evicted.path)
+        return export
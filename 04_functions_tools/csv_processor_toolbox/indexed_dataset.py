@@ -0,0 +1,179 @@
+"""
+Parsed-once dataset with per-column sorted indexes for csv_gui_app.py.
+
+Uploads are parsed and concatenated a single time per session. Filters are
+answered from sorted indexes that are built lazily, the first time a column
+is filtered:
+
+- numeric columns: argsort of the values, so a [lo, hi] range is two
+  searchsorted calls instead of a full-column comparison;
+- other columns: rows grouped by factorized value, so an equality filter is
+  a slice of that grouping.
+
+Filtered frames are memoized per predicate in an LRU bounded by bytes.
+With compact_dtypes the merged frame goes through shared/compact.py first.
+"""
+import hashlib
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[2] / "shared"))
+try:
+    import compact
+except ImportError:
+    compact = None
+
+RESULT_CACHE_MB = 512
+
+
+def upload_signature(uploaded_files):
+    """
+    Cheap identity of a set of Streamlit uploads, used to tell whether the
+    session's dataset is still current.
+    """
+    h = hashlib.sha256()
+    for file in uploaded_files:
+        h.update(f"{file.name}:{file.size}:{getattr(file, 'file_id', '')}\n".encode())
+    return h.hexdigest()
+
+
+def read_upload(file):
+    if file.name.endswith('.xlsx'):
+        return pd.read_excel(file)
+    return pd.read_csv(file)
+
+
+def _nbytes(value):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(np.sum(value.memory_usage(index=True, deep=True)))
+    return getattr(value, "nbytes", 0)
+
+
+class _NumericIndex:
+    def __init__(self, series):
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        self.order = np.argsort(values, kind="stable")     # NaNs sort last
+        self.sorted = values[self.order]
+        self.valid = len(values) - int(np.isnan(values).sum())
+
+    @property
+    def min(self):
+        return float(self.sorted[0]) if self.valid else np.nan
+
+    @property
+    def max(self):
+        return float(self.sorted[self.valid - 1]) if self.valid else np.nan
+
+    def between(self, lo, hi):
+        start = np.searchsorted(self.sorted[:self.valid], lo, side="left")
+        stop = np.searchsorted(self.sorted[:self.valid], hi, side="right")
+        return self.order[start:stop]
+
+
+class _ValueIndex:
+    def __init__(self, series):
+        codes, self.uniques = pd.factorize(series)   # NaN -> -1, uniques in order of appearance
+        self.order = np.argsort(codes, kind="stable")
+        # rows with code c are order[offsets[c + 1]:offsets[c + 2]]; code -1 (missing) comes first
+        counts = np.bincount(codes + 1, minlength=len(self.uniques) + 1)
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+        self._codes = {value: code for code, value in enumerate(self.uniques)}
+
+    def equal(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            return self.order[:0]
+        return self.order[self.offsets[code + 1]:self.offsets[code + 2]]
+
+
+class IndexedDataset:
+    """
+    A DataFrame plus lazily built column indexes and a per-predicate result cache.
+    """
+
+    def __init__(self, df, cache_mb=RESULT_CACHE_MB):
+        self.df = df
+        self._indexes = {}
+        self._results = OrderedDict()   # key -> (value, nbytes)
+        self.cache_bytes = 0
+        self.max_cache_bytes = cache_mb * 1024 ** 2
+        self.hits = 0
+        self.misses = 0
+        self.compaction = None   # shared/compact.py report when the frame was compacted
+
+    @classmethod
+    def from_uploads(cls, uploaded_files, compact_dtypes=False):
+        frames = [read_upload(file) for file in uploaded_files]
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        report = None
+        if compact_dtypes and compact is not None:
+            # after the merge, so every file's strings share one set of categories
+            df, report = compact.compact(df)
+        dataset = cls(df)
+        dataset.compaction = report
+        return dataset
+
+    def __len__(self):
+        return len(self.df)
+
+    def is_numeric(self, column):
+        return pd.api.types.is_numeric_dtype(self.df[column])
+
+    def index(self, column):
+        if column not in self._indexes:
+            series = self.df[column]
+            self._indexes[column] = _NumericIndex(series) if self.is_numeric(column) else _ValueIndex(series)
+        return self._indexes[column]
+
+    def value_range(self, column):
+        index = self.index(column)
+        return index.min, index.max
+
+    def unique_values(self, column):
+        return self.index(column).uniques.tolist()
+
+    def memoized(self, key, compute):
+        """
+        LRU cache shared by everything derived from this dataset (filters, summaries, ...).
+        """
+        if key in self._results:
+            self._results.move_to_end(key)
+            self.hits += 1
+            return self._results[key][0]
+        self.misses += 1
+        value = compute()
+        size = _nbytes(value)
+        self._results[key] = (value, size)
+        self.cache_bytes += size
+        # evict least recently used entries, but always keep the newest one
+        while self.cache_bytes > self.max_cache_bytes and len(self._results) > 1:
+            _, (_, evicted) = self._results.popitem(last=False)
+            self.cache_bytes -= evicted
+        return value
+
+    def filter_positions(self, column, lo=None, hi=None, value=None):
+        """
+        Row positions (ascending, i.e. in file order) matching lo <= column <= hi
+        for a numeric column, or column == value otherwise.
+        """
+        if self.is_numeric(column):
+            return np.sort(self.index(column).between(lo, hi))
+        return np.sort(self.index(column).equal(value))
+
+    def predicate(self, column, lo=None, hi=None, value=None):
+        """Hashable key describing a filter, e.g. for caching things derived from its result."""
+        if self.is_numeric(column):
+            return ("range", column, lo, hi)
+        return ("equal", column, value)
+
+    def filter(self, column, lo=None, hi=None, value=None):
+        """Filtered frame, memoized per predicate."""
+        key = ("filter",) + self.predicate(column, lo=lo, hi=hi, value=value)
+        return self.memoized(key, lambda: self.df.take(self.filter_positions(column, lo=lo, hi=hi, value=value)))
+
+    def summary(self):
+        return self.memoized(("summary",), lambda: self.df.describe(include='all'))
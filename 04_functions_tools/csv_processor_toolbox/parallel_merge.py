@@ -0,0 +1,83 @@
+"""
+Parallel multi-file merge for csv_processor.py --merge.
+
+Shards are parsed on a thread or process pool while the main thread writes
+finished shards to the output in input order, so at most a small window of
+shards is held in memory at once.
+"""
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+
+import chunked
+
+
+def _read_shard(path):
+    start = time.perf_counter()
+    df = pd.read_csv(path)
+    return df, time.perf_counter() - start
+
+
+def reconcile_schema(files):
+    """
+    Union of all shard headers, in order of first appearance.
+    Shards missing a column get it filled with NaN on write.
+    """
+    columns = []
+    seen = set()
+    for f in files:
+        for col in chunked.read_header(f):
+            if col not in seen:
+                seen.add(col)
+                columns.append(col)
+    return columns
+
+
+def merge_parallel(files, output_path=None, workers=4, use_processes=False, preview_rows=5):
+    """
+    Reads `files` concurrently and streams them, in input order, to `output_path`.
+    Returns (total rows, preview frame, per-file throughput report).
+    """
+    columns = reconcile_schema(files)
+    writer = chunked.ChunkWriter(output_path) if output_path else None
+    executor = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    window = max(workers, 1) * 2  # shards parsed ahead of the writer
+    total = 0
+    preview = []
+    report = []
+
+    with executor(max_workers=workers) as pool:
+        remaining = iter(files)
+        pending = deque()
+        for path in remaining:
+            pending.append((path, pool.submit(_read_shard, path)))
+            if len(pending) >= window:
+                break
+        while pending:
+            path, future = pending.popleft()
+            df, seconds = future.result()
+            next_path = next(remaining, None)
+            if next_path is not None:
+                pending.append((next_path, pool.submit(_read_shard, next_path)))
+
+            df = df.reindex(columns=columns)
+            total += len(df)
+            if sum(len(p) for p in preview) < preview_rows:
+                preview.append(df.head(preview_rows))
+            if writer:
+                writer.write(df)
+
+            size_mb = os.path.getsize(path) / 1024 ** 2
+            report.append({
+                "file": path,
+                "rows": len(df),
+                "MB": round(size_mb, 3),
+                "read_s": round(seconds, 4),
+                "MB/s": round(size_mb / seconds, 2) if seconds > 0 else float("inf"),
+            })
+
+    head = pd.concat(preview, ignore_index=True).head(preview_rows) if preview else pd.DataFrame(columns=columns)
+    return total, head, pd.DataFrame(report)
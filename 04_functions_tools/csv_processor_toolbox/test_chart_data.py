@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from chart_data import json_bytes, prepare_scatter
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 50_000
+    x = rng.normal(size=n)
+    x[::97] = np.nan
+    return pd.DataFrame({
+        "x": x,
+        "y": rng.integers(0, 10 ** rng.integers(1, 10, n)),   # record sizes vary from row to row
+        "label": rng.choice(["a", "b"], n),                    # not plotted, never sent
+    })
+
+
+def test_raw_keeps_every_complete_row(frame):
+    small = frame.head(500)
+    chart = prepare_scatter(small, "x", "y", budget_bytes=1024 ** 2)
+    expected = small[["x", "y"]].dropna()
+    assert chart.strategy == "raw"
+    assert chart.rows_in == chart.rows_out == len(expected)
+    pd.testing.assert_frame_equal(chart.frame, expected)
+    assert chart.payload_bytes == json_bytes(expected)
+
+
+@pytest.mark.parametrize("budget_kb", [4, 64, 512])
+def test_sample_is_an_ordered_subset_within_budget(frame, budget_kb):
+    budget = budget_kb * 1024
+    chart = prepare_scatter(frame, "x", "y", budget_bytes=budget)
+    complete = frame[["x", "y"]].dropna()
+    assert chart.strategy == "sample"
+    assert chart.rows_in == len(complete)
+    assert 0 < chart.rows_out < len(complete)
+    assert chart.payload_bytes == json_bytes(chart.frame) <= budget
+    assert chart.payload_bytes > budget * 0.9                      # not trimmed more than needed
+    assert chart.frame.index.is_monotonic_increasing
+    pd.testing.assert_frame_equal(chart.frame, complete.loc[chart.frame.index])
+    # same seed, same rows: reruns send the same chart
+    pd.testing.assert_frame_equal(prepare_scatter(frame, "x", "y", budget_bytes=budget).frame, chart.frame)
+
+
+def test_budget_smaller_than_one_row_sends_one_row(frame):
+    chart = prepare_scatter(frame, "x", "y", budget_bytes=10)
+    assert chart.strategy == "sample"
+    assert chart.rows_out == 1
+
+
+@pytest.mark.parametrize("budget_kb", [4, 64, 1024])
+def test_heatmap_counts_every_row_within_budget(frame, budget_kb):
+    budget = budget_kb * 1024
+    chart = prepare_scatter(frame, "x", "y", budget_bytes=budget, sample_row_limit=10_000)
+    complete = frame[["x", "y"]].dropna()
+    assert chart.strategy == "heatmap"
+    assert chart.rows_in == len(complete)
+    assert chart.frame["count"].sum() == len(complete)
+    assert (chart.frame["count"] > 0).all()
+    assert chart.frame["x_start"].min() == complete["x"].min()
+    assert chart.frame["x_end"].max() == complete["x"].max()
+    assert chart.payload_bytes == json_bytes(chart.frame) <= budget
+
+
+def test_all_missing_gives_empty_raw_chart():
+    df = pd.DataFrame({"x": [np.nan, 1.0], "y": [2.0, np.nan]})
+    chart = prepare_scatter(df, "x", "y")
+    assert chart.strategy == "raw"
+    assert chart.rows_in == chart.rows_out == 0
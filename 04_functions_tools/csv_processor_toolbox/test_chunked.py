@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import chunked
+from chunked import ColumnStats, _exact_quantiles, summarize_chunked
+
+QUANTILE_ROWS = ["25%", "50%", "75%"]
+
+
+@pytest.fixture
+def skewed_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 20_000
+    df = pd.DataFrame({
+        "flag": rng.integers(0, 2, n),                            # two distinct values
+        "ties": rng.integers(0, 5, n) * 1.5,
+        "outlier": np.r_[rng.normal(size=n - 1), 1e12],          # one value stretches the range
+        "spread": 2.0 ** rng.integers(-300, 300, n),              # values over 180 orders of magnitude
+        "normal": rng.normal(size=n),
+    })
+    path = tmp_path / "skewed.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_describe_matches_pandas(skewed_csv):
+    _, describe = summarize_chunked(skewed_csv, chunksize=1000)
+    expected = pd.read_csv(skewed_csv).describe()
+    pd.testing.assert_frame_equal(describe.loc[QUANTILE_ROWS], expected.loc[QUANTILE_ROWS], check_exact=True)
+    pd.testing.assert_frame_equal(describe, expected, check_exact=False, rtol=1e-9)
+
+
+@pytest.mark.parametrize("max_kept", [1, 64])
+def test_quantiles_keep_at_most_max_kept_values(skewed_csv, monkeypatch, max_kept):
+    df = pd.read_csv(skewed_csv)
+    stats = {}
+    for col in df.columns:
+        stats[col] = ColumnStats()
+        stats[col].update(df[col].to_numpy(dtype=float))
+
+    kept = []
+
+    class RecordingNumpy:
+        # numpy as seen by chunked.py only, recording the size of every kept window
+        def __getattr__(self, name):
+            return getattr(np, name)
+
+        def concatenate(self, parts):
+            kept.append(sum(len(p) for p in parts))
+            return np.concatenate(parts)
+
+    monkeypatch.setattr(chunked, "np", RecordingNumpy())
+    quantiles = _exact_quantiles(skewed_csv, 1000, stats, max_kept=max_kept)
+    monkeypatch.undo()
+    assert max(kept, default=0) <= max_kept
+    expected = df.quantile([0.25, 0.5, 0.75])
+    for col in df.columns:
+        assert quantiles[col] == expected[col].tolist()
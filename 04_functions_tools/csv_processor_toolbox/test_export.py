@@ -0,0 +1,44 @@
+import gzip
+import io
+
+import pandas as pd
+import pytest
+
+from export import ExportCache, available_formats, write_export
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture(params=[False, True], ids=["object-strings", "string-dtype"])
+def frame(request):
+    # object-dtype strings are what pandas 2.x produces; pandas 3 infers the str dtype
+    with pd.option_context("future.infer_string", request.param):
+        return pd.DataFrame({
+            "region": ["East", "West", None, "North", "East"],
+            "late": [None, None, None, "yes", "no"],   # all missing in the first chunk
+            "sales": [1.5, 2.0, 3.25, None, 5.0],
+            "units": [1, 2, 3, 4, 5],
+        })
+
+
+def test_parquet_export_with_string_columns(frame, tmp_path):
+    path = tmp_path / "out.parquet"
+    write_export(frame, path, "Parquet", chunk_rows=2)
+    result = pq.read_table(path).to_pandas()
+    assert result.astype(object).where(result.notna(), None).values.tolist() == \
+        frame.astype(object).where(frame.notna(), None).values.tolist()
+
+
+def test_csv_exports_round_trip(frame, tmp_path):
+    for fmt in ("CSV", "CSV (gzip)"):
+        path = tmp_path / f"out-{len(fmt)}"
+        write_export(frame, path, fmt, chunk_rows=2)
+        opener = gzip.open if fmt == "CSV (gzip)" else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            assert pd.read_csv(f).equals(pd.read_csv(io.StringIO(frame.to_csv(index=False))))
+
+
+def test_export_cache_reuses_file(frame):
+    cache = ExportCache()
+    first = cache.build(("region", "East"), frame, available_formats()[0])
+    assert cache.build(("region", "East"), frame, available_formats()[0]) is first
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from indexed_dataset import IndexedDataset
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 2000
+    ints = rng.integers(-5, 6, n)
+    floats = rng.normal(size=n).round(1)
+    floats[rng.choice(n, 50, replace=False)] = np.nan
+    return pd.DataFrame({
+        "ints": ints,                                              # many duplicates at every boundary
+        "floats": floats,
+        "nullable": pd.array(np.where(ints > 3, None, ints), dtype="Int64"),
+        "region": rng.choice(["East", "West", "North", None], n),
+        "flag": ints % 2 == 0,
+    }, index=np.arange(n) * 3)                                     # non-default index is kept
+
+
+def range_mask(df, column, lo, hi):
+    col = df[column].astype(float)
+    return df[(col >= lo) & (col <= hi)]
+
+
+@pytest.mark.parametrize("column", ["ints", "floats", "nullable", "flag"])
+def test_range_filter_matches_boolean_mask(frame, column):
+    dataset = IndexedDataset(frame)
+    values = frame[column].astype(float).dropna().unique()
+    lo_min, hi_max = dataset.value_range(column)
+    bounds = [(lo_min, hi_max), (lo_min, lo_min), (hi_max, hi_max), (hi_max, lo_min),
+              (lo_min - 1, lo_min - 0.5), (hi_max + 0.5, hi_max + 1)]
+    bounds += [(a, b) for a in values[:4] for b in values[:4]]        # exact values on both ends
+    bounds += [(a + 0.05, b - 0.05) for a in values[:3] for b in values[:3]]
+    for lo, hi in bounds:
+        pd.testing.assert_frame_equal(dataset.filter(column, lo=lo, hi=hi), range_mask(frame, column, lo, hi))
+
+
+def test_value_range_skips_missing(frame):
+    dataset = IndexedDataset(frame)
+    assert dataset.value_range("floats") == (np.nanmin(frame["floats"]), np.nanmax(frame["floats"]))
+    assert dataset.value_range("nullable") == (-5.0, 3.0)
+    empty = IndexedDataset(pd.DataFrame({"x": [np.nan, np.nan]}))
+    assert all(np.isnan(v) for v in empty.value_range("x"))
+    assert empty.filter("x", lo=0, hi=1).empty
+
+
+def test_equality_filter_matches_boolean_mask(frame):
+    dataset = IndexedDataset(frame)
+    assert dataset.unique_values("region") == frame["region"].dropna().unique().tolist()
+    for value in dataset.unique_values("region") + ["South"]:
+        pd.testing.assert_frame_equal(dataset.filter("region", value=value), frame[frame["region"] == value])
+
+
+def test_category_column_filters_like_strings(frame):
+    categorical = frame.assign(region=frame["region"].astype("category"))
+    dataset = IndexedDataset(categorical)
+    for value in ["East", "West", "North"]:
+        pd.testing.assert_frame_equal(dataset.filter("region", value=value),
+                                      categorical[categorical["region"] == value])
+
+
+def test_filters_are_memoized_per_predicate(frame):
+    dataset = IndexedDataset(frame)
+    first = dataset.filter("ints", lo=0, hi=2)
+    assert dataset.filter("ints", lo=0, hi=2) is first
+    assert dataset.hits == 1 and dataset.misses == 1
+    dataset.filter("ints", lo=0, hi=3)
+    assert dataset.misses == 2
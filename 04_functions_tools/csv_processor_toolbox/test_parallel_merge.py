@@ -0,0 +1,85 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import parallel_merge
+from parallel_merge import merge_parallel, reconcile_schema
+
+
+@pytest.fixture
+def shards(tmp_path):
+    paths = []
+    for i in range(8):
+        df = pd.DataFrame({"shard": i, "row": range(i * 10, i * 10 + 3 + i), "value": np.arange(3 + i) * 0.5})
+        path = tmp_path / f"part{i}.csv"
+        df.to_csv(path, index=False)
+        paths.append(str(path))
+    return paths
+
+
+def expected_merge(files):
+    return pd.concat([pd.read_csv(f) for f in files], ignore_index=True)
+
+
+def test_output_keeps_input_order_when_shards_finish_out_of_order(shards, tmp_path, monkeypatch):
+    read_shard = parallel_merge._read_shard
+    delays = {path: 0.02 * (len(shards) - i) for i, path in enumerate(shards)}  # first file finishes last
+
+    def slow_read(path):
+        time.sleep(delays[path])
+        return read_shard(path)
+
+    monkeypatch.setattr(parallel_merge, "_read_shard", slow_read)
+    out = tmp_path / "merged.csv"
+    total, preview, report = merge_parallel(shards, out, workers=4)
+
+    expected = expected_merge(shards)
+    assert total == len(expected)
+    pd.testing.assert_frame_equal(pd.read_csv(out), expected)
+    pd.testing.assert_frame_equal(preview, expected.head(5))
+    assert report["file"].tolist() == shards
+    assert report["rows"].tolist() == [3 + i for i in range(len(shards))]
+
+
+@pytest.mark.parametrize("workers", [1, 3, 16])
+def test_process_pool_matches_concat(shards, tmp_path, workers):
+    out = tmp_path / "merged.csv"
+    total, _, _ = merge_parallel(shards[::-1], out, workers=workers, use_processes=True)
+    assert total == len(expected_merge(shards))
+    pd.testing.assert_frame_equal(pd.read_csv(out), expected_merge(shards[::-1]))
+
+
+def test_schema_is_union_in_first_appearance_order(tmp_path):
+    a, b, c = tmp_path / "a.csv", tmp_path / "b.csv", tmp_path / "c.csv"
+    pd.DataFrame({"id": [1, 2], "sales": [10, 20]}).to_csv(a, index=False)
+    pd.DataFrame({"region": ["East"], "id": [3]}).to_csv(b, index=False)
+    pd.DataFrame({"sales": [40], "units": [4], "id": [4]}).to_csv(c, index=False)
+    files = [str(a), str(b), str(c)]
+    assert reconcile_schema(files) == ["id", "sales", "region", "units"]
+
+    out = tmp_path / "merged.csv"
+    total, preview, _ = merge_parallel(files, out, workers=2)
+    merged = pd.read_csv(out)
+    assert total == 4
+    assert merged.columns.tolist() == ["id", "sales", "region", "units"]
+    assert merged["id"].tolist() == [1, 2, 3, 4]
+    assert merged["sales"].tolist()[:2] == [10, 20] and np.isnan(merged["sales"][2])
+    assert merged["region"].isna().tolist() == [True, True, False, True]
+    assert merged["units"].isna().tolist() == [True, True, True, False]
+    pd.testing.assert_frame_equal(preview, merged, check_dtype=False)
+
+
+def test_empty_shard_keeps_header_and_order(tmp_path):
+    a, empty, b = tmp_path / "a.csv", tmp_path / "empty.csv", tmp_path / "b.csv"
+    pd.DataFrame({"id": [1]}).to_csv(a, index=False)
+    empty.write_text("id,extra\n")
+    pd.DataFrame({"id": [2]}).to_csv(b, index=False)
+    out = tmp_path / "merged.csv"
+    total, _, report = merge_parallel([str(a), str(empty), str(b)], out, workers=2)
+    merged = pd.read_csv(out)
+    assert total == 2
+    assert merged.columns.tolist() == ["id", "extra"]
+    assert merged["id"].tolist() == [1, 2]
+    assert report["rows"].tolist() == [1, 0, 1]
@@ -1,64 +1,107 @@
+import atexit
 import logging
-from datetime import datetime
+import logging.handlers
+import operator as op
+import queue
 
-# Configure logging
-logging.basicConfig(
-    filename='calculator.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+from expression import ExpressionError, evaluate, split_assignment
 
-def log_operation(op_str):
-    logging.info(op_str)
+LOG_FILE = 'calculator.log'
 
-def calculate(a, b, operator):
+logger = logging.getLogger("calculator")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+logger.addHandler(logging.NullHandler())   # silent until start_logging()
+log_listener = None
+
+def start_logging(path=LOG_FILE):
+    """
+    Sends the calculator log to `path` (once per process): callers only put
+    records on a queue; a background listener thread does the formatting and
+    the file writes. Importing this module creates no file and no thread.
+    """
+    global log_listener
+    if log_listener is None:
+        log_queue = queue.SimpleQueue()
+        file_handler = logging.FileHandler(path, delay=True)
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        log_listener.start()
+        atexit.register(log_listener.stop)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    return log_listener
+
+OPERATIONS = {
+    '+': op.add,
+    '-': op.sub,
+    '*': op.mul,
+    '/': op.truediv,
+    '**': op.pow,
+    '//': op.floordiv,
+    '%': op.mod,
+}
+
+def _logged(compute, expression, *args):
+    # one logging path for calculate() and the REPL: "<expression> = <result>" or the error
     try:
-        if operator == '+':
-            result = a + b
-        elif operator == '-':
-            result = a - b
-        elif operator == '*':
-            result = a * b
-        elif operator == '/':
-            result = a / b
-        elif operator == '**':
-            result = a ** b
-        elif operator == '//':
-            result = a // b
-        elif operator == '%':
-            result = a % b
-        else:
+        result = compute()
+    except ZeroDivisionError:
+        logger.error("Division by zero attempted.")
+        raise
+    except ExpressionError:
+        raise
+    except Exception as e:
+        logger.error("Unexpected error: %s", e)
+        raise
+    logger.info(expression + " = %s", *args, result)
+    return result
+
+def calculate(a, b, operator):
+    def compute():
+        func = OPERATIONS.get(operator)
+        if func is None:
             raise ValueError("Unsupported operator.")
-        log_operation(f"{a} {operator} {b} = {result}")
-        return result
+        return func(a, b)
+
+    try:
+        return _logged(compute, "%s %s %s", a, operator, b)
     except ZeroDivisionError:
-        logging.error("Division by zero attempted.")
         return "❌ Error: Division by zero."
     except Exception as e:
-        logging.error(f"Unexpected error: {e}")
         return f"❌ Error: {str(e)}"
 
+def calculate_expression(source, variables):
+    """
+    Evaluates a full expression (see expression.py), logged like calculate().
+    Errors are raised, not returned.
+    """
+    return _logged(lambda: evaluate(source, variables), "%s", source.strip())
+
 def main():
+    start_logging()
     print("🧮 Welcome to Custom CLI Calculator (type 'exit' to quit)")
+    print("   Full expressions and variables are supported, e.g. 'x = 3 + 2' then 'x ** 2 / (x - 1)'")
+    variables = {}
     while True:
         try:
-            user_input = input("\nEnter operation (e.g. 3 + 2): ").strip()
+            user_input = input("\nEnter expression (e.g. 3 + 2 * 4): ").strip()
             if user_input.lower() == 'exit':
                 print("👋 Goodbye!")
                 break
-            parts = user_input.split()
-            if len(parts) != 3:
-                print("❗ Format must be: number operator number (e.g. 5 * 6)")
+            if not user_input:
                 continue
 
-            a = float(parts[0])
-            operator = parts[1]
-            b = float(parts[2])
-
-            result = calculate(a, b, operator)
+            name, source = split_assignment(user_input)
+            result = calculate_expression(source, variables)
+            if name:
+                variables[name] = result
             print(f"✅ Result: {result}")
-        except ValueError:
-            print("❗ Invalid input. Please enter numbers properly.")
+        except ZeroDivisionError:
+            print("❌ Error: Division by zero.")
+        except ExpressionError as e:
+            print(f"❗ Invalid input: {e}")
+        except (ArithmeticError, TypeError) as e:
+            print(f"❌ Error: {e}")
 
 if __name__ == "__main__":
     main()
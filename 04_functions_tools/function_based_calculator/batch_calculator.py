@@ -0,0 +1,111 @@
+import argparse
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+from Calculator import logger, start_logging
+
+UFUNCS = {
+    '+': np.add,
+    '-': np.subtract,
+    '*': np.multiply,
+    '/': np.true_divide,
+    '**': np.power,
+    '//': np.floor_divide,
+    '%': np.mod,
+}
+DIVISION_OPS = {'/', '//', '%'}
+
+# values: float results (NaN wherever an error mask is set)
+BatchResult = namedtuple("BatchResult", ["values", "zero_division", "unsupported", "invalid"])
+
+
+def calculate_batch(a, b, operators):
+    """
+    Vectorized calculate(): `a` and `b` are arrays (or scalars) of operands and
+    `operators` is an array of operator strings or a single operator.
+    Elements are grouped by operator and each group is one NumPy ufunc call.
+    Errors are reported as boolean masks instead of strings.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    ops = np.asarray(operators, dtype=object)
+    a, b, ops = np.broadcast_arrays(a, b, ops)
+
+    values = np.full(a.shape, np.nan)
+    zero_division = np.zeros(a.shape, dtype=bool)
+    unsupported = np.zeros(a.shape, dtype=bool)
+
+    for operator in set(ops.ravel().tolist()):
+        idx = ops == operator
+        func = UFUNCS.get(operator)
+        if func is None:
+            unsupported |= idx
+            continue
+        if operator in DIVISION_OPS:
+            zero = idx & (b == 0)
+        elif operator == '**':
+            zero = idx & (a == 0) & (b < 0)  # Python raises ZeroDivisionError for 0 ** -n
+        else:
+            zero = None
+        if zero is not None:
+            zero_division |= zero
+            idx = idx & ~zero
+        with np.errstate(all="ignore"):
+            values[idx] = func(a[idx], b[idx])
+
+    invalid = ~(zero_division | unsupported) & np.isnan(values)
+    result = BatchResult(values, zero_division, unsupported, invalid)
+    logger.info("Batch of %d operations: %d division by zero, %d unsupported, %d invalid",
+                values.size, zero_division.sum(), unsupported.sum(), invalid.sum())
+    return result
+
+
+def parse_expressions(lines):
+    """
+    Parses "a op b" lines into operand and operator arrays.
+    Malformed lines get NaN operands and operator None (reported as unsupported).
+    """
+    a, b, ops = [], [], []
+    for line in lines:
+        parts = line.split()
+        try:
+            if len(parts) != 3:
+                raise ValueError
+            a.append(float(parts[0]))
+            b.append(float(parts[2]))
+            ops.append(parts[1])
+        except ValueError:
+            a.append(np.nan)
+            b.append(np.nan)
+            ops.append(None)
+    return np.array(a), np.array(b), np.array(ops, dtype=object)
+
+
+def evaluate_lines(lines):
+    lines = [line for line in lines if line.strip()]
+    return lines, calculate_batch(*parse_expressions(lines))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="🧮 Batch calculator: one 'a op b' expression per line")
+    parser.add_argument("file", nargs="?", default="-", help="Expressions file (default: stdin)")
+    args = parser.parse_args()
+
+    start_logging()
+    stream = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8")
+    with stream:
+        lines, result = evaluate_lines(stream)
+    for line, value, zero, bad_op, invalid in zip(lines, *result):
+        if zero:
+            value = "❌ Error: Division by zero."
+        elif bad_op:
+            value = "❌ Error: Unsupported operator or malformed expression."
+        elif invalid:
+            value = "❌ Error: Result is not a real number."
+        print(f"{line.strip()} = {value}")
+
+
+if __name__ == "__main__":
+    main()
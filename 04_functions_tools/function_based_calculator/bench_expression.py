@@ -0,0 +1,68 @@
+"""
+Microbenchmarks: calculate() dispatch vs the expression compiler.
+
+    python bench_expression.py               # 100k evaluations per case
+    python bench_expression.py -n 1000000
+    python bench_expression.py --with-logging
+
+calculate() logs every call; by default logging is switched off so only
+dispatch and arithmetic are compared.
+"""
+import argparse
+import random
+import timeit
+
+import numpy as np
+
+from Calculator import calculate, logger, start_logging
+from expression import clear_caches, compile_expression, evaluate
+
+SOURCE = "a * b + a / b - 2"
+
+
+def via_calculate(a, b):
+    # SOURCE as a chain of a-op-b calls, the only form calculate() understands
+    return calculate(calculate(calculate(a, b, '*'), calculate(a, b, '/'), '+'), 2, '-')
+
+
+def bench(label, func, number, baseline=None):
+    seconds = min(timeit.repeat(func, number=1, repeat=3))
+    per_op = seconds / number * 1e9
+    speedup = f"  x{baseline / seconds:6.1f}" if baseline else ""
+    print(f"{label:<36} {seconds * 1e3:9.1f} ms  {per_op:8.0f} ns/eval{speedup}")
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Expression compiler microbenchmarks")
+    parser.add_argument("-n", type=int, default=100_000, help="evaluations per case")
+    parser.add_argument("--with-logging", action="store_true", help="keep calculate() logging on")
+    args = parser.parse_args()
+
+    if args.with_logging:
+        start_logging()
+    logger.disabled = not args.with_logging
+    rng = random.Random(0)
+    pairs = [(rng.uniform(1, 100), rng.uniform(1, 100)) for _ in range(args.n)]
+    repeated = [pairs[i % 100] for i in range(args.n)]   # only 100 distinct inputs
+    a_col = np.array([a for a, _ in pairs])
+    b_col = np.array([b for _, b in pairs])
+    compiled = compile_expression(SOURCE)
+
+    print(f"Expression: {SOURCE!r}, {args.n:,} evaluations\n")
+    base = bench("calculate() chain", lambda: [via_calculate(a, b) for a, b in pairs], args.n)
+    bench("parse every time (cache cleared)",
+          lambda: [clear_caches() or compile_expression(SOURCE)(a=a, b=b) for a, b in pairs], args.n, base)
+    bench("compiled once", lambda: [compiled(a=a, b=b) for a, b in pairs], args.n, base)
+    bench("evaluate(), distinct inputs", lambda: [evaluate(SOURCE, {"a": a, "b": b}) for a, b in pairs],
+          args.n, base)
+    bench("evaluate(), 100 repeated inputs", lambda: [evaluate(SOURCE, {"a": a, "b": b}) for a, b in repeated],
+          args.n, base)
+    bench("evaluate_columns() (NumPy)", lambda: compiled.evaluate_columns(a=a_col, b=b_col), args.n, base)
+
+    expected = np.array([via_calculate(a, b) for a, b in pairs])
+    print("\nSame results:", np.allclose(compiled.evaluate_columns(a=a_col, b=b_col), expected))
+
+
+if __name__ == "__main__":
+    main()
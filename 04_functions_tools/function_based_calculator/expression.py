@@ -0,0 +1,268 @@
+import functools
+import operator as op
+import re
+
+BINARY_OPERATIONS = {
+    '+': op.add,
+    '-': op.sub,
+    '*': op.mul,
+    '/': op.truediv,
+    '**': op.pow,
+    '//': op.floordiv,
+    '%': op.mod,
+}
+ADDITIVE = {'+', '-'}
+MULTIPLICATIVE = {'*', '/', '//', '%'}
+
+TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+      | (?P<name>[A-Za-z_]\w*)
+      | (?P<op>\*\*|//|[-+*/%()])
+    )""", re.VERBOSE)
+ASSIGN_RE = re.compile(r"^\s*([A-Za-z_]\w*)\s*=(?!=)(.*)$")
+
+COMPILE_CACHE_SIZE = 1024
+RESULT_CACHE_SIZE = 4096
+
+
+class ExpressionError(ValueError):
+    """Malformed expression or missing variable."""
+
+
+def tokenize(source):
+    tokens = []
+    pos = 0
+    source = source.rstrip()
+    while pos < len(source):
+        match = TOKEN_RE.match(source, pos)
+        if match is None:
+            pos += len(source[pos:]) - len(source[pos:].lstrip())
+            raise ExpressionError(f"Unexpected character {source[pos]!r} at position {pos}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """
+    Recursive descent with Python's precedence rules:
+        expr  := term (('+' | '-') term)*
+        term  := unary (('*' | '/' | '//' | '%') unary)*
+        unary := ('+' | '-') unary | power
+        power := atom ('**' unary)?          # right-associative, -2 ** 2 == -4
+        atom  := number | name | '(' expr ')'
+    Nodes are tuples: ('num', value), ('var', name), ('neg', node), ('bin', op, left, right).
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise ExpressionError("Empty expression")
+        node = self.expr()
+        if self.pos < len(self.tokens):
+            raise ExpressionError(f"Unexpected {self.peek()[1]!r}")
+        return node
+
+    def expr(self):
+        node = self.term()
+        while self.peek()[0] == "op" and self.peek()[1] in ADDITIVE:
+            node = ("bin", self.take()[1], node, self.term())
+        return node
+
+    def term(self):
+        node = self.unary()
+        while self.peek()[0] == "op" and self.peek()[1] in MULTIPLICATIVE:
+            node = ("bin", self.take()[1], node, self.unary())
+        return node
+
+    def unary(self):
+        if self.peek() in (("op", "-"), ("op", "+")):
+            sign = self.take()[1]
+            operand = self.unary()
+            return ("neg", operand) if sign == "-" else operand
+        return self.power()
+
+    def power(self):
+        node = self.atom()
+        if self.peek() == ("op", "**"):
+            self.take()
+            node = ("bin", "**", node, self.unary())
+        return node
+
+    def atom(self):
+        kind, value = self.take()
+        if kind == "number":
+            return ("num", float(value))
+        if kind == "name":
+            return ("var", value)
+        if (kind, value) == ("op", "("):
+            node = self.expr()
+            if self.take() != ("op", ")"):
+                raise ExpressionError("Missing closing parenthesis")
+            return node
+        raise ExpressionError("Unexpected end of expression" if kind is None else f"Unexpected {value!r}")
+
+
+def _fold(node):
+    """
+    Constant folding. A constant subexpression that raises (e.g. 1 / 0) is
+    left alone so the error surfaces at evaluation time.
+    """
+    kind = node[0]
+    if kind == "neg":
+        operand = _fold(node[1])
+        return ("num", -operand[1]) if operand[0] == "num" else ("neg", operand)
+    if kind == "bin":
+        left, right = _fold(node[2]), _fold(node[3])
+        if left[0] == right[0] == "num":
+            try:
+                value = BINARY_OPERATIONS[node[1]](left[1], right[1])
+                if isinstance(value, float):
+                    return ("num", value)
+            except (ArithmeticError, ValueError):
+                pass
+        return ("bin", node[1], left, right)
+    return node
+
+
+def _variables(node):
+    if node[0] == "var":
+        return {node[1]}
+    return set().union(*(_variables(child) for child in node[1:] if isinstance(child, tuple)))
+
+
+def _to_source(node, consts):
+    """
+    Python source for the tree: variables become env[...] lookups and numbers
+    are referenced by name, so nothing from the user is pasted into code.
+    """
+    kind = node[0]
+    if kind == "num":
+        name = f"_c{len(consts)}"
+        consts[name] = node[1]
+        return name
+    if kind == "var":
+        return f"env[{node[1]!r}]"
+    if kind == "neg":
+        return f"(-{_to_source(node[1], consts)})"
+    return f"({_to_source(node[2], consts)} {node[1]} {_to_source(node[3], consts)})"
+
+
+def _to_function(tree):
+    """
+    Compiles the tree to a single Python code object, so evaluation runs as
+    straight-line bytecode with no per-node calls or dictionary dispatch.
+    """
+    consts = {}
+    body = _to_source(tree, consts)
+    code = compile(f"lambda env: {body}", "<expression>", "eval")
+    return eval(code, {"__builtins__": {}, **consts})
+
+
+class CompiledExpression:
+    """
+    A parsed expression, ready to be evaluated many times.
+    Call it with variables as keywords, or a mapping via evaluate().
+    """
+
+    def __init__(self, source):
+        self.source = source
+        try:
+            tree = _fold(_Parser(tokenize(source)).parse())
+            self.variables = frozenset(_variables(tree))
+            self._func = _to_function(tree)
+        except (SyntaxError, RecursionError, MemoryError) as e:
+            # parser recursion or Python's own compiler limits on very deep nesting
+            raise ExpressionError("Expression is too deeply nested") from e
+        self._names = tuple(sorted(self.variables))
+
+    def __repr__(self):
+        return f"CompiledExpression({self.source!r})"
+
+    def _check(self, env):
+        missing = self.variables.difference(env)
+        if missing:
+            raise ExpressionError(f"Undefined variable(s): {', '.join(sorted(missing))}")
+
+    def evaluate(self, env=None):
+        env = env or {}
+        try:
+            return self._func(env)
+        except KeyError:
+            self._check(env)
+            raise
+
+    def __call__(self, **env):
+        return self.evaluate(env)
+
+    def evaluate_columns(self, columns=None, **kwargs):
+        """
+        Evaluates over whole columns in one pass: each variable is an array
+        (or scalar) and every operator is applied once per column via NumPy.
+        Errors follow IEEE rules instead of raising: x / 0 -> inf, 0 / 0 -> nan.
+        """
+        import numpy as np
+
+        env = dict(columns or {}, **kwargs)
+        self._check(env)
+        arrays = {name: np.asarray(env[name], dtype=float) for name in self.variables}
+        with np.errstate(all="ignore"):
+            result = self._func(arrays)
+        shape = np.broadcast_shapes(*(a.shape for a in arrays.values())) if arrays else ()
+        return np.broadcast_to(np.asarray(result, dtype=float), shape)
+
+
+@functools.lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_expression(source):
+    """Parses and compiles `source`; repeated sources come from an LRU cache."""
+    return CompiledExpression(source)
+
+
+@functools.lru_cache(maxsize=RESULT_CACHE_SIZE)
+def _cached_result(source, bindings):
+    return compile_expression(source).evaluate(dict(bindings))
+
+
+def evaluate(source, variables=None):
+    """
+    Evaluates `source` with `variables`. Results are memoized on the source
+    and the values of the variables it actually uses.
+    """
+    compiled = compile_expression(source)
+    variables = variables or {}
+    try:
+        bindings = tuple([(name, variables[name]) for name in compiled._names])
+    except KeyError:
+        compiled._check(variables)
+        raise
+    return _cached_result(source, bindings)
+
+
+def split_assignment(line):
+    """'x = 2 * y' -> ('x', '2 * y'); anything else -> (None, line)."""
+    match = ASSIGN_RE.match(line)
+    if match:
+        return match.group(1), match.group(2)
+    return None, line
+
+
+def cache_info():
+    return {"compiled": compile_expression.cache_info(), "results": _cached_result.cache_info()}
+
+
+def clear_caches():
+    compile_expression.cache_clear()
+    _cached_result.cache_clear()
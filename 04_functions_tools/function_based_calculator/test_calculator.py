@@ -0,0 +1,46 @@
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from Calculator import calculate, calculate_expression, logger
+
+HERE = Path(__file__).resolve().parent
+
+
+def test_import_creates_no_log_file_or_thread(tmp_path):
+    code = ("import sys, threading; sys.path.insert(0, sys.argv[1]); import Calculator; "
+            "Calculator.calculate(1, 0, '/'); print(threading.active_count())")
+    out = subprocess.run([sys.executable, "-c", code, str(HERE)], cwd=tmp_path,
+                         capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "1"
+    assert out.stderr == ""
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_repl_logs_to_file(tmp_path):
+    out = subprocess.run([sys.executable, str(HERE / "Calculator.py")], cwd=tmp_path,
+                         input="x = 2 + 3\nx / 0\nexit\n", capture_output=True, text=True, check=True)
+    assert "Goodbye" in out.stdout
+    log = (tmp_path / "calculator.log").read_text(encoding="utf-8")
+    assert "INFO - 2 + 3 = 5.0" in log
+    assert "ERROR - Division by zero attempted." in log
+
+
+def test_repl_and_calculate_share_one_logging_path():
+    records = []
+    handler = logging.Handler()
+    handler.emit = lambda record: records.append((record.levelname, record.getMessage()))
+    logger.addHandler(handler)
+    try:
+        assert calculate(2, 3, '*') == 6
+        assert calculate_expression(" x * 3 ", {"x": 2}) == 6
+        with pytest.raises(ZeroDivisionError):
+            calculate_expression("x / 0", {"x": 2})
+        assert calculate(1, 0, '/') == "❌ Error: Division by zero."
+    finally:
+        logger.removeHandler(handler)
+    assert records == [("INFO", "2 * 3 = 6"), ("INFO", "x * 3 = 6.0"),
+                       ("ERROR", "Division by zero attempted."), ("ERROR", "Division by zero attempted.")]
@@ -0,0 +1,35 @@
+import pytest
+
+from expression import ExpressionError, compile_expression, evaluate, split_assignment
+
+
+def test_evaluate_matches_python():
+    assert evaluate("a * b + a / b - 2", {"a": 6, "b": 3}) == 6 * 3 + 6 / 3 - 2
+    assert evaluate("-2 ** 2") == -4
+    assert evaluate("(1 + 2) * x % 5 // 2", {"x": 7}) == (1 + 2) * 7 % 5 // 2
+
+
+def test_errors_are_expression_errors():
+    with pytest.raises(ExpressionError):
+        evaluate("1 +")
+    with pytest.raises(ExpressionError):
+        evaluate("x + 1", {})
+    with pytest.raises(ZeroDivisionError):
+        evaluate("1 / 0")
+
+
+@pytest.mark.parametrize("source", [
+    "-" * 250 + "x",                    # Python's compiler: too many nested parentheses
+    "(" * 5000 + "x" + ")" * 5000,      # parser recursion
+    "-" * 50_000 + "x",
+])
+def test_deep_nesting_raises_expression_error(source):
+    with pytest.raises(ExpressionError):
+        evaluate(source, {"x": 1})
+    with pytest.raises(ExpressionError):
+        compile_expression(source)
+
+
+def test_split_assignment():
+    assert split_assignment("x = 2 * y") == ("x", " 2 * y")
+    assert split_assignment("x == 2") == (None, "x == 2")
@@ -1,53 +1,65 @@
-import time
-from collections import Counter
-from contextlib import contextmanager
 import math
+from collections import Counter
 
+import numpy_stats
+from instrument import instrumented, timed
+from stream_stats import RunningStats
 
-def logger(func):
-    def wrapper(*args, **kwargs):
-        print(f"📌 Function '{func.__name__}' called with arguments: {args}")
-        result = func(*args, **kwargs)
-        print(f"✅ Result: {result}\n")
-        return result
-    return wrapper
+# Kept under their old names; both record into instrument.registry instead of
+# printing. logger is a no-op unless STATS_INSTRUMENT=1; timer always records.
+logger = instrumented
 
 
-@contextmanager
 def timer(task_name="Task"):
-    start = time.time()
-    yield
-    end = time.time()
-    print(f"⏱️ {task_name} completed in {end - start:.4f} seconds.\n")
+    return timed(task_name)
 
 
+def _running(data):
+    acc = RunningStats()
+    for x in data:
+        acc.update(x)
+    return acc
 
 @logger
 def mean(data):
     """
-    Calculates the mean of a list of numbers.
+    Calculates the mean of a list of numbers; iterators are consumed in a
+    single pass.
     """
+    if numpy_stats.is_array_like(data):
+        return numpy_stats.mean(data)
+    if not hasattr(data, "__len__"):
+        return _running(data).mean
     return sum(data) / len(data)
 
 @logger
 def median(data):
     """
-    Returns the median value from a list.
+    Returns the exact median value from an iterable.
+    For a bounded-memory estimate over a stream use stream_stats.summarize().
     """
+    if numpy_stats.is_array_like(data):
+        return numpy_stats.median(data)
     sorted_data = sorted(data)
     n = len(sorted_data)
+    if n == 0:
+        raise ValueError("median of empty data")
     mid = n // 2
     if n % 2 == 0:
         return (sorted_data[mid - 1] + sorted_data[mid]) / 2
-    else:
-        return sorted_data[mid]
+    return sorted_data[mid]
 
 @logger
 def mode(data):
     """
-    Returns the mode of the list.
+    Returns the mode of the iterable (a list when several values tie).
+    For bounded-memory heavy hitters over a stream use stream_stats.HeavyHitters.
     """
+    if numpy_stats.is_array_like(data):
+        return numpy_stats.mode(data)
     freq = Counter(data)
+    if not freq:
+        raise ValueError("mode of empty data")
     max_freq = max(freq.values())
     modes = [k for k, v in freq.items() if v == max_freq]
     return modes if len(modes) > 1 else modes[0]
@@ -55,9 +67,16 @@ def mode(data):
 @logger
 def variance(data):
     """
-    Returns the sample variance of the list.
+    Returns the sample variance of a list; iterators are consumed in a
+    single pass (Welford).
     """
-    m = mean(data)
+    if numpy_stats.is_array_like(data):
+        return numpy_stats.variance(data)
+    if not hasattr(data, "__len__"):
+        return _running(data).variance
+    if len(data) < 2:
+        raise ZeroDivisionError("variance needs at least two data points")
+    m = sum(data) / len(data)
     return sum((x - m) ** 2 for x in data) / (len(data) - 1)
 
 @logger
@@ -65,4 +84,8 @@ def std_dev(data):
     """
     Returns the standard deviation.
     """
+    if numpy_stats.is_array_like(data):
+        return numpy_stats.std_dev(data)
+    if not hasattr(data, "__len__"):
+        return _running(data).std_dev
     return math.sqrt(variance(data))
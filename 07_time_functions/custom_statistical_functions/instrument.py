@@ -0,0 +1,208 @@
+import functools
+import json
+import math
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+# STATS_INSTRUMENT=1 turns instrumentation on. It is read when a function is
+# decorated: with it off, @instrumented returns the original function untouched,
+# so disabled instrumentation costs nothing per call.
+ENABLED = os.environ.get("STATS_INSTRUMENT", "0").lower() not in ("", "0", "false", "no")
+
+SUB_BUCKETS = 8       # histogram resolution: 8 buckets per power of two (~9% error)
+MAX_ARG_SHAPES = 20   # distinct argument summaries kept per function
+
+_local = threading.local()
+_lock = threading.Lock()
+_recording = True
+
+
+def summarize_arg(value):
+    """
+    Short description of an argument by type and size instead of its full repr.
+    """
+    name = type(value).__name__
+    shape = getattr(value, "shape", None)
+    if shape is not None:
+        return f"{name}(shape={tuple(shape)})"
+    if hasattr(value, "__len__"):
+        return f"{name}(len={len(value)})"
+    if isinstance(value, (int, float, bool)) or value is None:
+        return repr(value)
+    return name
+
+
+class Histogram:
+    """
+    Log-bucketed latency histogram with bounded memory.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = Counter()
+
+    def add(self, ns):
+        self.count += 1
+        self.total_ns += ns
+        self.max_ns = max(self.max_ns, ns)
+        self.buckets[int(math.log2(ns) * SUB_BUCKETS) if ns > 0 else 0] += 1
+
+    def percentile(self, p):
+        if self.count == 0:
+            return 0
+        rank = p / 100 * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                # upper edge of the bucket, capped by the largest observation
+                return min(2 ** ((bucket + 1) / SUB_BUCKETS), self.max_ns)
+        return self.max_ns
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / self.count / 1e3 if self.count else 0,
+            "p50_us": self.percentile(50) / 1e3,
+            "p99_us": self.percentile(99) / 1e3,
+            "max_us": self.max_ns / 1e3,
+        }
+
+
+class Registry:
+    """
+    Collects timings per name and per call stack (for flamegraphs).
+    """
+
+    def __init__(self):
+        self.histograms = defaultdict(Histogram)
+        self.arg_shapes = defaultdict(Counter)
+        self.stacks = Counter()
+
+    def record(self, name, ns, stack=None, args=None):
+        with _lock:
+            self.histograms[name].add(ns)
+            if stack:
+                self.stacks[";".join(stack)] += ns
+            if args is not None:
+                shapes = self.arg_shapes[name]
+                if args in shapes or len(shapes) < MAX_ARG_SHAPES:
+                    shapes[args] += 1
+
+    def clear(self):
+        with _lock:
+            self.histograms.clear()
+            self.arg_shapes.clear()
+            self.stacks.clear()
+
+    def to_dict(self):
+        with _lock:
+            return {
+                name: dict(hist.to_dict(), args=dict(self.arg_shapes.get(name, {})))
+                for name, hist in self.histograms.items()
+            }
+
+    def dump_json(self, path=None):
+        """
+        JSON report of all histograms; written to `path` if given.
+        """
+        text = json.dumps(self.to_dict(), indent=2)
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def dump_folded(self, path=None):
+        """
+        Folded-stack output ("outer;inner <microseconds>") for flamegraph.pl/speedscope.
+        Each line carries the frame's self time (children subtracted).
+        """
+        with _lock:
+            self_ns = dict(self.stacks)
+            for stack, ns in self.stacks.items():
+                parent = stack.rpartition(";")[0]
+                if parent in self_ns:
+                    self_ns[parent] -= ns
+            lines = [f"{stack} {max(ns, 0) // 1000}" for stack, ns in sorted(self_ns.items())]
+        text = "\n".join(lines)
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        return text
+
+
+registry = Registry()
+
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+@contextmanager
+def recording(enabled=True):
+    """
+    Temporarily pause or resume recording for already instrumented functions.
+    """
+    global _recording
+    previous = _recording
+    _recording = enabled
+    try:
+        yield
+    finally:
+        _recording = previous
+
+
+def instrumented(func=None, *, name=None):
+    """
+    Decorator recording call latency and argument shapes into the registry.
+    A no-op (returns func itself) when instrumentation is disabled.
+    """
+    if func is None:
+        return functools.partial(instrumented, name=name)
+    if not ENABLED:
+        return func
+    label = name or func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _recording:
+            return func(*args, **kwargs)
+        stack = _stack()
+        stack.append(label)
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            summary = ", ".join(summarize_arg(a) for a in args)
+            registry.record(label, elapsed, tuple(stack), summary)
+            stack.pop()
+    return wrapper
+
+
+@contextmanager
+def timed(name):
+    """
+    Times a block with perf_counter_ns and records it under `name`.
+    Always records, regardless of ENABLED, since it is used explicitly.
+    """
+    if not _recording:
+        yield
+        return
+    stack = _stack()
+    stack.append(name)
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter_ns() - start
+        registry.record(name, elapsed, tuple(stack))
+        stack.pop()
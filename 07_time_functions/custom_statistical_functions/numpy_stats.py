@@ -0,0 +1,96 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; custom_stats falls back to pure Python
+    np = None
+
+
+def is_array_like(data):
+    """
+    True for NumPy arrays and objects exposing __array__ (pandas Series/DataFrame).
+    Plain lists and generators stay on the pure-Python path.
+    """
+    if np is None:
+        return False
+    return isinstance(data, np.ndarray) or hasattr(data, "__array__")
+
+
+def _as_array(data):
+    arr = np.asarray(data)
+    if arr.ndim not in (1, 2):
+        raise ValueError("expected a 1-D array or a 2-D array of columns")
+    if arr.shape[0] == 0:
+        raise ZeroDivisionError("statistics of empty data")
+    return arr
+
+
+def _scalar(value):
+    # 0-d results go back to plain Python numbers, 1-D per-column results stay arrays
+    return value.item() if np.ndim(value) == 0 else value
+
+
+def mean(data):
+    """
+    Mean of a 1-D array, or of each column of a 2-D array.
+    """
+    return _scalar(_as_array(data).mean(axis=0))
+
+
+def median(data):
+    """
+    Median via np.partition (O(n) selection instead of a full sort).
+    """
+    arr = _as_array(data)
+    n = arr.shape[0]
+    mid = n // 2
+    if n % 2:
+        return _scalar(np.partition(arr, mid, axis=0)[mid])
+    part = np.partition(arr, [mid - 1, mid], axis=0)
+    return _scalar((part[mid - 1] + part[mid]) / 2)
+
+
+def _column_mode(col):
+    values, first, counts = np.unique(col, return_index=True, return_counts=True)
+    tied = np.flatnonzero(counts == counts.max())
+    # tied modes in order of first occurrence, like the pure-Python path
+    modes = values[tied[np.argsort(first[tied])]].tolist()
+    return modes if len(modes) > 1 else modes[0]
+
+
+def mode(data):
+    """
+    Mode of a 1-D array; a list with one mode per column for 2-D input.
+    """
+    arr = _as_array(data)
+    if arr.ndim == 1:
+        return _column_mode(arr)
+    return [_column_mode(arr[:, j]) for j in range(arr.shape[1])]
+
+
+def variance(data):
+    """
+    Sample variance (ddof=1), vectorized over columns for 2-D input.
+    """
+    arr = _as_array(data)
+    if arr.shape[0] < 2:
+        raise ZeroDivisionError("variance needs at least two data points")
+    return _scalar(arr.var(axis=0, ddof=1))
+
+
+def std_dev(data):
+    arr = _as_array(data)
+    if arr.shape[0] < 2:
+        raise ZeroDivisionError("variance needs at least two data points")
+    return _scalar(arr.std(axis=0, ddof=1))
+
+
+def describe(data):
+    """
+    All five statistics in one call; per column when given a 2-D array.
+    """
+    return {
+        "mean": mean(data),
+        "median": median(data),
+        "mode": mode(data),
+        "variance": variance(data),
+        "std_dev": std_dev(data),
+    }
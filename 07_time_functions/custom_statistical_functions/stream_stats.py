@@ -0,0 +1,284 @@
+import math
+
+
+class RunningStats:
+    """
+    Single-pass mean/variance accumulator (Welford's algorithm).
+    Two partial states can be combined with merge().
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, x):
+        self.count += 1
+        delta = x - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (x - self._mean)
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self._mean, self._m2 = other.count, other._mean, other._m2
+            return self
+        n = self.count + other.count
+        delta = other._mean - self._mean
+        self._mean += delta * other.count / n
+        self._m2 += other._m2 + delta * delta * self.count * other.count / n
+        self.count = n
+        return self
+
+    @property
+    def mean(self):
+        if self.count == 0:
+            raise ZeroDivisionError("mean of empty data")
+        return self._mean
+
+    @property
+    def variance(self):
+        """
+        Sample variance (n - 1 in the denominator).
+        """
+        if self.count < 2:
+            raise ZeroDivisionError("variance needs at least two data points")
+        return self._m2 / (self.count - 1)
+
+    @property
+    def std_dev(self):
+        return math.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """
+    Mergeable streaming quantile estimator (merging t-digest).
+    Values are buffered and folded into at most ~compression centroids,
+    so memory stays bounded. Until the first compression every value is
+    kept, which makes results on small inputs exact.
+    """
+
+    def __init__(self, compression=100, buffer_size=None):
+        self.compression = compression
+        self.buffer_size = buffer_size or 5 * compression
+        self.count = 0
+        self.exact = True
+        self._centroids = []  # sorted list of [mean, weight]
+        self._buffer = []
+
+    def update(self, x):
+        self._buffer.append(x)
+        self.count += 1
+        if len(self._buffer) >= self.buffer_size:
+            self._compress()
+
+    def merge(self, other):
+        self._centroids = sorted(self._centroids + [c[:] for c in other._centroids])
+        self._buffer.extend(other._buffer)
+        self.count += other.count
+        self.exact = self.exact and other.exact
+        if not self.exact or len(self._buffer) >= self.buffer_size:
+            self._compress()
+        return self
+
+    def _k(self, q):
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _k_inv(self, k):
+        return (math.sin(k * 2 * math.pi / self.compression) + 1) / 2
+
+    def _compress(self):
+        points = sorted(self._centroids + [[x, 1] for x in self._buffer])
+        self._buffer = []
+        if not points:
+            return
+        total = sum(w for _, w in points)
+        merged = [points[0][:]]
+        w_before = 0
+        q_limit = self._k_inv(self._k(0) + 1)
+        for m, w in points[1:]:
+            cur = merged[-1]
+            if (w_before + cur[1] + w) / total <= q_limit:
+                cur[0] += (m - cur[0]) * w / (cur[1] + w)
+                cur[1] += w
+            else:
+                w_before += cur[1]
+                q_limit = self._k_inv(self._k(w_before / total) + 1)
+                merged.append([m, w])
+        self._centroids = merged
+        self.exact = self.exact and all(w == 1 for _, w in merged)
+
+    def quantile(self, q):
+        if self.count == 0:
+            raise ValueError("quantile of empty data")
+        if self.exact:
+            values = sorted([m for m, _ in self._centroids] + self._buffer)
+            pos = q * (len(values) - 1)
+            lo = int(pos)
+            hi = min(lo + 1, len(values) - 1)
+            if lo == hi or pos == lo:
+                return values[lo]
+            return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+        if self._buffer:
+            self._compress()
+        centroids = self._centroids
+        target = q * self.count
+        cumulative = 0
+        prev_center, prev_mean = None, None
+        for m, w in centroids:
+            center = cumulative + w / 2
+            if target <= center:
+                if prev_center is None:
+                    return m
+                frac = (target - prev_center) / (center - prev_center)
+                return prev_mean + (m - prev_mean) * frac
+            prev_center, prev_mean = center, m
+            cumulative += w
+        return centroids[-1][0]
+
+    @property
+    def median(self):
+        return self.quantile(0.5)
+
+
+class HeavyHitters:
+    """
+    Bounded-memory frequency counter (Misra-Gries summary).
+    Keeps at most `capacity` counters; counts are exact while the number
+    of distinct values stays within capacity.
+
+    Counters are stored relative to a shared offset and grouped by stored
+    value, so "decrement every counter" is one offset bump plus dropping the
+    group that reached zero: O(1) per update.
+    """
+
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.exact = True
+        self.count = 0
+        self._offset = 0
+        self._stored = {}                 # value -> count + offset
+        self._groups = {}                 # stored count -> values
+
+    @property
+    def counts(self):
+        return {k: c - self._offset for k, c in self._stored.items()}
+
+    def _set(self, key, stored):
+        groups = self._groups
+        old = self._stored.get(key)
+        if old is not None:
+            group = groups[old]
+            if len(group) == 1:
+                del groups[old]
+            else:
+                group.discard(key)
+        self._stored[key] = stored
+        group = groups.get(stored)
+        if group is None:
+            groups[stored] = {key}
+        else:
+            group.add(key)
+
+    def update(self, x):
+        self.count += 1
+        stored = self._stored.get(x)
+        if stored is not None:
+            self._set(x, stored + 1)
+        elif len(self._stored) < self.capacity:
+            self._set(x, self._offset + 1)
+        else:
+            # x and every counter lose one; counters reaching zero are dropped
+            self.exact = False
+            self._offset += 1
+            for key in self._groups.pop(self._offset, ()):
+                del self._stored[key]
+
+    def _load(self, counts):
+        self._offset = 0
+        self._stored = {}
+        self._groups = {}
+        for key, c in counts.items():
+            self._set(key, c)
+
+    def merge(self, other):
+        counts = self.counts
+        for key, c in other.counts.items():
+            counts[key] = counts.get(key, 0) + c
+        self.count += other.count
+        self.exact = self.exact and other.exact
+        if len(counts) > self.capacity:
+            self.exact = False
+            cutoff = sorted(counts.values(), reverse=True)[self.capacity]
+            counts = {k: c - cutoff for k, c in counts.items() if c > cutoff}
+        self._load(counts)
+        return self
+
+    def modes(self):
+        """
+        Values with the highest count. Empty if no value was frequent
+        enough to survive the summary.
+        """
+        if self.count == 0:
+            raise ValueError("mode of empty data")
+        counts = self.counts
+        if not counts:
+            return []
+        max_freq = max(counts.values())
+        return [k for k, c in counts.items() if c == max_freq]
+
+    def most_common(self, n=None):
+        items = sorted(self.counts.items(), key=lambda kv: kv[1], reverse=True)
+        return items if n is None else items[:n]
+
+
+class StreamStats:
+    """
+    Feeds every value through all accumulators in one pass.
+    Accepts any iterable (lists, generators, file readers...).
+    """
+
+    def __init__(self, compression=100, mode_capacity=1000):
+        self.moments = RunningStats()
+        self.quantiles = QuantileSketch(compression)
+        self.frequencies = HeavyHitters(mode_capacity)
+
+    def update(self, x):
+        self.moments.update(x)
+        self.quantiles.update(x)
+        self.frequencies.update(x)
+
+    def extend(self, data):
+        for x in data:
+            self.update(x)
+        return self
+
+    def merge(self, other):
+        self.moments.merge(other.moments)
+        self.quantiles.merge(other.quantiles)
+        self.frequencies.merge(other.frequencies)
+        return self
+
+    @property
+    def count(self):
+        return self.moments.count
+
+    def result(self):
+        modes = self.frequencies.modes()
+        return {
+            "count": self.count,
+            "mean": self.moments.mean,
+            "median": self.quantiles.median,
+            "mode": modes if len(modes) > 1 else (modes[0] if modes else None),
+            "variance": self.moments.variance if self.count > 1 else float("nan"),
+            "std_dev": self.moments.std_dev if self.count > 1 else float("nan"),
+        }
+
+
+def summarize(data, compression=100, mode_capacity=1000):
+    """
+    Computes mean, median, mode, variance and std dev in a single pass.
+    """
+    return StreamStats(compression, mode_capacity).extend(data).result()
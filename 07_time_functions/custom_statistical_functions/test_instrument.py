@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+import instrument
+from instrument import Histogram, Registry, SUB_BUCKETS, instrumented, recording, timed
+
+BUCKET_ERROR = 2 ** (1 / SUB_BUCKETS) - 1   # relative width of one bucket
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    instrument.registry.clear()
+    yield
+    instrument.registry.clear()
+
+
+def test_histogram_percentiles_within_bucket_error():
+    hist = Histogram()
+    for ns in range(1, 10_001):
+        hist.add(ns * 1000)
+    assert hist.count == 10_000
+    for p in (50, 90, 99):
+        exact = p / 100 * 10_000 * 1000
+        assert exact <= hist.percentile(p) <= exact * (1 + BUCKET_ERROR)
+    assert hist.percentile(100) == hist.max_ns == 10_000_000
+    assert Histogram().percentile(50) == 0
+
+
+def test_histogram_caps_at_largest_observation():
+    hist = Histogram()
+    for _ in range(5):
+        hist.add(1000)
+    assert hist.percentile(99) == 1000
+    assert hist.to_dict()["p50_us"] == 1.0
+
+
+def test_folded_stacks_report_self_time():
+    reg = Registry()
+    reg.record("outer", 5000, ("outer",))
+    reg.record("inner", 2000, ("outer", "inner"))
+    assert reg.dump_folded() == "outer 3\nouter;inner 2"
+    assert set(json.loads(reg.dump_json())) == {"outer", "inner"}
+
+
+def test_timed_records_nested_blocks():
+    with timed("outer"):
+        with timed("inner"):
+            pass
+    report = instrument.registry.to_dict()
+    assert report["outer"]["count"] == report["inner"]["count"] == 1
+    assert "outer;inner" in instrument.registry.dump_folded()
+    with recording(False), timed("paused"):
+        pass
+    assert "paused" not in instrument.registry.to_dict()
+
+
+def test_instrumented_is_a_no_op_when_disabled(monkeypatch):
+    def total(values):
+        return sum(values)
+
+    monkeypatch.setattr(instrument, "ENABLED", False)
+    assert instrumented(total) is total
+
+    monkeypatch.setattr(instrument, "ENABLED", True)
+    wrapped = instrumented(name="total")(total)
+    assert wrapped([1, 2, 3]) == 6
+    assert instrument.registry.to_dict()["total"]["args"] == {"list(len=3)": 1}
+
+
+def test_custom_stats_timer_keeps_its_default_name():
+    from custom_stats import timer
+
+    with timer():
+        pass
+    with timer("Load"):
+        pass
+    assert set(instrument.registry.to_dict()) == {"Task", "Load"}
@@ -1,10 +1,138 @@
+import os
+import statistics
+
+import pytest
+
 from custom_stats import mean, median, mode, variance, std_dev, timer
 
 data = [12, 15, 12, 15, 17, 18, 15, 15, 14]
 
-with timer("Statistics Analysis"):
-    mean(data)
-    median(data)
-    mode(data)
-    variance(data)
-    std_dev(data)
+np = pytest.importorskip("numpy")
+
+try:
+    import pytest_benchmark  # noqa: F401
+    HAS_BENCHMARK = True
+except ImportError:
+    HAS_BENCHMARK = False
+
+needs_benchmark = pytest.mark.skipif(not HAS_BENCHMARK, reason="pytest-benchmark is not installed")
+
+# Benchmark sizes run from 1e3 up to 10**STATS_BENCH_MAX_EXP (default 1e5).
+# Set STATS_BENCH_MAX_EXP=8 to include the 1e8 case; it needs several GB of RAM.
+MAX_EXP = int(os.environ.get("STATS_BENCH_MAX_EXP", "5"))
+SIZES = [10 ** e for e in range(3, MAX_EXP + 1)]
+FUNCS = [mean, median, variance, std_dev]
+
+
+def test_python_path_matches_statistics():
+    assert mean(data) == pytest.approx(statistics.mean(data))
+    assert median(data) == statistics.median(data)
+    assert mode(data) == statistics.mode(data)
+    assert variance(data) == pytest.approx(statistics.variance(data))
+    assert std_dev(data) == pytest.approx(statistics.stdev(data))
+
+
+def test_python_median_and_mode_are_exact():
+    values = np.random.default_rng(0).random(10_001).tolist()
+    assert median(values) == statistics.median(values)
+    assert median(values[:-1]) == statistics.median(values[:-1])
+    assert mode([0, 0] + list(range(1, 2000))) == 0
+    assert mode(list(range(2000))) == list(range(2000))
+    with pytest.raises(ValueError):
+        mode([])
+
+
+def test_heavy_hitters_matches_misra_gries():
+    from stream_stats import HeavyHitters
+
+    def reference(values, capacity):
+        counts = {}
+        for x in values:
+            if x in counts:
+                counts[x] += 1
+            elif len(counts) < capacity:
+                counts[x] = 1
+            else:
+                counts = {k: c - 1 for k, c in counts.items() if c > 1}
+        return counts
+
+    values = np.random.default_rng(1).integers(0, 40, size=2000).tolist()
+    for capacity in (1, 5, 20, 50):
+        hh = HeavyHitters(capacity)
+        for x in values:
+            hh.update(x)
+        assert hh.counts == reference(values, capacity)
+
+
+def test_numpy_path_matches_python_path():
+    arr = np.array(data)
+    for func in FUNCS + [mode]:
+        assert func(arr) == pytest.approx(func(data))
+
+
+def test_tied_modes_keep_first_occurrence_order_on_both_paths():
+    data = [3, 1, 3, 1, 2]
+    assert mode(data) == [3, 1]
+    assert mode(np.array(data)) == [3, 1]
+    matrix = np.array([[5, 9], [2, 9], [5, 4], [2, 4]])
+    assert mode(matrix) == [[5, 2], [9, 4]]
+
+
+def test_iterators_use_the_single_pass_path():
+    sample = [2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0]
+    assert mean(iter(sample)) == pytest.approx(mean(sample))
+    assert variance(iter(sample)) == pytest.approx(variance(sample))
+    assert std_dev(iter(sample)) == pytest.approx(std_dev(sample))
+
+
+def test_numpy_even_length_median():
+    assert median(np.array([4, 1, 3, 2])) == 2.5
+
+
+def test_numpy_per_column_stats():
+    matrix = np.array([[1, 10], [2, 20], [2, 30], [5, 40]])
+    assert mean(matrix) == pytest.approx([2.5, 25.0])
+    assert median(matrix) == pytest.approx([2.0, 25.0])
+    assert variance(matrix) == pytest.approx([variance(matrix[:, 0].tolist()),
+                                              variance(matrix[:, 1].tolist())])
+    assert mode(matrix) == [2, [10, 20, 30, 40]]
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda n: f"n={n:.0e}")
+def sample(request):
+    rng = np.random.default_rng(42)
+    return rng.normal(size=request.param)
+
+
+# Both paths compute the same exact statistics (sorted() vs np.partition for
+# the median), so the benchmarks below compare like with like.
+@pytest.mark.parametrize("func", FUNCS, ids=lambda f: f.__name__)
+def test_bench_paths_agree(sample, func):
+    assert func(sample.tolist()) == pytest.approx(func(sample), rel=1e-9)
+
+
+@needs_benchmark
+@pytest.mark.parametrize("func", FUNCS, ids=lambda f: f.__name__)
+def test_bench_python(benchmark, sample, func):
+    values = sample.tolist()
+    benchmark.group = f"{func.__name__}-n={len(values):.0e}"
+    benchmark.pedantic(func, args=(values,), rounds=1, iterations=1)
+
+
+@needs_benchmark
+@pytest.mark.parametrize("func", FUNCS, ids=lambda f: f.__name__)
+def test_bench_numpy(benchmark, sample, func):
+    benchmark.group = f"{func.__name__}-n={sample.size:.0e}"
+    benchmark(func, sample)
+
+
+if __name__ == "__main__":
+    from instrument import registry
+
+    with timer("Statistics Analysis"):
+        mean(data)
+        median(data)
+        mode(data)
+        variance(data)
+        std_dev(data)
+    print(registry.dump_json())
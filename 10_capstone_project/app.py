@@ -7,28 +7,30 @@
 
 import io
 import json
+import sys
+from pathlib import Path
 import numpy as np
 import pandas as pd
 import streamlit as st
-import seaborn as sns
-import matplotlib.pyplot as plt
 
 from urllib.parse import urlparse
 
-from sklearn.model_selection import train_test_split
-from sklearn.compose import ColumnTransformer
-from sklearn.pipeline import Pipeline
-from sklearn.impute import SimpleImputer
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
-from sklearn.metrics import (
-    accuracy_score, f1_score, roc_auc_score, confusion_matrix,
-    classification_report, r2_score, mean_absolute_error, mean_squared_error
-)
-from sklearn.linear_model import LogisticRegression, Ridge, LinearRegression
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
-from sklearn.cluster import KMeans
-from sklearn.decomposition import PCA
-from sklearn.metrics import silhouette_score
+# only what the Data tab needs; matplotlib, seaborn and scikit-learn are imported
+# inside the tab functions that use them (see startup.py)
+from eda_profile import APPROX_ROW_THRESHOLD, TOP_K, ProfileCache, dataset_fingerprint
+from model_cache import ModelCache, model_key
+from registry import DatasetRegistry
+from startup import PREWARM, prewarm
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "shared"))
+try:
+    import columnar_cache
+except ImportError:
+    columnar_cache = None
+try:
+    import compact
+except ImportError:
+    compact = None
 
 
 st.set_page_config(
@@ -52,41 +54,73 @@ def is_url(s: str) -> bool:
     except Exception:
         return False
 
-@st.cache_data(show_spinner=True)
-def load_data(source: str, file_bytes: bytes | None = None) -> pd.DataFrame:
+@st.cache_resource
+def get_registry() -> DatasetRegistry:
+    # one registry per process; built-in datasets are fetched in the background at startup
+    registry = DatasetRegistry(GITHUB_DATASETS)
+    registry.prefetch()
+    return registry
+
+def read_source(source: str, file_bytes: bytes | None = None) -> pd.DataFrame:
     if source in GITHUB_DATASETS:
-        return pd.read_csv(GITHUB_DATASETS[source])
+        return get_registry().load(source)
     if source == "Upload CSV" and file_bytes is not None:
+        if columnar_cache is not None:
+            # keyed on the upload's content hash, so it survives app restarts
+            return columnar_cache.read_csv(file_bytes)
         return pd.read_csv(io.BytesIO(file_bytes))
     if is_url(source):
-        return pd.read_csv(source)
+        return get_registry().load(source)
     raise ValueError("Invalid data source.")
 
-def split_feature_types(df: pd.DataFrame):
-    num_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-    cat_cols = df.select_dtypes(exclude=[np.number]).columns.tolist()
-    return num_cols, cat_cols
+@st.cache_data(show_spinner=True)
+def load_data(source: str, file_bytes: bytes | None = None,
+              compact_dtypes: bool = False) -> tuple[pd.DataFrame, pd.DataFrame | None, str]:
+    # (frame, shared/compact.py memory report or None, content fingerprint);
+    # the fingerprint is computed once per load here, not on every rerun
+    df = read_source(source, file_bytes)
+    compaction = None
+    if compact_dtypes and compact is not None:
+        df, compaction = compact.compact(df)
+    return df, compaction, dataset_fingerprint(df)
+
+@st.cache_resource
+def get_profile_cache() -> ProfileCache:
+    return ProfileCache()
+
+def basic_eda(df: pd.DataFrame, fingerprint: str):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    # every aggregate comes from a profile computed once per dataset; reruns only redraw
+    approximate = False
+    if len(df) > APPROX_ROW_THRESHOLD:
+        approximate = not st.toggle("Exact statistics (slow on large data)", value=False)
+    profile = get_profile_cache().get(df, approximate, fingerprint)
+    if profile.approximate:
+        st.info(f"⚡ Approximate EDA: estimates from a uniform sample of {profile.sample_size:,} of "
+                f"{len(df):,} rows. Quantiles are within ±{profile.quantile_rank_error:.2%} rank, the "
+                f"'mean ±95%' column bounds each mean, and category charts show the top {TOP_K} values "
+                f"+ 'other' with 95% error bars. Turn on exact statistics for the full computation.")
 
-def basic_eda(df: pd.DataFrame):
     st.subheader("Shape & Preview")
     c1, c2 = st.columns([1,2])
     with c1:
-        st.write(f"Rows: **{df.shape[0]}**, Columns: **{df.shape[1]}**")
-        st.dataframe(df.head())
+        st.write(f"Rows: **{profile.shape[0]}**, Columns: **{profile.shape[1]}**")
+        st.dataframe(profile.head)
     with c2:
         st.write("Missing values per column")
-        st.dataframe(df.isna().sum().to_frame("missing").sort_values("missing", ascending=False))
+        st.dataframe(profile.missing)
 
-    num_cols, cat_cols = split_feature_types(df)
+    num_cols, cat_cols = profile.num_cols, profile.cat_cols
 
     if num_cols:
         st.subheader("Numerical Summary")
-        st.dataframe(df[num_cols].describe().T)
+        st.dataframe(profile.summary)
 
         st.subheader("Correlation Heatmap (Numerical)")
-        corr = df[num_cols].corr(numeric_only=True)
         fig, ax = plt.subplots(figsize=(8,6))
-        sns.heatmap(corr, annot=False, cmap="Blues", ax=ax)
+        sns.heatmap(profile.corr, annot=False, cmap="Blues", ax=ax)
         st.pyplot(fig)
 
         st.subheader("Distributions (Numerical)")
@@ -95,7 +129,12 @@ def basic_eda(df: pd.DataFrame):
             fig, ax = plt.subplots(figsize=(8,3*len(sel_num)))
             for i, col in enumerate(sel_num, 1):
                 plt.subplot(len(sel_num), 1, i)
-                sns.histplot(df[col].dropna(), kde=True)
+                hist = profile.numeric[col]
+                plt.stairs(hist.counts, hist.edges, fill=True, alpha=0.5)
+                kde = hist.kde()
+                if kde is not None:
+                    plt.plot(*kde)
+                plt.ylabel("Count")
                 plt.title(col)
             plt.tight_layout()
             st.pyplot(fig)
@@ -107,101 +146,110 @@ def basic_eda(df: pd.DataFrame):
             fig, ax = plt.subplots(figsize=(8,3*len(sel_cat)))
             for i, col in enumerate(sel_cat, 1):
                 plt.subplot(len(sel_cat), 1, i)
-                sns.countplot(x=col, data=df)
+                counts = profile.categories[col]
+                plt.bar(counts.index.astype(str), counts.to_numpy(), yerr=profile.category_errors[col],
+                        color=sns.color_palette()[0], capsize=3)
                 plt.xticks(rotation=30, ha='right')
+                plt.ylabel("count")
                 plt.title(col)
             plt.tight_layout()
             st.pyplot(fig)
 
-def build_preprocessor(num_cols, cat_cols, scale_numeric=True):
-    num_steps = [("imputer", SimpleImputer(strategy="median"))]
-    if scale_numeric:
-        num_steps.append(("scaler", StandardScaler()))
-    num_tf = Pipeline(steps=num_steps)
-    cat_tf = Pipeline(steps=[
-        ("imputer", SimpleImputer(strategy="most_frequent")),
-        ("onehot", OneHotEncoder(handle_unknown="ignore"))
-    ])
-    pre = ColumnTransformer(
-        transformers=[
-            ("num", num_tf, num_cols),
-            ("cat", cat_tf, cat_cols)
-        ]
-    )
-    return pre
-
-def train_classification(df: pd.DataFrame):
+@st.cache_resource
+def start_prewarm():
+    # once per process, after the Data tab has been sent to the browser
+    return prewarm()
+
+@st.cache_resource
+def get_model_cache() -> ModelCache:
+    return ModelCache()
+
+def cached_fit(task, df, fingerprint, target, model_name, params, test_size, random_state):
+    # keyed on dataset content + every setting that affects the fit; other widgets never refit
+    key = model_key(fingerprint, task, target, model_name, params, test_size, random_state)
+    from modeling import fit_classification, fit_regression
+
+    fit = fit_classification if task == "classification" else fit_regression
+    with st.spinner(f"Training {model_name}..."):
+        result, source = get_model_cache().get_or_fit(
+            key, lambda: fit(df, target, model_name, params, test_size, int(random_state)))
+    if source != "fit":
+        st.caption(f"⚡ Loaded fitted model from the {source} cache (no retraining).")
+    return result
+
+def compare_all(df: pd.DataFrame, fingerprint: str, target: str, task: str):
+    # k-fold CV of every candidate on a process pool; the leaderboard is cached like a fitted model
+    from compare import compare_models, leaderboard_view
+
+    folds = st.slider("CV folds", 3, 10, 5, 1, key=f"{task}-folds")
+    halving = st.checkbox("Successive halving (prune weak configurations early)", value=True, key=f"{task}-halving")
+    key = model_key(fingerprint, f"compare-{task}", target, "all", {"folds": folds, "halving": halving},
+                    0.0, 42)
+    board, source = get_model_cache().get(key)
+    if board is None and st.button("🏁 Run comparison", key=f"{task}-compare-run"):
+        with st.spinner("Cross-validating all candidates..."):
+            board = compare_models(df, target, task, folds=folds, random_state=42, halving=halving)
+        get_model_cache().put(key, board)
+    if board is not None:
+        if source:
+            st.caption(f"⚡ Leaderboard loaded from the {source} cache.")
+        st.dataframe(leaderboard_view(board))
+
+def train_classification(df: pd.DataFrame, fingerprint: str):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from modeling import CLASSIFIERS
+
     st.subheader("Classification")
     target = st.selectbox("Select target (categorical/binary)", df.columns)
     if target is None:
         return
-    X = df.drop(columns=[target]).copy()
-    y = df[target].copy()
+    y = df[target]
 
     # ensure y is categorical
     if y.dtype.kind in "iuf":  # numeric target likely regression—allow user override
         st.info("Target appears numeric; ensure this is a classification problem (e.g., 0/1).")
 
-    num_cols, cat_cols = split_feature_types(X)
-    pre = build_preprocessor(num_cols, cat_cols, scale_numeric=True)
+    if st.checkbox("Compare all models (k-fold CV)", key="classification-compare"):
+        compare_all(df, fingerprint, target, "classification")
+        return
 
-    model_name = st.selectbox("Model", ["Logistic Regression", "Random Forest Classifier"])
-    if model_name == "Logistic Regression":
-        model = LogisticRegression(max_iter=200, n_jobs=None if hasattr(LogisticRegression, "n_jobs") else None)
-    else:
-        model = RandomForestClassifier(n_estimators=300, random_state=42, n_jobs=-1)
+    model_name = st.selectbox("Model", list(CLASSIFIERS))
+    params = dict(CLASSIFIERS[model_name])
 
     test_size = st.slider("Test size", 0.1, 0.5, 0.2, 0.05)
     random_state = st.number_input("Random state", value=42, step=1)
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size,
-                                                        random_state=int(random_state), stratify=y)
-    pipe = Pipeline(steps=[("pre", pre), ("model", model)])
-    pipe.fit(X_train, y_train)
-    y_pred = pipe.predict(X_test)
-
-    proba_supported = hasattr(pipe, "predict_proba")
-    st.write("**Accuracy**:", round(accuracy_score(y_test, y_pred), 4))
-    try:
-        st.write("**F1 (macro)**:", round(f1_score(y_test, y_pred, average="macro"), 4))
-    except Exception:
-        pass
+    result = cached_fit("classification", df, fingerprint, target, model_name, params, test_size, random_state)
+
+    st.write("**Accuracy**:", round(result["accuracy"], 4))
+    if result["f1_macro"] is not None:
+        st.write("**F1 (macro)**:", round(result["f1_macro"], 4))
 
     # ROC-AUC for binary only
-    if proba_supported and len(np.unique(y_test)) == 2:
-        y_prob = pipe.predict_proba(X_test)[:, 1]
-        try:
-            st.write("**ROC-AUC**:", round(roc_auc_score(y_test, y_prob), 4))
-        except Exception:
-            pass
+    if result["roc_auc"] is not None:
+        st.write("**ROC-AUC**:", round(result["roc_auc"], 4))
 
     st.write("**Confusion Matrix**")
-    cm = confusion_matrix(y_test, y_pred)
     fig, ax = plt.subplots(figsize=(4,3))
-    sns.heatmap(cm, annot=True, fmt='d', cmap="Blues", ax=ax)
+    sns.heatmap(result["confusion_matrix"], annot=True, fmt='d', cmap="Blues", ax=ax)
     st.pyplot(fig)
 
     st.write("**Classification Report**")
-    st.code(classification_report(y_test, y_pred))
+    st.code(result["report"])
 
     # Feature importance (if available)
-    try:
-        model_obj = pipe.named_steps["model"]
-        pre_obj = pipe.named_steps["pre"]
-        if hasattr(model_obj, "feature_importances_"):
-            # map back feature names
-            oh = pre_obj.named_transformers_["cat"].named_steps["onehot"]
-            cat_names = oh.get_feature_names_out(pre_obj.transformers_[1][2])
-            num_names = pre_obj.transformers_[0][2]
-            feat_names = np.concatenate([num_names, cat_names])
-            importances = pd.Series(model_obj.feature_importances_, index=feat_names).sort_values(ascending=False)[:20]
-            st.write("**Top Feature Importances**")
-            fig, ax = plt.subplots(figsize=(7,5))
-            sns.barplot(x=importances.values, y=importances.index, ax=ax)
-            st.pyplot(fig)
-    except Exception:
-        pass
+    importances = result["importances"]
+    if importances is not None:
+        st.write("**Top Feature Importances**")
+        fig, ax = plt.subplots(figsize=(7,5))
+        sns.barplot(x=importances.values, y=importances.index, ax=ax)
+        st.pyplot(fig)
+
+def train_regression(df: pd.DataFrame, fingerprint: str):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from modeling import REGRESSORS
 
-def train_regression(df: pd.DataFrame):
     st.subheader("Regression")
     target = st.selectbox("Select target (numeric)", df.columns)
     if target is None:
@@ -210,42 +258,39 @@ def train_regression(df: pd.DataFrame):
         st.warning("Selected target is not numeric.")
         return
 
-    X = df.drop(columns=[target]).copy()
-    y = df[target].copy()
-    num_cols, cat_cols = split_feature_types(X)
-    pre = build_preprocessor(num_cols, cat_cols, scale_numeric=True)
-
-    model_name = st.selectbox("Model", ["Linear Regression", "Ridge", "Random Forest Regressor"])
-    if model_name == "Linear Regression":
-        model = LinearRegression()
-    elif model_name == "Ridge":
-        alpha = st.slider("Ridge alpha", 0.01, 10.0, 1.0, 0.01)
-        model = Ridge(alpha=alpha, random_state=42)
-    else:
-        n_estimators = st.slider("RF n_estimators", 100, 600, 300, 50)
-        model = RandomForestRegressor(n_estimators=n_estimators, random_state=42, n_jobs=-1)
+    if st.checkbox("Compare all models (k-fold CV)", key="regression-compare"):
+        compare_all(df, fingerprint, target, "regression")
+        return
+
+    model_name = st.selectbox("Model", list(REGRESSORS))
+    params = dict(REGRESSORS[model_name])
+    if model_name == "Ridge":
+        params["alpha"] = st.slider("Ridge alpha", 0.01, 10.0, 1.0, 0.01)
+    elif model_name == "Random Forest Regressor":
+        params["n_estimators"] = st.slider("RF n_estimators", 100, 600, 300, 50)
 
     test_size = st.slider("Test size", 0.1, 0.5, 0.2, 0.05, key="reg-ts")
     random_state = st.number_input("Random state", value=42, step=1, key="reg-rs")
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size,
-                                                        random_state=int(random_state))
-    pipe = Pipeline(steps=[("pre", pre), ("model", model)])
-    pipe.fit(X_train, y_train)
-    y_pred = pipe.predict(X_test)
+    result = cached_fit("regression", df, fingerprint, target, model_name, params, test_size, random_state)
 
-    st.write("**R²**:", round(r2_score(y_test, y_pred), 4))
-    st.write("**MAE**:", round(mean_absolute_error(y_test, y_pred), 4))
-    st.write("**RMSE**:", round(np.sqrt(mean_squared_error(y_test, y_pred)), 4))
+    st.write("**R²**:", round(result["r2"], 4))
+    st.write("**MAE**:", round(result["mae"], 4))
+    st.write("**RMSE**:", round(result["rmse"], 4))
 
     # Pred vs True plot
     fig, ax = plt.subplots(figsize=(5,4))
-    sns.scatterplot(x=y_test, y=y_pred, ax=ax)
+    sns.scatterplot(x=result["y_test"], y=result["y_pred"], ax=ax)
     ax.set_xlabel("True")
     ax.set_ylabel("Predicted")
     ax.set_title("Predicted vs True")
     st.pyplot(fig)
 
-def run_clustering(df: pd.DataFrame):
+def run_clustering(df: pd.DataFrame, fingerprint: str):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from sklearn.impute import SimpleImputer
+    from clustering import K_RANGE, RANDOM_STATE, cluster, k_sweep
+
     st.subheader("Clustering (KMeans)")
     # Use only numeric features for clustering
     num_cols = df.select_dtypes(include=[np.number]).columns.tolist()
@@ -256,33 +301,50 @@ def run_clustering(df: pd.DataFrame):
     subset_cols = st.multiselect("Select numeric columns for clustering", num_cols, default=num_cols[:min(6, len(num_cols))])
     if not subset_cols:
         return
-    X = df[subset_cols].copy()
-    imputer = SimpleImputer(strategy="median")
-    X_imp = imputer.fit_transform(X)
+    # selection order doesn't matter: one cache entry per column set
+    columns = sorted(subset_cols)
 
-    k = st.slider("Number of clusters (k)", 2, 10, 3, 1)
-    km = KMeans(n_clusters=k, random_state=42, n_init="auto")
-    clusters = km.fit_predict(X_imp)
+    def imputed():
+        # only on a cache miss
+        return SimpleImputer(strategy="median").fit_transform(df[columns])
 
-    st.write("**Inertia**:", round(km.inertia_, 2))
-    try:
-        sil = silhouette_score(X_imp, clusters)
-        st.write("**Silhouette Score**:", round(sil, 4))
-    except Exception:
-        pass
+    k = st.slider("Number of clusters (k)", 2, 10, 3, 1)
+    # results are cached per dataset + column subset (+ k), like fitted models
+    params = {"columns": columns}
+    key = model_key(fingerprint, "clustering", None, "KMeans", {**params, "k": k}, 0.0, RANDOM_STATE)
+    result, _ = get_model_cache().get_or_fit(key, lambda: cluster(imputed(), k))
+    clusters = result["labels"]
+    if result["large"]:
+        st.info(f"⚡ Large-data mode ({len(df):,} rows): MiniBatchKMeans, silhouette on a "
+                f"{result['silhouette_rows']:,}-row stratified sample, randomized PCA with "
+                f"{len(result['plot']):,} points plotted.")
+
+    st.write("**Inertia**:", round(result["inertia"], 2))
+    if not np.isnan(result["silhouette"]):
+        st.write("**Silhouette Score**:", round(result["silhouette"], 4))
 
     # PCA 2D visualization
-    pca = PCA(n_components=2, random_state=42)
-    X2 = pca.fit_transform(X_imp)
-    viz = pd.DataFrame({"pc1": X2[:,0], "pc2": X2[:,1], "cluster": clusters})
     fig, ax = plt.subplots(figsize=(6,5))
-    sns.scatterplot(data=viz, x="pc1", y="pc2", hue="cluster", palette="tab10", ax=ax)
+    sns.scatterplot(data=result["plot"], x="pc1", y="pc2", hue="cluster", palette="tab10", ax=ax)
     ax.set_title("Clusters in 2D (PCA)")
     st.pyplot(fig)
 
     st.write("**Cluster sizes**")
     st.dataframe(pd.Series(clusters).value_counts().rename("count"))
 
+    if st.checkbox(f"📉 Elbow & silhouette sweep (k = {K_RANGE.start}–{K_RANGE.stop - 1})"):
+        sweep_key = model_key(fingerprint, "clustering-sweep", None, "KMeans", params, 0.0, RANDOM_STATE)
+        with st.spinner("Fitting every k in parallel..."):
+            sweep, _ = get_model_cache().get_or_fit(sweep_key, lambda: k_sweep(imputed()))
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10,3.5))
+        ax1.plot(sweep.index, sweep["inertia"], marker="o")
+        ax1.set_title("Elbow (inertia)")
+        ax2.plot(sweep.index, sweep["silhouette"], marker="o")
+        ax2.set_title("Silhouette")
+        for ax in (ax1, ax2):
+            ax.set_xlabel("k")
+        st.pyplot(fig)
+
 # ---------- Sidebar ----------
 st.sidebar.title("📦 Data Science Portfolio App")
 st.sidebar.markdown("**Load a dataset** and explore EDA, models, and clustering.")
@@ -299,18 +361,23 @@ if data_source_choice == "Upload CSV":
 elif data_source_choice == "Paste GitHub Raw CSV URL":
     custom_url = st.sidebar.text_input("Raw CSV URL (https://raw.githubusercontent.com/...)")
 
+compact_dtypes = st.sidebar.checkbox("🗜️ Compact dtypes (less memory)", value=False,
+                                     help="Smaller integer/float types where no value changes; repeated strings as categories.")
+
 st.sidebar.markdown("---")
 st.sidebar.caption("Tip: Start with **Seaborn Titanic** or **Penguins**.")
 
 # ---------- Load data ----------
 df = None
+compaction = None
+fingerprint = None
 try:
     if data_source_choice in GITHUB_DATASETS:
-        df = load_data(data_source_choice)
+        df, compaction, fingerprint = load_data(data_source_choice, compact_dtypes=compact_dtypes)
     elif data_source_choice == "Upload CSV" and uploaded_file is not None:
-        df = load_data(data_source_choice, uploaded_file.getvalue())
+        df, compaction, fingerprint = load_data(data_source_choice, uploaded_file.getvalue(), compact_dtypes)
     elif data_source_choice == "Paste GitHub Raw CSV URL" and custom_url and is_url(custom_url):
-        df = load_data(custom_url)
+        df, compaction, fingerprint = load_data(custom_url, compact_dtypes=compact_dtypes)
 except Exception as e:
     st.sidebar.error(f"Failed to load dataset: {e}")
 
@@ -325,16 +392,23 @@ with tabs[0]:
     st.markdown("Select a built-in dataset, paste a **GitHub raw CSV URL**, or upload your own file.")
     if df is not None:
         st.success("Dataset loaded ✅")
+        if compaction is not None:
+            st.caption(compact.summary_line(compaction))
+            with st.expander("Memory per column"):
+                st.dataframe(compaction.astype({"before": str, "after": str}))
         st.dataframe(df.head())
         st.write("Column dtypes:")
         st.json({c: str(t) for c, t in df.dtypes.items()})
     else:
         st.info("No dataset loaded yet. Use the sidebar to select or upload data.")
 
+if PREWARM:
+    start_prewarm()
+
 with tabs[1]:
     st.header("Exploratory Data Analysis")
     if df is not None:
-        basic_eda(df)
+        basic_eda(df, fingerprint)
     else:
         st.warning("Load a dataset first.")
 
@@ -343,16 +417,16 @@ with tabs[2]:
     if df is not None:
         task = st.radio("Choose a task", ["Classification", "Regression"], horizontal=True)
         if task == "Classification":
-            train_classification(df)
+            train_classification(df, fingerprint)
         else:
-            train_regression(df)
+            train_regression(df, fingerprint)
     else:
         st.warning("Load a dataset first.")
 
 with tabs[3]:
     st.header("Unsupervised Clustering")
     if df is not None:
-        run_clustering(df)
+        run_clustering(df, fingerprint)
     else:
         st.warning("Load a dataset first.")
 
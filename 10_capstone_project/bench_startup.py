@@ -0,0 +1,121 @@
+"""
+Startup cost of app.py.
+
+    python bench_startup.py               # import-time report + time to first render
+    python bench_startup.py --top 25
+    python bench_startup.py --runs 5
+
+1. Import-time report: `python -X importtime` over the modules app.py needs,
+   each marked as imported at startup or deferred to a tab, and the packages
+   they pull in ranked by their own import time.
+2. Time to first render of the Data tab: app.py runs headless (Streamlit's
+   AppTest) in a fresh process, timed from interpreter start until the Data
+   tab's content has been emitted. Modes: "eager" imports the heavy modules
+   up front (the old layout), "lazy" as shipped with DS_PREWARM=0, and
+   "lazy + prewarm" as shipped.
+
+The app loads its default dataset through the registry; set DS_MIRROR to
+benchmark offline.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from startup import HEAVY_MODULES
+
+HERE = Path(__file__).resolve().parent
+STARTUP_MODULES = ("streamlit", "numpy", "pandas", "eda_profile", "model_cache", "registry")
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+CHILD = """
+import time
+t0 = time.perf_counter()
+import importlib, json, sys
+if sys.argv[1] == "eager":
+    for name in sys.argv[2:]:
+        importlib.import_module(name)
+import streamlit
+rendered = {}
+header = streamlit.header
+def timed_header(body, *args, **kwargs):
+    rendered.setdefault(body, time.perf_counter() - t0)
+    return header(body, *args, **kwargs)
+streamlit.header = timed_header
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file("app.py", default_timeout=600).run()
+print(json.dumps({"data_tab": rendered.get("Exploratory Data Analysis"),
+                  "full_run": time.perf_counter() - t0,
+                  "errors": [str(e.value) for e in at.exception]}))
+"""
+
+
+def import_report(top):
+    modules = STARTUP_MODULES + HEAVY_MODULES
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + ", ".join(modules)],
+                          cwd=HERE, capture_output=True, text=True, check=True)
+    # lines come in completion order, a module's dependencies before it; each
+    # package's self time is charged to the app-level module that pulled it in
+    packages, pending, totals = {}, [], {}
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        pending.append((name.split(".")[0], int(self_us)))
+        if not indent:
+            when = "deferred" if name in HEAVY_MODULES else "startup"
+            totals[name] = (int(cumulative_us), when)
+            for package, us in pending:
+                packages.setdefault(package, [0, when])[0] += us
+            pending = []
+
+    print(f"{'app-level import':<24} {'cumulative ms':>14}  when")
+    for name in modules:
+        us, when = totals[name]
+        print(f"{name:<24} {us / 1e3:14.1f}  {when}")
+    print(f"\n{'package (self time)':<24} {'ms':>14}  pulled in by")
+    for package, (us, when) in sorted(packages.items(), key=lambda kv: -kv[1][0])[:top]:
+        print(f"{package:<24} {us / 1e3:14.1f}  {when}")
+    startup = sum(us for us, when in totals.values() if when == "startup")
+    deferred = sum(us for us, when in totals.values() if when == "deferred")
+    print(f"\nImported at startup: {startup / 1e3:.0f} ms, deferred to tabs: {deferred / 1e3:.0f} ms")
+
+
+def first_render(mode, runs):
+    env = dict(os.environ, DS_PREWARM="1" if mode == "lazy + prewarm" else "0")
+    args = [sys.executable, "-c", CHILD, "eager" if mode == "eager" else "lazy", *HEAVY_MODULES]
+    samples = []
+    for _ in range(runs):
+        proc = subprocess.run(args, cwd=HERE, env=env, capture_output=True, text=True, check=True)
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        if result["errors"]:
+            raise RuntimeError(f"app.py raised: {result['errors'][0]}")
+        samples.append((result["data_tab"], result["full_run"]))
+    data_tab, full_run = (statistics.median(s) for s in zip(*samples))
+    return data_tab, full_run
+
+
+def main():
+    parser = argparse.ArgumentParser(description="app.py import-time and time-to-first-render benchmark")
+    parser.add_argument("--top", type=int, default=15, help="packages listed in the import report")
+    parser.add_argument("--runs", type=int, default=3, help="fresh processes per mode (median reported)")
+    args = parser.parse_args()
+
+    import_report(args.top)
+    print(f"\nTime to first render, median of {args.runs} fresh processes:")
+    print(f"{'mode':<16} {'Data tab s':>11} {'full run s':>11}")
+    base = None
+    for mode in ("eager", "lazy", "lazy + prewarm"):
+        data_tab, full_run = first_render(mode, args.runs)
+        speedup = f"  x{base / data_tab:.1f}" if base else ""
+        base = base or data_tab
+        print(f"{mode:<16} {data_tab:11.2f} {full_run:11.2f}{speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+KMeans for app.py's Clustering tab, with a large-data mode.
+
+Above LARGE_DATA_ROWS rows:
+- MiniBatchKMeans replaces full-batch KMeans;
+- the silhouette score is computed on a sample of at most SILHOUETTE_SAMPLE
+  rows, stratified by cluster (the exact score is O(n²) in time and memory);
+- the 2-D projection uses randomized PCA and only a stratified sample of
+  PLOT_POINTS points is drawn.
+
+k_sweep() fits every k of the slider's range in parallel (joblib worker
+processes) for the elbow / silhouette charts.
+"""
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.decomposition import PCA
+from sklearn.metrics import silhouette_score
+
+LARGE_DATA_ROWS = 50_000
+SILHOUETTE_SAMPLE = 10_000
+PLOT_POINTS = 5_000
+K_RANGE = range(2, 11)
+RANDOM_STATE = 42
+
+
+def is_large(n_rows):
+    return n_rows > LARGE_DATA_ROWS
+
+
+def make_kmeans(k, large):
+    if large:
+        return MiniBatchKMeans(n_clusters=k, random_state=RANDOM_STATE, n_init="auto", batch_size=4096)
+    return KMeans(n_clusters=k, random_state=RANDOM_STATE, n_init="auto")
+
+
+def stratified_sample(labels, size, random_state=RANDOM_STATE):
+    """
+    Row positions, at most `size`, with every cluster represented in
+    proportion to its size (and by at least 2 rows where it has them).
+    """
+    n = len(labels)
+    if n <= size:
+        return np.arange(n)
+    rng = np.random.default_rng(random_state)
+    clusters, counts = np.unique(labels, return_counts=True)
+    takes = np.minimum(counts, np.maximum(2, np.round(size * counts / n).astype(int)))
+    # the 2-row floor and rounding can overshoot `size`: trim the largest takes
+    for _ in range(takes.sum() - size):
+        takes[np.argmax(takes)] -= 1
+    picks = [rng.choice(np.flatnonzero(labels == label), size=take, replace=False)
+             for label, take in zip(clusters, takes)]
+    return np.sort(np.concatenate(picks))
+
+
+def sampled_silhouette(X, labels, sample_size=SILHOUETTE_SAMPLE):
+    """
+    (silhouette score, rows used). Exact when the data fits in `sample_size`.
+    """
+    idx = stratified_sample(labels, sample_size)
+    if len(np.unique(labels[idx])) < 2:
+        return np.nan, len(idx)
+    return silhouette_score(X[idx], labels[idx]), len(idx)
+
+
+def cluster(X, k):
+    """
+    Fits k clusters on the imputed matrix X; returns labels, scores and a 2-D
+    projection of the rows to plot.
+    """
+    large = is_large(len(X))
+    km = make_kmeans(k, large)
+    labels = km.fit_predict(X)
+    silhouette, silhouette_rows = sampled_silhouette(X, labels)
+
+    pca = PCA(n_components=2, svd_solver="randomized" if large else "auto", random_state=RANDOM_STATE)
+    plot_idx = stratified_sample(labels, PLOT_POINTS) if large else np.arange(len(X))
+    # fit the projection on all rows (cheap), draw only the sample
+    pca.fit(X)
+    X2 = pca.transform(X[plot_idx])
+    return {
+        "large": large,
+        "labels": labels,
+        "inertia": km.inertia_,
+        "silhouette": silhouette,
+        "silhouette_rows": silhouette_rows,
+        "plot": pd.DataFrame({"pc1": X2[:, 0], "pc2": X2[:, 1], "cluster": labels[plot_idx]}),
+    }
+
+
+def _score_k(X, k, large):
+    km = make_kmeans(k, large)
+    labels = km.fit_predict(X)
+    silhouette, _ = sampled_silhouette(X, labels)
+    return k, km.inertia_, silhouette
+
+
+def k_sweep(X, ks=K_RANGE, workers=-1):
+    """Inertia and (sampled) silhouette for every k, one worker process per k."""
+    large = is_large(len(X))
+    rows = Parallel(n_jobs=workers)(delayed(_score_k)(X, k, large) for k in ks)
+    return pd.DataFrame(rows, columns=["k", "inertia", "silhouette"]).set_index("k")
@@ -0,0 +1,178 @@
+"""
+"Compare all" mode for the Modeling tab: k-fold cross-validation of every
+candidate configuration on a process pool, with successive halving.
+
+- The preprocessor (modeling.build_preprocessor) is fitted once per fold in
+  the parent; the transformed fold is written to a joblib file that every
+  worker reuses, so no model refits it.
+- Successive halving: all configurations start on few folds; after each
+  round only the best 1/ETA (and at least KEEP_MIN) continue to the next,
+  larger fold budget, until the survivors have seen every fold.
+- Each (configuration, fold) task records fit and predict time and its peak
+  memory, for the leaderboard. On Linux the worker's RSS high-water mark is
+  reset before each task, so "peak MB" is that task's own growth; elsewhere
+  it falls back to the worker's lifetime peak RSS (an upper bound).
+"""
+import math
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score, r2_score
+from sklearn.model_selection import KFold, StratifiedKFold
+
+from eda_profile import split_feature_types
+from modeling import build_preprocessor, make_model
+
+ETA = 2
+KEEP_MIN = 2
+
+CLASSIFIER_GRID = (
+    [("Logistic Regression", {"max_iter": 200, "C": c}) for c in (0.1, 1.0, 10.0)]
+    + [("Random Forest Classifier", {"n_estimators": n, "random_state": 42}) for n in (100, 300)]
+)
+REGRESSOR_GRID = (
+    [("Linear Regression", {})]
+    + [("Ridge", {"alpha": a, "random_state": 42}) for a in (0.1, 1.0, 10.0)]
+    + [("Random Forest Regressor", {"n_estimators": n, "random_state": 42}) for n in (100, 300)]
+)
+SCORERS = {"classification": ("accuracy", accuracy_score), "regression": ("R²", r2_score)}
+
+_fold_data = {}   # per worker process: fold file -> loaded arrays
+
+
+def _load_fold(path):
+    if path not in _fold_data:
+        _fold_data[path] = joblib.load(path)
+    return _fold_data[path]
+
+
+def _rss_status():
+    """(current RSS, peak RSS) in bytes from /proc, or None off Linux."""
+    try:
+        with open("/proc/self/status") as f:
+            fields = dict(line.split(":", 1) for line in f)
+        return int(fields["VmRSS"].split()[0]) * 1024, int(fields["VmHWM"].split()[0]) * 1024
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _reset_peak_rss():
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")   # resets VmHWM to the current RSS
+        return True
+    except OSError:
+        return False
+
+
+def _evaluate(task, model_name, params, fold_path):
+    X_train, y_train, X_test, y_test = _load_fold(fold_path)
+    # one process per task already; a forest using every core here would oversubscribe
+    model = make_model(model_name, params, n_jobs=1)
+    status = _rss_status() if _reset_peak_rss() else None
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_s = time.perf_counter() - start
+    start = time.perf_counter()
+    y_pred = model.predict(X_test)
+    predict_s = time.perf_counter() - start
+    if status is not None:
+        peak = _rss_status()[1] - status[0]
+    elif resource is not None:
+        # ru_maxrss is KB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    else:
+        peak = np.nan
+    return SCORERS[task][1](y_test, y_pred), fit_s, predict_s, peak
+
+
+def _prepare_folds(X, y, task, folds, random_state, directory):
+    splitter = (StratifiedKFold if task == "classification" else KFold)(
+        n_splits=folds, shuffle=True, random_state=random_state)
+    num_cols, cat_cols = split_feature_types(X)
+    paths = []
+    for i, (train_idx, test_idx) in enumerate(splitter.split(X, y)):
+        pre = build_preprocessor(num_cols, cat_cols, scale_numeric=True)
+        X_train = pre.fit_transform(X.iloc[train_idx])
+        X_test = pre.transform(X.iloc[test_idx])
+        path = os.path.join(directory, f"fold{i}.joblib")
+        joblib.dump((X_train, y.iloc[train_idx].to_numpy(), X_test, y.iloc[test_idx].to_numpy()), path)
+        paths.append(path)
+    return paths
+
+
+def fold_budgets(folds, eta=ETA):
+    """Folds evaluated by the end of each round: 1, eta, eta**2, ... capped at `folds`."""
+    budgets = [1]
+    while budgets[-1] < folds:
+        budgets.append(min(budgets[-1] * eta, folds))
+    return budgets
+
+
+def compare_models(df, target, task, folds=5, random_state=42, workers=None, candidates=None, halving=True):
+    """
+    Cross-validates every candidate (model name, params) and returns the
+    leaderboard, best first.
+    """
+    candidates = candidates or (CLASSIFIER_GRID if task == "classification" else REGRESSOR_GRID)
+    X = df.drop(columns=[target])
+    y = df[target]
+    results = {i: [] for i in range(len(candidates))}   # candidate -> [(score, fit_s, predict_s, peak)]
+    pruned = {}                                          # candidate -> round it was dropped after
+
+    with tempfile.TemporaryDirectory(prefix="cv_folds_") as directory, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        paths = _prepare_folds(X, y, task, folds, random_state, directory)
+        alive = list(results)
+        budgets = fold_budgets(folds) if halving else [folds]
+        for round_no, budget in enumerate(budgets):
+            futures = {(i, f): pool.submit(_evaluate, task, *candidates[i], paths[f])
+                       for i in alive for f in range(len(results[i]), budget)}
+            for (i, _), future in futures.items():
+                results[i].append(future.result())
+            if budget == folds:
+                break
+            keep = max(KEEP_MIN, math.ceil(len(alive) / ETA))
+            ranked = sorted(alive, key=lambda i: np.mean([r[0] for r in results[i]]), reverse=True)
+            for i in ranked[keep:]:
+                pruned[i] = round_no + 1
+            alive = ranked[:keep]
+
+    metric = SCORERS[task][0]
+    rows = []
+    for i, (model_name, params) in enumerate(candidates):
+        scores, fit_s, predict_s, peak = np.array(results[i]).T
+        rows.append({
+            "model": model_name,
+            "params": ", ".join(f"{k}={v}" for k, v in params.items() if k != "random_state") or "-",
+            metric: scores.mean(),
+            "± std": scores.std(ddof=1) if len(scores) > 1 else np.nan,
+            "folds": len(scores),
+            "fit s/fold": fit_s.mean(),
+            "predict s/fold": predict_s.mean(),
+            "peak MB": peak.max() / 1024 ** 2,
+            "status": f"pruned after round {pruned[i]}" if i in pruned else "finalist",
+        })
+    board = pd.DataFrame(rows)
+    board["finalist"] = board["status"] == "finalist"
+    board = board.sort_values(["finalist", metric], ascending=False).drop(columns="finalist")
+    return board.reset_index(drop=True)
+
+
+def leaderboard_view(board):
+    """
+    Leaderboard styled for display: the std of a configuration pruned after a
+    single fold (and a peak that could not be measured) reads "n/a", not NaN.
+    """
+    return board.style.format(na_rep="n/a", subset=["± std", "peak MB"])
@@ -0,0 +1,192 @@
+"""
+EDA profile for app.py: every aggregate the EDA tab shows, computed once per
+dataset and cached by a content fingerprint.
+
+Reruns (any widget change) only redraw charts from the stored aggregates -
+histogram bin counts, a KDE evaluated from those bins, category frequency
+tables - instead of going back to the raw rows.
+
+Above APPROX_ROW_THRESHOLD rows the profile is approximate by default: it is
+built from a uniform SAMPLE_ROWS-row sample, category tables keep the top
+TOP_K values plus "other", and every estimate carries a 95% error bound
+(quantiles: DKW rank error; means and counts: normal approximation).
+"""
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+MAX_BINS = 100
+KDE_POINTS = 200
+PROFILE_CACHE_MB = 64
+APPROX_ROW_THRESHOLD = 1_000_000
+SAMPLE_ROWS = 200_000
+TOP_K = 20
+Z95 = 1.96
+
+
+def dataset_fingerprint(df):
+    """
+    Content hash of a frame: values, index, column names and dtypes. Every
+    row is hashed - the fingerprint keys cached models and profiles, so two
+    frames that differ in any row must never share it (only the statistics,
+    not the key, are approximate for large frames).
+    """
+    h = hashlib.sha256()
+    h.update(repr([df.shape] + [(str(c), str(t)) for c, t in df.dtypes.items()]).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def sample_rows(df, rows=SAMPLE_ROWS, seed=0):
+    """Uniform sample without replacement, in original row order."""
+    if len(df) <= rows:
+        return df
+    rng = np.random.default_rng(seed)
+    return df.take(np.sort(rng.choice(len(df), size=rows, replace=False)))
+
+
+def quantile_rank_error(sample_size, confidence=0.95):
+    """DKW bound: sample quantiles are within this rank distance of the true ones."""
+    return np.sqrt(np.log(2 / (1 - confidence)) / (2 * sample_size)) if sample_size else np.nan
+
+
+def split_feature_types(df):
+    num_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    cat_cols = df.select_dtypes(exclude=[np.number]).columns.tolist()
+    return num_cols, cat_cols
+
+
+class NumericSummary:
+    """
+    Moments, quantiles and histogram of one numeric column, from a single
+    float array (the column is converted and NaN-filtered once).
+    For a sample, `scale` (population rows / sample rows) scales the counts
+    and mean_error is the 95% half-width of the mean.
+    """
+
+    def __init__(self, series, scale=1.0):
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        values = values[~np.isnan(values)]
+        self.sample_size = len(values)
+        self.count = round(self.sample_size * scale)
+        self.mean_error = 0.0
+        if self.sample_size:
+            self.mean = float(values.mean())
+            self.std = float(values.std(ddof=1)) if self.sample_size > 1 else np.nan
+            self.min, self.q25, self.median, self.q75, self.max = np.percentile(values, [0, 25, 50, 75, 100])
+            edges = np.histogram_bin_edges(values, bins="auto")
+            if len(edges) > MAX_BINS + 1:
+                edges = np.linspace(self.min, self.max, MAX_BINS + 1)
+            self.counts, self.edges = np.histogram(values, bins=edges)
+            if scale != 1.0:
+                self.counts = self.counts * scale
+                self.mean_error = Z95 * self.std / np.sqrt(self.sample_size) if self.sample_size > 1 else np.nan
+        else:
+            self.mean = self.std = self.min = self.q25 = self.median = self.q75 = self.max = np.nan
+            self.counts, self.edges = np.zeros(0, dtype=int), np.zeros(1)
+
+    def describe(self):
+        return {"count": float(self.count), "mean": self.mean, "std": self.std, "min": self.min,
+                "25%": self.q25, "50%": self.median, "75%": self.q75, "max": self.max}
+
+    def kde(self, points=KDE_POINTS):
+        """
+        Gaussian KDE (Scott's bandwidth) evaluated from the histogram bins,
+        scaled to counts like seaborn's histplot(kde=True) overlay.
+        """
+        if self.sample_size < 2 or not self.std > 0:
+            return None
+        centers = (self.edges[:-1] + self.edges[1:]) / 2
+        bandwidth = self.std * self.sample_size ** (-1 / 5)
+        grid = np.linspace(self.edges[0] - 3 * bandwidth, self.edges[-1] + 3 * bandwidth, points)
+        z = (grid[:, None] - centers[None, :]) / bandwidth
+        density = (np.exp(-0.5 * z ** 2) @ self.counts) / (self.count * bandwidth * np.sqrt(2 * np.pi))
+        bin_width = self.edges[1] - self.edges[0]
+        return grid, density * self.count * bin_width
+
+
+def top_k_counts(series, k=TOP_K):
+    """The k most frequent values, with everything else summed into "other"."""
+    counts = series.value_counts(dropna=True)
+    top = counts.iloc[:k]
+    if len(counts) > k:
+        top = pd.concat([top.rename(index=str), pd.Series({"other": counts.iloc[k:].sum()})])
+    return top
+
+
+class EDAProfile:
+    """
+    approximate=True builds the profile from a sample (see module docstring);
+    shape and head are always exact.
+    """
+
+    def __init__(self, df, approximate=False, sample_size=SAMPLE_ROWS):
+        self.shape = df.shape
+        self.head = df.head()
+        self.approximate = approximate and len(df) > sample_size
+        data = sample_rows(df, sample_size) if self.approximate else df
+        self.sample_size = len(data)
+        scale = len(df) / len(data) if len(data) else 1.0
+        self.quantile_rank_error = quantile_rank_error(self.sample_size) if self.approximate else 0.0
+
+        missing = (data.isna().sum() * scale).round().astype(int)
+        self.missing = missing.to_frame("missing").sort_values("missing", ascending=False)
+        self.num_cols, self.cat_cols = split_feature_types(df)
+        self.numeric = {col: NumericSummary(data[col], scale) for col in self.num_cols}
+        self.summary = pd.DataFrame({col: s.describe() for col, s in self.numeric.items()}).T
+        if self.approximate and self.num_cols:
+            self.summary["mean ±95%"] = [s.mean_error for s in self.numeric.values()]
+        self.corr = data[self.num_cols].corr(numeric_only=True) if self.num_cols else None
+
+        self.categories, self.category_errors = {}, {}
+        for col in self.cat_cols:
+            if self.approximate:
+                counts = top_k_counts(data[col])
+                share = counts / self.sample_size
+                self.categories[col] = counts * scale
+                self.category_errors[col] = Z95 * np.sqrt(share * (1 - share) / self.sample_size) * len(df)
+            else:
+                # countplot order: categories in order of appearance, missing values dropped
+                self.categories[col] = data[col].value_counts(sort=False, dropna=True)
+                self.category_errors[col] = None
+
+
+class ProfileCache:
+    """
+    LRU of EDAProfile objects keyed by dataset fingerprint, bounded by their
+    pickled size.
+    """
+
+    def __init__(self, max_mb=PROFILE_CACHE_MB):
+        self.max_bytes = max_mb * 1024 ** 2
+        self.total_bytes = 0
+        self._profiles = OrderedDict()   # fingerprint -> (profile, nbytes)
+        self._lock = threading.Lock()    # shared by all Streamlit sessions
+
+    def get(self, df, approximate=None, fingerprint=None):
+        """
+        approximate=None picks approximate mode for frames above APPROX_ROW_THRESHOLD rows.
+        Pass the frame's dataset_fingerprint() if it is already known; hashing
+        every row of a large frame takes seconds.
+        """
+        if approximate is None:
+            approximate = len(df) > APPROX_ROW_THRESHOLD
+        key = (fingerprint or dataset_fingerprint(df), approximate)
+        with self._lock:
+            if key in self._profiles:
+                self._profiles.move_to_end(key)
+                return self._profiles[key][0]
+        profile = EDAProfile(df, approximate)
+        size = len(pickle.dumps(profile, protocol=pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            if key not in self._profiles:
+                self._profiles[key] = (profile, size)
+                self.total_bytes += size
+            while self.total_bytes > self.max_bytes and len(self._profiles) > 1:
+                _, (_, evicted) = self._profiles.popitem(last=False)
+                self.total_bytes -= evicted
+        return profile
@@ -0,0 +1,159 @@
+"""
+Two-tier cache of fitted models and their results for app.py.
+
+Keys combine the dataset fingerprint with the target, model name,
+hyperparameters, test_size and random_state, so an unrelated widget change
+never triggers a refit. Entries live in an in-memory LRU and in a joblib
+file per key under DS_MODEL_CACHE_DIR, which survives restarts and is
+bounded by DS_MODEL_CACHE_MB (least recently used files are evicted first).
+Disk copies are loaded and written outside the cache lock, writes on a
+background thread, so one session's (de)serialization never blocks another.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import joblib
+
+CACHE_DIR = Path(os.environ.get("DS_MODEL_CACHE_DIR", Path.home() / ".cache" / "ds_models"))
+MAX_BYTES = int(float(os.environ.get("DS_MODEL_CACHE_MB", "1024")) * 1024 ** 2)
+MEMORY_ENTRIES = 8
+INDEX_FILE = "index.json"
+
+logger = logging.getLogger(__name__)
+
+
+def model_key(fingerprint, task, target, model_name, params, test_size, random_state):
+    parts = {"dataset": fingerprint, "task": task, "target": target, "model": model_name,
+             "params": params, "test_size": round(float(test_size), 6), "random_state": int(random_state)}
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class ModelCache:
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_BYTES, memory_entries=MEMORY_ENTRIES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._writers = {}               # key -> thread writing its disk copy
+        self._lock = threading.Lock()    # guards _memory, _writers and the index, never held for I/O
+
+    def _path(self, key):
+        return self.cache_dir / f"{key}.joblib"
+
+    def _index_path(self):
+        return self.cache_dir / INDEX_FILE
+
+    def _load_index(self):
+        try:
+            with open(self._index_path(), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_index(self, index):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self._index_path().with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=1)
+        os.replace(tmp, self._index_path())
+
+    def _remember(self, key, result):
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """
+        Returns (result, "memory" | "disk") or (None, None).
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key], "memory"
+        path = self._path(key)
+        try:
+            result = joblib.load(path)
+        except FileNotFoundError:
+            return None, None
+        except Exception:
+            # truncated or written by an incompatible library version
+            path.unlink(missing_ok=True)
+            return None, None
+        with self._lock:
+            index = self._load_index()
+            if key in index:
+                index[key]["last_used"] = time.time()
+                self._save_index(index)
+            self._remember(key, result)
+        return result, "disk"
+
+    def put(self, key, result):
+        """
+        Stores `result` in memory right away; the compressed disk copy is
+        written on a background thread, so no session waits for it.
+        """
+        writer = threading.Thread(target=self._write, args=(key, result), name=f"model-cache-{key[:8]}")
+        with self._lock:
+            self._remember(key, result)
+            self._writers[key] = writer
+        writer.start()
+
+    def _write(self, key, result):
+        path = self._path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=f"{key}.", suffix=".tmp")
+            os.close(fd)
+            try:
+                joblib.dump(result, tmp, compress=3)
+                os.replace(tmp, path)
+            finally:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+            with self._lock:
+                index = self._load_index()
+                index[key] = {"bytes": path.stat().st_size, "last_used": time.time()}
+                self._evict(index)
+                self._save_index(index)
+        except Exception as e:
+            # the entry stays in memory; only the copy that survives restarts is lost
+            logger.warning("Could not write model cache entry %s: %s", key[:12], e)
+        finally:
+            with self._lock:
+                if self._writers.get(key) is threading.current_thread():
+                    del self._writers[key]
+
+    def flush(self):
+        """Waits for pending disk writes."""
+        with self._lock:
+            writers = list(self._writers.values())
+        for writer in writers:
+            writer.join()
+
+    def _evict(self, index):
+        total = sum(e["bytes"] for e in index.values())
+        for key in sorted(index, key=lambda k: index[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= index[key]["bytes"]
+            self._path(key).unlink(missing_ok=True)
+            del index[key]
+
+    def get_or_fit(self, key, fit):
+        """
+        Cached result for `key`, or fit() stored under it.
+        Returns (result, source) with source "memory", "disk" or "fit".
+        """
+        result, source = self.get(key)
+        if result is None:
+            result, source = fit(), "fit"
+            self.put(key, result)
+        return result, source
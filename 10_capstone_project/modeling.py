@@ -0,0 +1,130 @@
+"""
+Model fitting for app.py's Modeling tab, kept free of Streamlit so results can
+be cached (model_cache.py) and computed outside the script run.
+
+fit_classification() / fit_regression() return a dict holding the fitted
+pipeline, the metrics and everything the tab plots.
+"""
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LinearRegression, LogisticRegression, Ridge
+from sklearn.metrics import (
+    accuracy_score, f1_score, roc_auc_score, confusion_matrix,
+    classification_report, r2_score, mean_absolute_error, mean_squared_error
+)
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from eda_profile import split_feature_types
+
+# model name -> default hyperparameters (all of them end up in the cache key)
+CLASSIFIERS = {
+    "Logistic Regression": {"max_iter": 200},
+    "Random Forest Classifier": {"n_estimators": 300, "random_state": 42},
+}
+REGRESSORS = {
+    "Linear Regression": {},
+    "Ridge": {"alpha": 1.0, "random_state": 42},
+    "Random Forest Regressor": {"n_estimators": 300, "random_state": 42},
+}
+
+
+def build_preprocessor(num_cols, cat_cols, scale_numeric=True):
+    num_steps = [("imputer", SimpleImputer(strategy="median"))]
+    if scale_numeric:
+        num_steps.append(("scaler", StandardScaler()))
+    num_tf = Pipeline(steps=num_steps)
+    cat_tf = Pipeline(steps=[
+        ("imputer", SimpleImputer(strategy="most_frequent")),
+        ("onehot", OneHotEncoder(handle_unknown="ignore"))
+    ])
+    pre = ColumnTransformer(
+        transformers=[
+            ("num", num_tf, num_cols),
+            ("cat", cat_tf, cat_cols)
+        ]
+    )
+    return pre
+
+
+def make_model(model_name, params, n_jobs=-1):
+    if model_name == "Logistic Regression":
+        return LogisticRegression(**params)
+    if model_name == "Random Forest Classifier":
+        return RandomForestClassifier(n_jobs=n_jobs, **params)
+    if model_name == "Linear Regression":
+        return LinearRegression(**params)
+    if model_name == "Ridge":
+        return Ridge(**params)
+    if model_name == "Random Forest Regressor":
+        return RandomForestRegressor(n_jobs=n_jobs, **params)
+    raise ValueError(f"Unknown model: {model_name}")
+
+
+def _feature_importances(pipe):
+    model_obj = pipe.named_steps["model"]
+    pre_obj = pipe.named_steps["pre"]
+    if not hasattr(model_obj, "feature_importances_"):
+        return None
+    # map back feature names
+    oh = pre_obj.named_transformers_["cat"].named_steps["onehot"]
+    cat_names = oh.get_feature_names_out(pre_obj.transformers_[1][2])
+    num_names = pre_obj.transformers_[0][2]
+    feat_names = np.concatenate([num_names, cat_names])
+    return pd.Series(model_obj.feature_importances_, index=feat_names).sort_values(ascending=False)[:20]
+
+
+def fit_classification(df, target, model_name, params, test_size, random_state):
+    X = df.drop(columns=[target])
+    y = df[target]
+    num_cols, cat_cols = split_feature_types(X)
+    pre = build_preprocessor(num_cols, cat_cols, scale_numeric=True)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size,
+                                                        random_state=random_state, stratify=y)
+    pipe = Pipeline(steps=[("pre", pre), ("model", make_model(model_name, params))])
+    pipe.fit(X_train, y_train)
+    y_pred = pipe.predict(X_test)
+
+    result = {"pipeline": pipe, "accuracy": accuracy_score(y_test, y_pred), "f1_macro": None, "roc_auc": None}
+    try:
+        result["f1_macro"] = f1_score(y_test, y_pred, average="macro")
+    except Exception:
+        pass
+    # ROC-AUC for binary only
+    if hasattr(pipe, "predict_proba") and len(np.unique(y_test)) == 2:
+        y_prob = pipe.predict_proba(X_test)[:, 1]
+        try:
+            result["roc_auc"] = roc_auc_score(y_test, y_prob)
+        except Exception:
+            pass
+    result["confusion_matrix"] = confusion_matrix(y_test, y_pred)
+    result["report"] = classification_report(y_test, y_pred)
+    try:
+        result["importances"] = _feature_importances(pipe)
+    except Exception:
+        result["importances"] = None
+    return result
+
+
+def fit_regression(df, target, model_name, params, test_size, random_state):
+    X = df.drop(columns=[target])
+    y = df[target]
+    num_cols, cat_cols = split_feature_types(X)
+    pre = build_preprocessor(num_cols, cat_cols, scale_numeric=True)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size,
+                                                        random_state=random_state)
+    pipe = Pipeline(steps=[("pre", pre), ("model", make_model(model_name, params))])
+    pipe.fit(X_train, y_train)
+    y_pred = pipe.predict(X_test)
+    return {
+        "pipeline": pipe,
+        "r2": r2_score(y_test, y_pred),
+        "mae": mean_absolute_error(y_test, y_pred),
+        "rmse": np.sqrt(mean_squared_error(y_test, y_pred)),
+        "y_test": np.asarray(y_test),
+        "y_pred": y_pred,
+    }
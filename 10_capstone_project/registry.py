@@ -0,0 +1,209 @@
+"""
+Local dataset registry for app.py.
+
+Every dataset is downloaded once into DATA_DIR and loaded from there, through
+the shared columnar cache (shared/columnar_cache.py), so repeated loads - also
+across restarts - memory-map a typed Feather copy instead of parsing CSV.
+
+Where the bytes come from, in order:
+1. a mirror, if DS_MIRROR is set: a local directory or an http(s) base URL
+   holding the same file names as the origin URLs (for air-gapped setups);
+2. the origin URL.
+
+Refreshes (after DS_REFRESH_HOURS) are conditional requests (ETag /
+Last-Modified), an interrupted download is resumed with a Range request, and
+all HTTP goes through one pooled requests.Session. When no source can be
+reached the existing local copy is used.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "shared"))
+try:
+    import columnar_cache
+except ImportError:
+    columnar_cache = None
+
+DATA_DIR = Path(os.environ.get("DS_DATA_DIR", Path.home() / ".cache" / "ds_registry"))
+MIRROR = os.environ.get("DS_MIRROR")
+REFRESH_SECONDS = float(os.environ.get("DS_REFRESH_HOURS", "24")) * 3600
+POOL_SIZE = 8
+TIMEOUT = 30
+CHUNK_BYTES = 1 << 20
+
+logger = logging.getLogger(__name__)
+
+
+def make_session(pool_size=POOL_SIZE):
+    """Keep-alive session with a connection pool and retries on transient errors."""
+    session = requests.Session()
+    # one connect retry only: an unreachable host (air-gapped) should fall through to the local copy fast
+    retry = Retry(total=3, connect=1, backoff_factor=0.5, status_forcelist=(502, 503, 504),
+                  allowed_methods=("GET",))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _is_http(location):
+    return urlparse(str(location)).scheme in ("http", "https")
+
+
+class DatasetRegistry:
+    def __init__(self, entries, data_dir=DATA_DIR, mirror=MIRROR, refresh_seconds=REFRESH_SECONDS,
+                 session=None, timeout=TIMEOUT):
+        self.entries = dict(entries)
+        self.data_dir = Path(data_dir)
+        self.mirror = mirror
+        self.refresh_seconds = refresh_seconds
+        self.session = session or make_session()
+        self.timeout = timeout
+        self._locks = defaultdict(threading.Lock)   # one download per dataset at a time
+
+    def url(self, name_or_url):
+        return self.entries.get(name_or_url, name_or_url)
+
+    def local_path(self, url):
+        name = os.path.basename(urlparse(url).path) or "data.csv"
+        return self.data_dir / f"{hashlib.sha256(url.encode()).hexdigest()[:12]}_{name}"
+
+    def _meta_path(self, path):
+        return path.with_name(path.name + ".json")
+
+    def _load_meta(self, path):
+        try:
+            with open(self._meta_path(path), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_meta(self, path, meta):
+        tmp = self._meta_path(path).with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=1)
+        os.replace(tmp, self._meta_path(path))
+
+    def _sources(self, url):
+        sources = []
+        if self.mirror:
+            name = os.path.basename(urlparse(url).path)
+            if _is_http(self.mirror):
+                sources.append(self.mirror.rstrip("/") + "/" + name)
+            else:
+                sources.append(Path(self.mirror) / name)
+        sources.append(url)
+        return sources
+
+    def fetch(self, name_or_url, force=False):
+        """
+        Makes sure a current local copy exists and returns its path.
+        """
+        url = self.url(name_or_url)
+        path = self.local_path(url)
+        with self._locks[url]:
+            meta = self._load_meta(path)
+            if path.exists() and not force and time.time() - meta.get("checked", 0) < self.refresh_seconds:
+                return path
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            errors = []
+            for source in self._sources(url):
+                try:
+                    if _is_http(source):
+                        self._download(str(source), path, meta)
+                    else:
+                        self._copy(Path(source), path, meta)
+                    meta["checked"] = time.time()
+                    self._save_meta(path, meta)
+                    return path
+                except (OSError, requests.RequestException) as e:
+                    errors.append(f"{source}: {e}")
+            if path.exists():
+                logger.warning("Using stale local copy of %s (%s)", url, "; ".join(errors))
+                return path
+            raise ConnectionError(f"Could not fetch {url}: " + "; ".join(errors))
+
+    def _copy(self, source, path, meta):
+        stat = source.stat()
+        stamp = [str(source), stat.st_size, stat.st_mtime_ns]
+        if path.exists() and meta.get("mirror_stamp") == stamp:
+            return
+        tmp = path.with_name(path.name + ".part")
+        shutil.copyfile(source, tmp)
+        os.replace(tmp, path)
+        meta.update(source=str(source), mirror_stamp=stamp, etag=None, last_modified=None)
+
+    def _download(self, source, path, meta):
+        headers = {}
+        if path.exists() and meta.get("source") == source:
+            # conditional refresh: the server answers 304 if nothing changed
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        part = path.with_name(path.name + ".part")
+        partial = meta.get("partial") or {}
+        offset = part.stat().st_size if part.exists() and partial.get("source") == source else 0
+        validator = partial.get("etag") or partial.get("last_modified")
+        if offset and validator:
+            # resume; If-Range makes the server send the whole file if it changed meanwhile
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator
+
+        with self.session.get(source, headers=headers, stream=True, timeout=self.timeout) as response:
+            if response.status_code == 304:
+                return
+            response.raise_for_status()
+            etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+            resumed = response.status_code == 206
+            if not resumed:
+                meta["partial"] = {"source": source, "etag": etag, "last_modified": last_modified}
+                self._save_meta(path, meta)
+            with open(part, "ab" if resumed else "wb") as f:
+                for chunk in response.iter_content(CHUNK_BYTES):
+                    f.write(chunk)
+        os.replace(part, path)
+        meta.pop("partial", None)
+        meta.update(source=source, etag=etag, last_modified=last_modified, mirror_stamp=None)
+
+    def load(self, name_or_url, **read_options):
+        """
+        DataFrame for a registry name or any CSV URL.
+        """
+        path = self.fetch(name_or_url)
+        if columnar_cache is not None:
+            return columnar_cache.read_csv(str(path), **read_options)
+        return pd.read_csv(path, **read_options)
+
+    def prefetch(self, names=None, workers=4):
+        """
+        Fetches `names` (default: every entry) on background threads.
+        Returns {name: future}; failures are logged, not raised.
+        """
+        def fetch_quietly(name):
+            try:
+                return self.fetch(name)
+            except Exception as e:
+                logger.warning("Prefetch of %s failed: %s", name, e)
+                return None
+
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        futures = {name: pool.submit(fetch_quietly, name) for name in (names or self.entries)}
+        pool.shutdown(wait=False)
+        return futures
@@ -0,0 +1,35 @@
+"""
+Deferred imports for app.py.
+
+app.py imports only what the Data tab needs at startup. matplotlib, seaborn
+and scikit-learn (through modeling.py, compare.py and clustering.py) take
+seconds to import on a cold process, so they are imported inside the tab
+functions that use them and the Data tab paints without waiting for them.
+
+prewarm() imports them on a background thread once the Data tab has been
+sent, so the other tabs usually find them loaded. DS_PREWARM=0 turns it off.
+
+    python bench_startup.py     # import-time report + time to first render
+"""
+import importlib
+import os
+import threading
+
+# what the EDA tab does not need comes first: it imports the plotting
+# libraries itself right after the Data tab
+HEAVY_MODULES = ("modeling", "compare", "clustering", "matplotlib.pyplot", "seaborn")
+PREWARM = os.environ.get("DS_PREWARM", "1") != "0"
+
+
+def _import_all(modules):
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass   # the tab that needs the module reports the error
+
+
+def prewarm(modules=HEAVY_MODULES):
+    thread = threading.Thread(target=_import_all, args=(modules,), name="prewarm", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,15 @@
+import numpy as np
+import pytest
+
+from clustering import stratified_sample
+
+
+@pytest.mark.parametrize("size", [7, 20, 1000])
+def test_stratified_sample_never_exceeds_size(size):
+    # ten clusters, most of them tiny: the 2-row floor alone would overshoot small sizes
+    labels = np.concatenate([np.zeros(5000, dtype=int), np.repeat(np.arange(1, 10), 3)])
+    idx = stratified_sample(labels, size)
+    assert len(idx) <= size
+    assert len(np.unique(idx)) == len(idx)
+    if size >= 20:
+        assert set(labels[idx]) == set(range(10))
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from compare import KEEP_MIN, compare_models, fold_budgets, leaderboard_view
+
+# strongest to weakest on a noisy linear target: heavier ridge penalties shrink toward the mean
+CANDIDATES = [
+    ("Ridge", {"alpha": 1e6, "random_state": 42}),
+    ("Linear Regression", {}),
+    ("Ridge", {"alpha": 300.0, "random_state": 42}),
+    ("Ridge", {"alpha": 0.01, "random_state": 42}),
+]
+COLUMNS = ["model", "params", "R²", "± std", "folds", "fit s/fold", "predict s/fold", "peak MB", "status"]
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    n = 200
+    df = pd.DataFrame({"a": rng.normal(size=n), "b": rng.normal(size=n), "c": rng.choice(["x", "y"], n)})
+    df["target"] = 3 * df["a"] - 2 * df["b"] + (df["c"] == "x") + rng.normal(scale=0.1, size=n)
+    return df
+
+
+def test_fold_budgets():
+    assert fold_budgets(4) == [1, 2, 4]
+    assert fold_budgets(5) == [1, 2, 4, 5]
+    assert fold_budgets(1) == [1]
+
+
+def test_halving_prunes_and_ranks(data):
+    board = compare_models(data, "target", "regression", folds=4, workers=2, candidates=CANDIDATES)
+    assert board.columns.tolist() == COLUMNS
+    assert len(board) == len(CANDIDATES)
+
+    finalists = board[board["status"] == "finalist"]
+    assert len(finalists) == KEEP_MIN
+    assert set(finalists["params"]) == {"-", "alpha=0.01"}
+    assert (finalists["folds"] == 4).all()
+    assert finalists["± std"].notna().all()
+    assert finalists["R²"].is_monotonic_decreasing
+
+    # 4 candidates on one fold keep max(KEEP_MIN, 4 / ETA) = 2; the weaker two stop there
+    pruned = board[board["status"] != "finalist"]
+    assert pruned["params"].tolist() == ["alpha=300.0", "alpha=1000000.0"]
+    assert (pruned["status"] == "pruned after round 1").all()
+    assert (pruned["folds"] == 1).all()
+    assert pruned["± std"].isna().all()
+    assert pruned["R²"].is_monotonic_decreasing
+    assert board.index.tolist() == list(range(len(board)))
+
+    html = leaderboard_view(board).to_html()
+    assert html.count("n/a") == 2
+    assert "nan" not in html.lower()
+
+
+def test_without_halving_every_candidate_sees_every_fold(data):
+    board = compare_models(data, "target", "regression", folds=3, workers=2, candidates=CANDIDATES[:2],
+                           halving=False)
+    assert (board["status"] == "finalist").all()
+    assert (board["folds"] == 3).all()
+    assert board["± std"].notna().all()
+    assert board["model"].tolist() == ["Linear Regression", "Ridge"]
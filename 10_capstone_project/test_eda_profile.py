@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+
+from eda_profile import APPROX_ROW_THRESHOLD, NumericSummary, dataset_fingerprint
+
+
+def test_fingerprint_sees_every_row_of_large_frames():
+    df = pd.DataFrame({"x": np.arange(APPROX_ROW_THRESHOLD + 10, dtype=np.int64)})
+    changed = df.copy()
+    changed.iloc[1, 0] = -1   # a row between any evenly spaced sample points
+    assert dataset_fingerprint(df) == dataset_fingerprint(df.copy())
+    assert dataset_fingerprint(df) != dataset_fingerprint(changed)
+
+
+def test_std_needs_two_sampled_values():
+    # one sampled value scaled up to many rows still has no sample std
+    summary = NumericSummary(pd.Series([3.0, np.nan]), scale=1000.0)
+    assert summary.count == 1000
+    assert np.isnan(summary.std)
+    assert NumericSummary(pd.Series([1.0, 3.0]), scale=1000.0).std == np.sqrt(2)
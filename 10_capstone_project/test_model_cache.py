@@ -0,0 +1,48 @@
+import threading
+
+import model_cache
+from model_cache import ModelCache
+
+
+def test_put_does_not_block_other_sessions(tmp_path, monkeypatch):
+    dump, release = model_cache.joblib.dump, threading.Event()
+
+    def slow_dump(*args, **kwargs):
+        release.wait(10)
+        return dump(*args, **kwargs)
+
+    monkeypatch.setattr(model_cache.joblib, "dump", slow_dump)
+    cache = ModelCache(tmp_path)
+    cache.put("a", {"score": 1.0})
+    # the write is still pending: lookups neither wait nor miss
+    assert cache.get("a") == ({"score": 1.0}, "memory")
+    assert cache.get("b") == (None, None)
+    release.set()
+    cache.flush()
+    assert ModelCache(tmp_path).get("a") == ({"score": 1.0}, "disk")
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+
+def test_failed_write_keeps_memory_copy(tmp_path, monkeypatch):
+    def failing_dump(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(model_cache.joblib, "dump", failing_dump)
+    cache = ModelCache(tmp_path)
+    result, source = cache.get_or_fit("a", lambda: 42)
+    cache.flush()
+    assert (result, source) == (42, "fit")
+    assert cache.get("a") == (42, "memory")
+    assert ModelCache(tmp_path).get("a") == (None, None)
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = ModelCache(tmp_path, memory_entries=1)
+    cache.put("a", list(range(1000)))
+    cache.flush()
+    cache.max_bytes = (tmp_path / "a.joblib").stat().st_size   # room for one entry
+    cache.put("b", list(range(1000)))
+    cache.flush()
+    assert ModelCache(tmp_path).get("a") == (None, None)
+    assert ModelCache(tmp_path).get("b")[1] == "disk"
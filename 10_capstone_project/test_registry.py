@@ -0,0 +1,102 @@
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import registry
+from registry import DatasetRegistry
+
+CSV = b"a,b\n1,x\n2,y\n"
+
+
+class Origin(BaseHTTPRequestHandler):
+    """Serves `body` at any path with an ETag, answering 304 when it matches."""
+    body = CSV
+    requests = []
+
+    def do_GET(self):
+        etag = '"' + hashlib.sha256(self.body).hexdigest()[:16] + '"'
+        self.requests.append((self.path, dict(self.headers)))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def origin():
+    Origin.body, Origin.requests = CSV, []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Origin)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def reg(origin, tmp_path):
+    url = f"http://127.0.0.1:{origin.server_port}/sales.csv"
+    # refresh_seconds=0: every fetch revalidates against the server
+    return DatasetRegistry({"sales": url}, data_dir=tmp_path / "data", mirror=None, refresh_seconds=0)
+
+
+def test_first_fetch_downloads(reg):
+    path = reg.fetch("sales")
+    assert path.read_bytes() == CSV
+    assert len(Origin.requests) == 1
+    assert "If-None-Match" not in Origin.requests[0][1]
+    assert reg._load_meta(path)["etag"]
+
+
+def test_unchanged_file_revalidates_with_304(reg):
+    path = reg.fetch("sales")
+    mtime = path.stat().st_mtime_ns
+    assert reg.fetch("sales") == path
+    assert Origin.requests[-1][1]["If-None-Match"] == reg._load_meta(path)["etag"]
+    assert path.stat().st_mtime_ns == mtime   # 304: local copy left alone
+    assert path.read_bytes() == CSV
+
+
+def test_changed_file_is_downloaded_again(reg):
+    path = reg.fetch("sales")
+    old_etag = reg._load_meta(path)["etag"]
+    Origin.body = CSV + b"3,z\n"
+    reg.fetch("sales")
+    assert path.read_bytes() == Origin.body
+    assert reg._load_meta(path)["etag"] != old_etag
+    assert not path.with_name(path.name + ".part").exists()
+
+
+def test_offline_falls_back_to_local_copy(reg, origin, caplog):
+    path = reg.fetch("sales")
+    origin.shutdown()
+    origin.server_close()
+    with caplog.at_level("WARNING", logger=registry.__name__):
+        assert reg.fetch("sales") == path
+    assert path.read_bytes() == CSV
+    assert "stale local copy" in caplog.text
+
+
+def test_offline_without_local_copy_raises(reg, origin):
+    origin.shutdown()
+    origin.server_close()
+    with pytest.raises(ConnectionError):
+        reg.fetch("sales")
+
+
+def test_fresh_copy_is_not_revalidated(reg):
+    reg.refresh_seconds = 3600
+    reg.fetch("sales")
+    reg.fetch("sales")
+    assert len(Origin.requests) == 1
@@ -0,0 +1,41 @@
+"""
+Byte-range reads for splitting one file across worker processes, shared by
+the streaming tools (text analyzer shards, sales dashboard ranges).
+
+Each worker opens its own range and reads it like a whole file:
+
+    with open_byte_range("big.csv", start, end) as f:   # binary, buffered
+        ...
+"""
+import io
+
+
+class ByteRange(io.RawIOBase):
+    """
+    Read-only view of bytes [start, end) of a file.
+    """
+
+    def __init__(self, path, start, end):
+        self._f = open(path, "rb")
+        self._f.seek(start)
+        self._left = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = min(len(buffer), self._left)
+        if n <= 0:
+            return 0
+        got = self._f.readinto(memoryview(buffer)[:n])
+        self._left -= got
+        return got
+
+    def close(self):
+        self._f.close()
+        super().close()
+
+
+def open_byte_range(path, start, end):
+    """Buffered binary reader over bytes [start, end) of `path`."""
+    return io.BufferedReader(ByteRange(path, start, end))
@@ -0,0 +1,193 @@
+"""
+Content-addressed columnar cache for CSV loads, shared by the project tools.
+
+The first load of a CSV parses it and stores a typed Arrow/Feather copy keyed on
+(path, mtime, size, read options) - or on the content hash for raw bytes.
+Later loads memory-map that copy instead of parsing the CSV again.
+The cache is bounded by total bytes and evicts least recently used entries.
+
+Needs pyarrow; without it read_csv() simply falls back to pd.read_csv().
+
+    python columnar_cache.py --list
+    python columnar_cache.py --invalidate data/superstore_sales.csv
+    python columnar_cache.py --clear
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+CACHE_DIR = Path(os.environ.get("DS_CACHE_DIR", Path.home() / ".cache" / "ds_columnar"))
+MAX_BYTES = int(float(os.environ.get("DS_CACHE_MAX_MB", "2048")) * 1024 ** 2)
+
+
+def cache_key(source, read_options):
+    h = hashlib.sha256()
+    if isinstance(source, (bytes, bytearray)):
+        h.update(b"bytes:" + hashlib.sha256(source).digest())
+    else:
+        stat = os.stat(source)
+        h.update(f"path:{os.path.abspath(source)}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    h.update(json.dumps(read_options, sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+
+class ColumnarCache:
+    """
+    One `<key>.feather` file per entry plus a small `<key>.json` sidecar with
+    its source. There is no shared index to update, so concurrent sessions and
+    CLI runs never overwrite each other's bookkeeping: every file is written
+    under a unique temporary name and moved into place atomically, and the
+    LRU order is the data files' modification times (touched on each hit).
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def _data_path(self, key):
+        return self.cache_dir / f"{key}.feather"
+
+    def _meta_path(self, key):
+        return self.cache_dir / f"{key}.json"
+
+    def _write_atomic(self, path, write):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=path.name + ".", suffix=".tmp")
+        os.close(fd)
+        try:
+            write(tmp)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+    def get(self, key):
+        path = self._data_path(key)
+        try:
+            df = feather.read_table(path, memory_map=True).to_pandas()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)   # LRU touch; best effort
+        except OSError:
+            pass
+        return df
+
+    def put(self, key, df, source):
+        def write_meta(tmp):
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"source": source}, f)
+
+        # uncompressed so the file can be memory-mapped without decoding
+        self._write_atomic(self._data_path(key),
+                           lambda tmp: feather.write_feather(df, tmp, compression="uncompressed"))
+        self._write_atomic(self._meta_path(key), write_meta)
+        self.evict()
+
+    def _remove(self, key):
+        for path in (self._data_path(key), self._meta_path(key)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass   # already removed by another process
+
+    def entries(self):
+        """
+        key -> {"source", "bytes", "last_used"}, read from the files themselves.
+        """
+        entries = {}
+        for path in self.cache_dir.glob("*.feather"):
+            key = path.stem
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            try:
+                with open(self._meta_path(key), encoding="utf-8") as f:
+                    source = json.load(f)["source"]
+            except (OSError, ValueError, KeyError):
+                source = None
+            entries[key] = {"source": source, "bytes": stat.st_size, "last_used": stat.st_mtime}
+        return entries
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(e["bytes"] for e in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= entries[key]["bytes"]
+            self._remove(key)
+
+    def invalidate(self, source=None):
+        """
+        Drops every entry for `source` (a file path), or the whole cache if None.
+        Returns the number of entries removed.
+        """
+        target = os.path.abspath(source) if source else None
+        removed = [k for k, e in self.entries().items() if target is None or e["source"] == target]
+        for key in removed:
+            self._remove(key)
+        return len(removed)
+
+
+default_cache = ColumnarCache()
+
+
+def read_csv(source, cache=None, **read_options):
+    """
+    pd.read_csv() for a file path or raw CSV bytes, served from the columnar cache.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        label, reader = "<bytes>", lambda: pd.read_csv(io.BytesIO(source), **read_options)
+    else:
+        label, reader = os.path.abspath(source), lambda: pd.read_csv(source, **read_options)
+    if feather is None:
+        return reader()
+
+    cache = cache or default_cache
+    key = cache_key(source, read_options)
+    df = cache.get(key)
+    if df is not None:
+        return df
+    df = reader()
+    try:
+        cache.put(key, df, label)
+    except Exception:
+        # some frames (e.g. mixed-type object columns) have no Arrow form; just skip caching
+        pass
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Columnar CSV cache maintenance")
+    parser.add_argument("--list", action="store_true", help="List cached entries")
+    parser.add_argument("--invalidate", metavar="file", help="Drop cached copies of this CSV")
+    parser.add_argument("--clear", action="store_true", help="Drop every cached entry")
+    args = parser.parse_args()
+
+    if args.invalidate:
+        print(f"🗑️ Removed {default_cache.invalidate(args.invalidate)} entries for {args.invalidate}")
+    elif args.clear:
+        print(f"🗑️ Removed {default_cache.invalidate()} entries")
+    else:
+        entries = default_cache.entries()
+        total = sum(e["bytes"] for e in entries.values())
+        for key, e in entries.items():
+            print(f"{key[:12]}  {e['bytes'] / 1024 ** 2:8.2f} MB  {e['source']}")
+        print(f"{len(entries)} entries, {total / 1024 ** 2:.2f} MB in {default_cache.cache_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Dtype compaction for loaded DataFrames, shared by the project tools.
+
+pandas reads every integer column as int64, every float column as float64 and
+every string column as Python objects (or, from pandas 3, its "str" dtype).
+compact() returns a smaller copy:
+
+- integers -> the smallest integer type that holds the column's range;
+- floats -> float32 where every value survives the round trip exactly
+  (lossy=True downcasts every float column);
+- string columns with few distinct values (at most CATEGORY_RATIO of the
+  non-missing rows) -> category; with arrow_strings=True the remaining string
+  columns become Arrow-backed strings (needs pyarrow).
+
+Unless lossy=True every change keeps the values exactly, and restore() casts
+the columns back to the dtypes pandas produced. Note that arithmetic between
+two downcast integer columns is done in their small type.
+
+    python compact.py data.csv
+    python compact.py data.csv --lossy --arrow-strings
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (needed for Arrow-backed strings)
+except ImportError:
+    pyarrow = None
+
+CATEGORY_RATIO = 0.5
+
+
+def _is_text(series):
+    # object columns holding only strings, or pandas' string dtypes
+    if series.dtype == object:
+        return pd.api.types.infer_dtype(series, skipna=True) == "string"
+    return isinstance(series.dtype, pd.StringDtype)
+
+
+def _compact_column(series, lossy, arrow_strings):
+    dtype = series.dtype
+    if _is_text(series):
+        if series.nunique(dropna=True) <= CATEGORY_RATIO * series.count():
+            return series.astype("category")
+        if arrow_strings and pyarrow is not None and getattr(dtype, "storage", None) != "pyarrow":
+            return series.astype("string[pyarrow]")
+        return series
+    if not isinstance(dtype, np.dtype):
+        return series   # already an extension dtype (category, nullable, Arrow, ...)
+    if dtype.kind in "iu":
+        return pd.to_numeric(series, downcast="unsigned" if dtype.kind == "u" else "integer")
+    if dtype.kind == "f":
+        if dtype.itemsize <= 4:
+            return series
+        with np.errstate(over="ignore"):   # out-of-range values become inf and fail the check
+            narrow = series.astype(np.float32)
+        if lossy or np.array_equal(narrow.to_numpy(np.float64), series.to_numpy(), equal_nan=True):
+            return narrow
+    return series
+
+
+def compact(df, lossy=False, arrow_strings=False):
+    """
+    Returns (compacted copy, report). The report has one row per column:
+    dtype and deep memory in bytes before and after, and the fraction saved.
+    """
+    before = df.memory_usage(index=False, deep=True)
+    columns = {col: _compact_column(df[col], lossy, arrow_strings) for col in df.columns}
+    compacted = pd.DataFrame(columns, index=df.index)
+    after = compacted.memory_usage(index=False, deep=True)
+    report = pd.DataFrame({
+        "before": df.dtypes,
+        "after": compacted.dtypes,
+        "before_bytes": before,
+        "after_bytes": after,
+    })
+    report["saved"] = 1 - report["after_bytes"] / report["before_bytes"].where(report["before_bytes"] > 0)
+    return compacted, report
+
+
+def restore(df, report):
+    """
+    Casts compacted columns back to their original dtypes (missing values
+    come back as NaN, as pandas reads them).
+    """
+    restored = df.copy()
+    for col, row in report.iterrows():
+        if col not in restored.columns or row["before"] == row["after"]:
+            continue
+        series = restored[col]
+        if row["before"] == object:
+            restored[col] = series.astype(object).where(series.notna(), np.nan)
+        else:
+            restored[col] = series.astype(row["before"])
+    return restored
+
+
+def summary_line(report):
+    before = report["before_bytes"].sum() / 1024 ** 2
+    after = report["after_bytes"].sum() / 1024 ** 2
+    saved = 1 - after / before if before else 0.0
+    changed = int((report["before"] != report["after"]).sum())
+    return f"🗜️ Compacted {changed} of {len(report)} columns: {before:.2f} MB -> {after:.2f} MB ({saved:.0%} less)"
+
+
+def format_report(report):
+    table = pd.DataFrame({
+        "before": report["before"].astype(str),
+        "after": report["after"].astype(str),
+        "before KB": (report["before_bytes"] / 1024).round(1),
+        "after KB": (report["after_bytes"] / 1024).round(1),
+        "saved": report["saved"].map(lambda s: "-" if pd.isna(s) else f"{s:.0%}"),
+    })
+    return table.to_string() + "\n" + summary_line(report)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-column memory before and after dtype compaction")
+    parser.add_argument("file", help="CSV file to load")
+    parser.add_argument("--lossy", action="store_true", help="Downcast every float column to float32")
+    parser.add_argument("--arrow-strings", action="store_true",
+                        help="Store high-cardinality strings as Arrow strings")
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.file)
+    compacted, report = compact(df, lossy=args.lossy, arrow_strings=args.arrow_strings)
+    print(format_report(report))
+    if not args.lossy:
+        print("Round trip exact:", restore(compacted, report).equals(df))
+
+
+if __name__ == "__main__":
+    main()